@@ -7,10 +7,16 @@ from .abstract_database_client import AbstractDatabaseClient
 from .database_client_factory import DatabaseClientFactory
 from .openalex_client import OpenAlexClient
 from .crossref_client import CrossRefClient
+from .http_transport import AsyncHttpTransport, TransportError, run_sync
+from .search_cache import SearchResultCache
 
 __all__ = [
     'AbstractDatabaseClient',
     'DatabaseClientFactory', 
     'OpenAlexClient',
-    'CrossRefClient'
+    'CrossRefClient',
+    'AsyncHttpTransport',
+    'TransportError',
+    'run_sync',
+    'SearchResultCache'
 ]
\ No newline at end of file
@@ -3,6 +3,7 @@ Abstract Database Client
 Defines interface for database implementations following Open/Closed Principle
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 
@@ -63,6 +64,18 @@ class AbstractDatabaseClient(ABC):
         """
         pass
     
+    async def search_papers_async(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        Async variant of search_papers
+        Defaults to running the synchronous implementation in a worker thread;
+        clients with a native async transport override it
+        """
+        return await asyncio.to_thread(self.search_papers, query, **kwargs)
+    
+    async def get_paper_details_async(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_paper_details"""
+        return await asyncio.to_thread(self.get_paper_details, paper_id)
+    
     def normalize_paper_data(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize paper data to standardized format
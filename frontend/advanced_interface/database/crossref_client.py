@@ -4,8 +4,8 @@ Concrete implementation for CrossRef metadata database
 """
 
 from typing import Dict, Any, List, Optional
-import requests
 from .abstract_database_client import AbstractDatabaseClient
+from .http_transport import AsyncHttpTransport, TransportError
 
 
 class CrossRefClient(AbstractDatabaseClient):
@@ -14,12 +14,11 @@ class CrossRefClient(AbstractDatabaseClient):
     Provides access to CrossRef metadata for scholarly publications
     """
     
-    def __init__(self):
+    def __init__(self, transport: Optional[AsyncHttpTransport] = None):
         self.base_url = "https://api.crossref.org"
         self._authenticated = True  # CrossRef is public API
-        self.session = requests.Session()
         # Set user agent for CrossRef API compliance
-        self.session.headers.update({
+        self.transport = transport or AsyncHttpTransport(headers={
             'User-Agent': 'StormLoop/1.0 (mailto:support@stormloop.ai)'
         })
     
@@ -34,26 +33,22 @@ class CrossRefClient(AbstractDatabaseClient):
         Returns:
             List of normalized paper dictionaries
         """
+        return self.transport.run(self.search_papers_async(query, **kwargs))
+    
+    async def search_papers_async(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of search_papers"""
         if not self.is_authenticated():
             raise RuntimeError("Client not authenticated")
         
+        params = self._build_search_params(query, **kwargs)
         try:
-            params = self._build_search_params(query, **kwargs)
-            response = self.session.get(f"{self.base_url}/works", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            papers = []
-            
-            for work in data.get('message', {}).get('items', []):
-                normalized_paper = self.normalize_paper_data(work)
-                papers.append(normalized_paper)
-            
-            return papers
-            
-        except requests.RequestException as e:
+            data = await self.transport.get_json(f"{self.base_url}/works", params)
+        except TransportError:
             # Return empty list on API failure
             return []
+        
+        items = (data or {}).get('message', {}).get('items', [])
+        return [self.normalize_paper_data(work) for work in items]
     
     def get_paper_details(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -65,21 +60,22 @@ class CrossRefClient(AbstractDatabaseClient):
         Returns:
             Detailed paper information or None if not found
         """
+        return self.transport.run(self.get_paper_details_async(paper_id))
+    
+    async def get_paper_details_async(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_paper_details"""
         if not self.is_authenticated():
             return None
         
+        # Clean DOI if it includes URL prefix
+        clean_doi = paper_id.replace('https://doi.org/', '')
         try:
-            # Clean DOI if it includes URL prefix
-            clean_doi = paper_id.replace('https://doi.org/', '')
-            response = self.session.get(f"{self.base_url}/works/{clean_doi}")
-            response.raise_for_status()
-            
-            data = response.json()
-            work = data.get('message', {})
-            return self.normalize_paper_data(work)
-            
-        except requests.RequestException:
+            data = await self.transport.get_json(f"{self.base_url}/works/{clean_doi}")
+        except TransportError:
             return None
+        
+        work = (data or {}).get('message')
+        return self.normalize_paper_data(work) if work else None
     
     def authenticate(self, credentials: Dict[str, str]) -> bool:
         """
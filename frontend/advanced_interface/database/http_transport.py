@@ -0,0 +1,114 @@
+"""
+HTTP Transport
+Pooled async HTTP transport shared by the database clients, with timeouts and retries
+"""
+
+import asyncio
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+from knowledge_storm.services.utils import run_on_background_loop, run_sync
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+T = TypeVar("T")
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+DEFAULT_POOL_SIZE = 20
+NOT_FOUND_STATUS = 404
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class TransportError(Exception):
+    """Raised when a request fails after all retries"""
+
+
+class AsyncHttpTransport:
+    """
+    Async JSON-over-HTTP transport
+    Keeps one pooled aiohttp session on the shared knowledge_storm background
+    loop and runs every request there, so callers on any event loop (including
+    short-lived asyncio.run loops) share it and leave no sessions behind.
+    Applies a total timeout to every request and retries connection errors,
+    timeouts, 429 and 5xx responses with exponential backoff
+    """
+
+    def __init__(self,
+                 headers: Optional[Dict[str, str]] = None,
+                 timeout: float = DEFAULT_TIMEOUT,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF,
+                 pool_size: int = DEFAULT_POOL_SIZE):
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self._session = None
+
+    def _get_session(self):
+        """Get or create the session; only called on the background loop"""
+        if aiohttp is None:
+            raise TransportError("aiohttp is required for database client requests")
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+            )
+        return self._session
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """
+        GET a JSON document
+
+        Returns:
+            Decoded JSON, or None if the resource does not exist (404)
+
+        Raises:
+            TransportError: If the request still fails after all retries
+        """
+        return await run_on_background_loop(self._get_json(url, params))
+
+    async def _get_json(self, url: str, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        session = self._get_session()
+        last_error: Optional[BaseException] = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status == NOT_FOUND_STATUS:
+                        return None
+                    if response.status in RETRY_STATUSES:
+                        last_error = TransportError(f"HTTP {response.status} from {url}")
+                        continue
+                    response.raise_for_status()
+                    return await response.json()
+            except asyncio.TimeoutError as e:
+                last_error = e
+            except Exception as e:
+                if aiohttp is not None and isinstance(e, aiohttp.ClientResponseError):
+                    raise TransportError(f"HTTP {e.status} from {url}") from e
+                if aiohttp is not None and isinstance(e, aiohttp.ClientError):
+                    last_error = e
+                    continue
+                raise
+        raise TransportError(f"Request to {url} failed after {self.max_retries + 1} attempts") from last_error
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """Run a coroutine from synchronous code on the shared background loop"""
+        return run_sync(coro)
+
+    async def close(self) -> None:
+        """Close the pooled session"""
+        await run_on_background_loop(self._close_session())
+
+    async def _close_session(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
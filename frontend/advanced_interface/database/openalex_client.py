@@ -4,8 +4,8 @@ Concrete implementation for OpenAlex academic database
 """
 
 from typing import Dict, Any, List, Optional
-import requests
 from .abstract_database_client import AbstractDatabaseClient
+from .http_transport import AsyncHttpTransport, TransportError
 
 
 class OpenAlexClient(AbstractDatabaseClient):
@@ -14,12 +14,11 @@ class OpenAlexClient(AbstractDatabaseClient):
     Provides access to the OpenAlex scholarly database
     """
     
-    def __init__(self):
+    def __init__(self, transport: Optional[AsyncHttpTransport] = None):
         self.base_url = "https://api.openalex.org"
         self._authenticated = True  # OpenAlex is public API
-        self.session = requests.Session()
         # Set user agent for API compliance
-        self.session.headers.update({
+        self.transport = transport or AsyncHttpTransport(headers={
             'User-Agent': 'StormLoop/1.0 (mailto:support@stormloop.ai)'
         })
     
@@ -34,27 +33,21 @@ class OpenAlexClient(AbstractDatabaseClient):
         Returns:
             List of normalized paper dictionaries
         """
+        return self.transport.run(self.search_papers_async(query, **kwargs))
+    
+    async def search_papers_async(self, query: str, **kwargs) -> List[Dict[str, Any]]:
+        """Async variant of search_papers"""
         if not self.is_authenticated():
             raise RuntimeError("Client not authenticated")
         
+        params = self._build_search_params(query, **kwargs)
         try:
-            params = self._build_search_params(query, **kwargs)
-            response = self.session.get(f"{self.base_url}/works", params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            papers = []
-            
-            for work in data.get('results', []):
-                normalized_paper = self.normalize_paper_data(work)
-                papers.append(normalized_paper)
-            
-            return papers
-            
-        except requests.RequestException as e:
-            # For now, return empty list on API failure
-            # In production, you might want to log this error
+            data = await self.transport.get_json(f"{self.base_url}/works", params)
+        except TransportError:
+            # Return empty list on API failure
             return []
+        
+        return [self.normalize_paper_data(work) for work in (data or {}).get('results', [])]
     
     def get_paper_details(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -66,18 +59,19 @@ class OpenAlexClient(AbstractDatabaseClient):
         Returns:
             Detailed paper information or None if not found
         """
+        return self.transport.run(self.get_paper_details_async(paper_id))
+    
+    async def get_paper_details_async(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Async variant of get_paper_details"""
         if not self.is_authenticated():
             return None
         
         try:
-            response = self.session.get(f"{self.base_url}/works/{paper_id}")
-            response.raise_for_status()
-            
-            work = response.json()
-            return self.normalize_paper_data(work)
-            
-        except requests.RequestException:
+            work = await self.transport.get_json(f"{self.base_url}/works/{paper_id}")
+        except TransportError:
             return None
+        
+        return self.normalize_paper_data(work) if work else None
     
     def authenticate(self, credentials: Dict[str, str]) -> bool:
         """
@@ -0,0 +1,135 @@
+"""
+Search Result Cache
+Bounded LRU + TTL cache for database search results with per-session quotas
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL = 900.0
+DEFAULT_SESSION_QUOTA = 64
+SHARED_SESSION = "_shared"
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class _CacheEntry:
+    papers: List[Dict[str, Any]]
+    expires_at: float
+    session_id: str
+    size: int
+
+
+def _estimate_size(papers: List[Dict[str, Any]]) -> int:
+    """Approximate memory footprint of a result list (its JSON size in bytes)"""
+    return len(json.dumps(papers, default=str))
+
+
+class SearchResultCache:
+    """
+    Cache of search results keyed by database, query and search parameters
+    Entries expire after ``ttl`` seconds and the least recently used entry is
+    evicted once ``max_entries`` is reached. Each session may own at most
+    ``session_quota`` entries, so one busy session cannot flush everyone
+    else's results; a session over its quota evicts its own oldest entry.
+    Cached results are shared between sessions.
+    """
+
+    def __init__(self,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_TTL,
+                 session_quota: int = DEFAULT_SESSION_QUOTA):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        if session_quota < 1:
+            raise ValueError(f"session_quota must be at least 1, got {session_quota}")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.session_quota = session_quota
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._session_counts: Dict[str, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(database: str, query: str, params: Dict[str, Any]) -> CacheKey:
+        """Build a cache key; pagination and filter parameters are part of it"""
+        return database, query.strip(), json.dumps(params, sort_keys=True, default=str)
+
+    def get(self, key: CacheKey) -> Optional[List[Dict[str, Any]]]:
+        """Get cached results, or None on a miss or expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return list(entry.papers)
+
+    def set(self, key: CacheKey, papers: List[Dict[str, Any]], session_id: Optional[str] = None) -> None:
+        """Cache results on behalf of a session, evicting as needed"""
+        session_id = session_id or SHARED_SESSION
+        entry = _CacheEntry(list(papers), time.monotonic() + self.ttl, session_id, _estimate_size(papers))
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if self._session_counts.get(session_id, 0) >= self.session_quota:
+                self._evict_oldest(session_id)
+            while len(self._entries) >= self.max_entries:
+                self._evict_oldest()
+            self._entries[key] = entry
+            self._session_counts[session_id] = self._session_counts.get(session_id, 0) + 1
+            self._bytes += entry.size
+
+    def clear(self) -> None:
+        """Drop all entries (metrics are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self._session_counts.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit rate and memory footprint metrics"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "sessions": len(self._session_counts),
+                "approx_bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "expirations": self._expirations
+            }
+
+    def _evict_oldest(self, session_id: Optional[str] = None) -> None:
+        for key, entry in self._entries.items():
+            if session_id is None or entry.session_id == session_id:
+                self._remove(key)
+                self._evictions += 1
+                return
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        remaining = self._session_counts[entry.session_id] - 1
+        if remaining:
+            self._session_counts[entry.session_id] = remaining
+        else:
+            del self._session_counts[entry.session_id]
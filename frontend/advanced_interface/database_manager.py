@@ -4,13 +4,19 @@ Implements academic database integration, search strategy building, and paper ma
 Following Single Responsibility Principle and Dependency Inversion Principle
 """
 
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
+import asyncio
+import logging
+import re
 import threading
 import uuid
+from knowledge_storm.services.utils import normalize_doi, same_study_metadata
 from .security import SecureAuthenticationManager
-from .database import DatabaseClientFactory, AbstractDatabaseClient
+from .database import DatabaseClientFactory, AbstractDatabaseClient, SearchResultCache, run_sync
+
+DEFAULT_SOURCE_TIMEOUT = 10.0
 
 
 class DatabaseType(Enum):
@@ -38,6 +44,72 @@ class Paper:
     year: Optional[int] = None
 
 
+@dataclass
+class FederatedSearchResult:
+    """Value object for a search across all databases"""
+    papers: List[Dict[str, Any]] = field(default_factory=list)
+    source_status: Dict[str, str] = field(default_factory=dict)  # "ok", "timeout" or "error"
+
+
+class ResultMerger:
+    """
+    Merges paper lists from several databases
+    Papers are considered duplicates when their DOIs match or, when at most
+    one of them has a DOI, when their normalized titles match and their years
+    or first authors agree; duplicates are merged into the first record seen,
+    filling its missing fields and extending its "sources"
+    """
+    
+    def __init__(self):
+        self.papers: List[Dict[str, Any]] = []
+        self._by_doi: Dict[str, Dict[str, Any]] = {}
+        self._by_title: Dict[str, List[Dict[str, Any]]] = {}
+    
+    @staticmethod
+    def _doi(paper: Dict[str, Any]) -> str:
+        return normalize_doi(paper.get("doi") or "")
+    
+    @staticmethod
+    def _title(paper: Dict[str, Any]) -> str:
+        return re.sub(r"\W+", " ", (paper.get("title") or "").lower()).strip()
+    
+    def _find(self, paper: Dict[str, Any], doi: str, title: str) -> Optional[Dict[str, Any]]:
+        if doi in self._by_doi:
+            return self._by_doi[doi]
+        for candidate in self._by_title.get(title, ()):
+            # Records with different DOIs are never merged on their title
+            candidate_doi = self._doi(candidate)
+            if doi and candidate_doi and candidate_doi != doi:
+                continue
+            if same_study_metadata(candidate.get("year"), candidate.get("authors"),
+                                   paper.get("year"), paper.get("authors")):
+                return candidate
+        return None
+    
+    def add(self, source: str, papers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Merge papers from a source and return the ones not seen before"""
+        new_papers = []
+        for paper in papers:
+            doi, title = self._doi(paper), self._title(paper)
+            existing = self._find(paper, doi, title)
+            if existing is None:
+                existing = dict(paper, sources=[source])
+                self.papers.append(existing)
+                new_papers.append(existing)
+                if title:
+                    self._by_title.setdefault(title, []).append(existing)
+            else:
+                for name, value in paper.items():
+                    if existing.get(name) in (None, "", []):
+                        existing[name] = value
+                if source not in existing["sources"]:
+                    existing["sources"].append(source)
+            existing_doi = self._doi(existing)
+            if existing_doi:
+                self._by_doi.setdefault(existing_doi, existing)
+        return new_papers
+
+
 class QueryBuilder:
     """
     Query builder for academic database searches
@@ -73,13 +145,14 @@ class DatabaseManager:
     Adheres to Single Responsibility Principle - only manages database operations
     """
     
-    def __init__(self):
+    def __init__(self, search_cache: Optional[SearchResultCache] = None):
         self.selected_database = None
         self._auth_manager = SecureAuthenticationManager()
         self._papers = {}
         self._collections = {}
         self._paper_annotations = {}
         self._database_clients = {}  # Cache for database client instances
+        self._search_cache = search_cache or SearchResultCache()
         self._lock = threading.RLock()
     
     def get_available_databases(self) -> List[str]:
@@ -157,13 +230,19 @@ class DatabaseManager:
         with self._lock:
             return self._paper_annotations.get(paper_id, "")
     
-    def search_papers(self, query: str, database: str = None, **kwargs) -> List[Dict[str, Any]]:
+    def search_papers(self,
+                      query: str,
+                      database: str = None,
+                      session_id: Optional[str] = None,
+                      **kwargs) -> List[Dict[str, Any]]:
         """
         Search papers in specified database using concrete client implementations
+        Repeated searches with the same parameters are served from the search cache
         
         Args:
             query: Search query string
             database: Database to search (uses selected_database if None)
+            session_id: Session the cached results are charged to
             **kwargs: Additional search parameters
             
         Returns:
@@ -180,18 +259,25 @@ class DatabaseManager:
         if target_database not in self.get_available_databases():
             raise ValueError(f"Invalid database: {target_database}")
         
-        with self._lock:
-            # Get or create database client
-            client = self._get_database_client(target_database)
-            
-            # Perform search using concrete client implementation
-            papers = client.search_papers(query, **kwargs)
-            
-            # Cache results for potential reuse
-            cache_key = f"{target_database}:{query}"
-            self._papers[cache_key] = papers
-            
+        cache_key = SearchResultCache.make_key(target_database, query, kwargs)
+        papers = self._search_cache.get(cache_key)
+        if papers is not None:
             return papers
+        
+        # The network call runs outside the lock so searches from different
+        # sessions proceed concurrently
+        client = self._get_database_client(target_database)
+        papers = client.search_papers(query, **kwargs)
+        
+        # Empty results are not cached: clients also return [] on API failure
+        if papers:
+            self._search_cache.set(cache_key, papers, session_id)
+        
+        return papers
+    
+    def get_search_cache_stats(self) -> Dict[str, Any]:
+        """Get search cache hit rate and memory metrics"""
+        return self._search_cache.get_stats()
     
     def _get_database_client(self, database: str) -> AbstractDatabaseClient:
         """
@@ -203,12 +289,109 @@ class DatabaseManager:
         Returns:
             Database client instance
         """
-        if database not in self._database_clients:
-            # Create new client using factory
-            client = DatabaseClientFactory.create_client(database)
-            self._database_clients[database] = client
+        with self._lock:
+            if database not in self._database_clients:
+                # Create new client using factory
+                client = DatabaseClientFactory.create_client(database)
+                self._database_clients[database] = client
+            
+            return self._database_clients[database]
+    
+    def search_all(self,
+                   query: str,
+                   timeout: float = DEFAULT_SOURCE_TIMEOUT,
+                   on_partial_results: Optional[Callable[[str, str, List[Dict[str, Any]]], None]] = None,
+                   session_id: Optional[str] = None,
+                   **kwargs) -> FederatedSearchResult:
+        """
+        Search every authenticated database concurrently
+        
+        Args:
+            query: Search query string
+            timeout: Per-database timeout in seconds; slower databases are
+                reported as "timeout" instead of delaying the response
+            on_partial_results: Called with (database, status, new_papers) as
+                each database finishes, from the client event loop thread
+            session_id: Session the cached results are charged to
+            **kwargs: Additional search parameters passed to every client
+            
+        Returns:
+            Merged, deduplicated papers and the status of each database
+        """
+        return run_sync(self.search_all_async(query, timeout, on_partial_results, session_id, **kwargs))
+    
+    async def search_all_async(self,
+                               query: str,
+                               timeout: float = DEFAULT_SOURCE_TIMEOUT,
+                               on_partial_results: Optional[Callable[[str, str, List[Dict[str, Any]]], None]] = None,
+                               session_id: Optional[str] = None,
+                               **kwargs) -> FederatedSearchResult:
+        """Async variant of search_all"""
+        result = FederatedSearchResult()
+        async for database, status, new_papers in self.iter_search_all(query, timeout, session_id, **kwargs):
+            result.source_status[database] = status
+            result.papers.extend(new_papers)
+            if on_partial_results is not None:
+                on_partial_results(database, status, new_papers)
+        return result
+    
+    async def iter_search_all(self,
+                              query: str,
+                              timeout: float = DEFAULT_SOURCE_TIMEOUT,
+                              session_id: Optional[str] = None,
+                              **kwargs) -> AsyncIterator[Tuple[str, str, List[Dict[str, Any]]]]:
+        """
+        Fan out a search to every authenticated database
         
-        return self._database_clients[database]
+        Yields (database, status, new_papers) in completion order, where
+        new_papers excludes duplicates of papers yielded earlier
+        """
+        merger = ResultMerger()
+        tasks = [
+            asyncio.ensure_future(self._search_database(database, client, query, timeout, session_id, **kwargs))
+            for database, client in self._authenticated_clients().items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                database, status, papers = await next_done
+                yield database, status, merger.add(database, papers)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _authenticated_clients(self) -> Dict[str, AbstractDatabaseClient]:
+        """Get clients for every database the factory supports and that is authenticated"""
+        clients = {}
+        for database in self.get_available_databases():
+            if database not in DatabaseClientFactory.get_available_databases():
+                continue
+            client = self._get_database_client(database)
+            if client.is_authenticated():
+                clients[database] = client
+        return clients
+    
+    async def _search_database(self,
+                               database: str,
+                               client: AbstractDatabaseClient,
+                               query: str,
+                               timeout: float,
+                               session_id: Optional[str],
+                               **kwargs) -> Tuple[str, str, List[Dict[str, Any]]]:
+        cache_key = SearchResultCache.make_key(database, query, kwargs)
+        papers = self._search_cache.get(cache_key)
+        if papers is not None:
+            return database, "ok", papers
+        try:
+            papers = await asyncio.wait_for(client.search_papers_async(query, **kwargs), timeout)
+        except asyncio.TimeoutError:
+            logging.warning(f"Search in {database} timed out after {timeout}s")
+            return database, "timeout", []
+        except Exception as e:
+            logging.warning(f"Search in {database} failed: {e}")
+            return database, "error", []
+        if papers:
+            self._search_cache.set(cache_key, papers, session_id)
+        return database, "ok", papers
     
     def get_paper_details(self, paper_id: str, database: str = None) -> Optional[Dict[str, Any]]:
         """
@@ -225,6 +408,5 @@ class DatabaseManager:
         if not target_database:
             return None
         
-        with self._lock:
-            client = self._get_database_client(target_database)
-            return client.get_paper_details(paper_id)
\ No newline at end of file
+        client = self._get_database_client(target_database)
+        return client.get_paper_details(paper_id)
\ No newline at end of file
@@ -3,6 +3,8 @@ Test cases for Database Abstract Pattern Implementation
 Tests the factory pattern and concrete client implementations
 """
 
+import asyncio
+import threading
 import unittest
 from unittest.mock import Mock, patch
 import sys
@@ -18,7 +20,7 @@ from advanced_interface.database import (
     OpenAlexClient,
     CrossRefClient
 )
-from advanced_interface.database_manager import DatabaseManager
+from advanced_interface.database_manager import DatabaseManager, ResultMerger
 
 
 class TestDatabaseAbstractPattern(unittest.TestCase):
@@ -162,6 +164,104 @@ class TestDatabaseAbstractPattern(unittest.TestCase):
             # Verify result
             self.assertEqual(result["title"], "Detailed Paper")
     
+    def test_database_manager_searches_do_not_hold_lock(self):
+        """Test that concurrent searches are not serialized by the manager lock"""
+        both_started = threading.Barrier(2, timeout=5)
+        
+        def slow_search(query, **kwargs):
+            # Deadlocks (BrokenBarrierError) if the lock is held during the call
+            both_started.wait()
+            return [{"title": query}]
+        
+        mock_client = Mock(spec=AbstractDatabaseClient)
+        mock_client.search_papers.side_effect = slow_search
+        results = {}
+        
+        with patch.object(DatabaseClientFactory, 'create_client', return_value=mock_client):
+            threads = [
+                threading.Thread(target=lambda q=q: results.update({q: self.manager.search_papers(q, database='openalex')}))
+                for q in ("a", "b")
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        self.assertEqual(results, {"a": [{"title": "a"}], "b": [{"title": "b"}]})
+
+    def test_database_manager_serves_repeated_searches_from_cache(self):
+        """Test that repeated searches hit the result cache instead of the client"""
+        mock_client = Mock(spec=AbstractDatabaseClient)
+        mock_client.search_papers.return_value = [{"title": "Cached Paper"}]
+
+        with patch.object(DatabaseClientFactory, 'create_client', return_value=mock_client):
+            self.manager.search_papers("q", database='openalex', page=1)
+            self.manager.search_papers("q", database='openalex', page=1)
+            self.manager.search_papers("q", database='openalex', page=2)
+
+        self.assertEqual(mock_client.search_papers.call_count, 2)
+        self.assertEqual(self.manager._papers, {})
+        stats = self.manager.get_search_cache_stats()
+        self.assertEqual((stats["hits"], stats["entries"]), (1, 2))
+
+    def test_database_manager_search_all_merges_sources(self):
+        """Test that search_all deduplicates across databases and reports slow ones"""
+        async def openalex_search(query, **kwargs):
+            return [{"title": "Deep Learning", "doi": "10.1000/dl", "abstract": ""},
+                    {"title": "Only OpenAlex"}]
+
+        async def crossref_search(query, **kwargs):
+            return [{"title": "Deep learning.", "doi": "https://doi.org/10.1000/DL", "abstract": "text"}]
+
+        async def stalled_search(query, **kwargs):
+            await asyncio.sleep(5)
+            return [{"title": "Too late"}]
+
+        clients = {}
+        for database, search in (("openalex", openalex_search),
+                                 ("crossref", crossref_search),
+                                 ("institutional", stalled_search)):
+            client = Mock(spec=AbstractDatabaseClient)
+            client.is_authenticated.return_value = True
+            client.search_papers_async.side_effect = search
+            clients[database] = client
+        partial = []
+
+        with patch.object(DatabaseClientFactory, 'get_available_databases', return_value=list(clients)), \
+             patch.object(DatabaseClientFactory, 'create_client', side_effect=clients.get):
+            result = self.manager.search_all(
+                "deep learning", timeout=0.2,
+                on_partial_results=lambda db, status, papers: partial.append((db, status, len(papers))))
+
+        self.assertEqual(result.source_status,
+                         {"openalex": "ok", "crossref": "ok", "institutional": "timeout"})
+        self.assertEqual(len(result.papers), 2)
+        merged = next(p for p in result.papers if p.get("doi"))
+        self.assertEqual(merged["abstract"], "text")
+        self.assertEqual(sorted(merged["sources"]), ["crossref", "openalex"])
+        self.assertEqual(partial[-1], ("institutional", "timeout", 0))
+
+    def test_result_merger_keeps_distinct_dois_with_the_same_title(self):
+        """Test that a shared title only merges records whose DOIs and metadata agree"""
+        merger = ResultMerger()
+        merger.add("openalex", [
+            {"title": "Editorial", "doi": "10.1000/a", "year": 2020, "authors": ["Jane Smith"]},
+            {"title": "Exercise for low back pain", "year": 2019, "authors": ["Lee K"]},
+        ])
+        new = merger.add("crossref", [
+            {"title": "Editorial", "doi": "10.1000/b", "year": 2020, "authors": ["Jane Smith"], "abstract": "b"},
+            {"title": "Exercise for low back pain.", "doi": "10.1000/c", "year": 2019, "abstract": "text"},
+            {"title": "Exercise for low back pain", "year": 2024, "authors": ["Park S"]},
+        ])
+
+        self.assertEqual([p["title"] for p in new], ["Editorial", "Exercise for low back pain"])
+        self.assertEqual(len(merger.papers), 4)
+        first, second = merger.papers[:2]
+        self.assertNotIn("abstract", first)
+        self.assertEqual(first["sources"], ["openalex"])
+        self.assertEqual((second["doi"], second["abstract"]), ("10.1000/c", "text"))
+        self.assertEqual(second["sources"], ["openalex", "crossref"])
+
     def test_openalex_client_authentication(self):
         """Test OpenAlex client authentication (public API)"""
         client = OpenAlexClient()
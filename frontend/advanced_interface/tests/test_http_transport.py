@@ -0,0 +1,125 @@
+"""
+Test cases for the pooled async HTTP transport and the clients built on it
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.getcwd(), 'frontend'))
+
+from advanced_interface.database import OpenAlexClient, CrossRefClient
+from advanced_interface.database.http_transport import AsyncHttpTransport, TransportError
+
+
+class FakeResponse:
+    def __init__(self, status, payload=None):
+        self.status = status
+        self.payload = payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    async def json(self):
+        return self.payload
+
+
+class FakeSession:
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def get(self, url, params=None):
+        self.calls.append((url, params))
+        return self.responses.pop(0)
+
+
+def _transport(responses):
+    transport = AsyncHttpTransport(backoff=0)
+    session = FakeSession(responses)
+    transport._get_session = lambda: session
+    return transport, session
+
+
+class TestAsyncHttpTransport(unittest.TestCase):
+    """Test cases for AsyncHttpTransport"""
+
+    def test_retries_transient_statuses(self):
+        """Test that 429/5xx responses are retried"""
+        transport, session = _transport([FakeResponse(503), FakeResponse(429), FakeResponse(200, {"ok": 1})])
+        self.assertEqual(asyncio.run(transport.get_json("https://x")), {"ok": 1})
+        self.assertEqual(len(session.calls), 3)
+
+    def test_not_found_returns_none(self):
+        """Test that a 404 is not retried"""
+        transport, session = _transport([FakeResponse(404)])
+        self.assertIsNone(asyncio.run(transport.get_json("https://x")))
+        self.assertEqual(len(session.calls), 1)
+
+    def test_gives_up_after_max_retries(self):
+        """Test that persistent failures raise TransportError"""
+        transport, session = _transport([FakeResponse(500)] * 4)
+        with self.assertRaises(TransportError):
+            asyncio.run(transport.get_json("https://x"))
+        self.assertEqual(len(session.calls), transport.max_retries + 1)
+
+    def test_sync_facade_reuses_background_loop(self):
+        """Test that sync calls share one loop instead of creating one per call"""
+        transport = AsyncHttpTransport()
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        self.assertIs(transport.run(current_loop()), transport.run(current_loop()))
+
+    def test_short_lived_loops_share_one_session(self):
+        """Test that requests from separate asyncio.run loops use the session on the background loop"""
+        transport = AsyncHttpTransport()
+        session = FakeSession([FakeResponse(200, {"ok": 1}), FakeResponse(200, {"ok": 2})])
+        session_loops = []
+
+        def get_session():
+            session_loops.append(asyncio.get_running_loop())
+            return session
+
+        transport._get_session = get_session
+        self.assertEqual(asyncio.run(transport.get_json("https://x")), {"ok": 1})
+        self.assertEqual(asyncio.run(transport.get_json("https://x")), {"ok": 2})
+
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        background_loop = transport.run(current_loop())
+        self.assertEqual(session_loops, [background_loop, background_loop])
+
+
+class TestClientsUseTransport(unittest.TestCase):
+    """Test cases for clients on the async transport"""
+
+    def test_openalex_search_sync_and_async(self):
+        """Test OpenAlex search through the transport"""
+        payload = {"results": [{"title": "A", "doi": "https://doi.org/10.1/a"}]}
+        transport, session = _transport([FakeResponse(200, payload), FakeResponse(200, payload)])
+        client = OpenAlexClient(transport=transport)
+
+        papers = client.search_papers("q", limit=5)
+        self.assertEqual(papers[0]["doi"], "10.1/a")
+        self.assertEqual(session.calls[0][1]["per-page"], 5)
+        self.assertEqual(asyncio.run(client.search_papers_async("q")), papers)
+
+    def test_crossref_failures_return_empty_results(self):
+        """Test that transport failures keep the old empty-result behavior"""
+        transport, _ = _transport([FakeResponse(500)] * 4 + [FakeResponse(404)])
+        client = CrossRefClient(transport=transport)
+        self.assertEqual(client.search_papers("q"), [])
+        self.assertIsNone(client.get_paper_details("https://doi.org/10.1/x"))
+
+
+if __name__ == "__main__":
+    unittest.main()
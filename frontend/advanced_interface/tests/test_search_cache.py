@@ -0,0 +1,82 @@
+"""
+Test cases for the bounded search result cache
+"""
+
+import unittest
+from unittest.mock import patch
+import sys
+import os
+sys.path.insert(0, os.path.join(os.getcwd(), 'frontend'))
+
+from advanced_interface.database import SearchResultCache
+
+
+class TestSearchResultCache(unittest.TestCase):
+    """Test cases for LRU + TTL eviction, session quotas and metrics"""
+
+    def test_key_includes_pagination_params(self):
+        """Test that different pages are cached separately"""
+        cache = SearchResultCache()
+        cache.set(SearchResultCache.make_key("openalex", "q", {"page": 1}), [{"title": "p1"}])
+
+        self.assertEqual(cache.get(SearchResultCache.make_key("openalex", "q", {"page": 1})), [{"title": "p1"}])
+        self.assertIsNone(cache.get(SearchResultCache.make_key("openalex", "q", {"page": 2})))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache never grows past max_entries"""
+        cache = SearchResultCache(max_entries=2)
+        cache.set(("db", "a", "{}"), [{"title": "a"}])
+        cache.set(("db", "b", "{}"), [{"title": "b"}])
+        cache.get(("db", "a", "{}"))
+        cache.set(("db", "c", "{}"), [{"title": "c"}])
+
+        self.assertIsNotNone(cache.get(("db", "a", "{}")))
+        self.assertIsNone(cache.get(("db", "b", "{}")))
+        self.assertEqual(cache.get_stats()["entries"], 2)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_entries_expire(self):
+        """Test that entries older than the TTL are dropped"""
+        cache = SearchResultCache(ttl=60)
+        with patch("advanced_interface.database.search_cache.time.monotonic", return_value=100.0):
+            cache.set(("db", "q", "{}"), [{"title": "q"}])
+        with patch("advanced_interface.database.search_cache.time.monotonic", return_value=161.0):
+            self.assertIsNone(cache.get(("db", "q", "{}")))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["expirations"], 1)
+        self.assertEqual(stats["entries"], 0)
+        self.assertEqual(stats["approx_bytes"], 0)
+
+    def test_session_quota_evicts_own_entries_only(self):
+        """Test that a session over its quota does not evict other sessions"""
+        cache = SearchResultCache(session_quota=2)
+        cache.set(("db", "other", "{}"), [{"title": "x"}], session_id="s2")
+        for query in ("a", "b", "c"):
+            cache.set(("db", query, "{}"), [{"title": query}], session_id="s1")
+
+        self.assertIsNone(cache.get(("db", "a", "{}")))
+        self.assertIsNotNone(cache.get(("db", "c", "{}")))
+        self.assertIsNotNone(cache.get(("db", "other", "{}")))
+        self.assertEqual(cache.get_stats()["sessions"], 2)
+
+    def test_stats_report_hit_rate_and_size(self):
+        """Test hit rate and memory footprint metrics"""
+        cache = SearchResultCache()
+        cache.set(("db", "q", "{}"), [{"title": "q"}])
+        cache.get(("db", "q", "{}"))
+        cache.get(("db", "missing", "{}"))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["approx_bytes"], 0)
+
+    def test_rejects_non_positive_limits(self):
+        """Test that limits which could never hold an entry are rejected"""
+        for kwargs in ({"max_entries": 0}, {"max_entries": -1}, {"session_quota": 0}):
+            with self.assertRaises(ValueError):
+                SearchResultCache(**kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
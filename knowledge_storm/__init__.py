@@ -1,21 +1,47 @@
-"""Convenience package imports with optional dependencies."""
+"""Convenience package imports with optional dependencies.
 
-try:
-    from . import lm  # noqa: F401
-    from . import rm  # noqa: F401
-except ModuleNotFoundError:  # pragma: no cover - handled for optional deps
-    lm = None
-    rm = None
+``lm``, ``rm``, ``utils`` and the STORM Wiki runner classes are loaded lazily
+(PEP 562) so that ``import knowledge_storm`` does not pull in dspy,
+transformers, openai or the vector store stack for commands that never use
+them. Attributes whose optional dependencies are missing resolve to ``None``.
+"""
+
+import importlib
 
 from . import interface  # noqa: F401
 from .storm_config import STORMConfig  # noqa: F401
 from .hybrid_engine import EnhancedSTORMEngine  # noqa: F401
 from .workflows.academic import AcademicWorkflowRunner  # noqa: F401
 from .exceptions import ServiceUnavailableError  # noqa: F401
-try:
-    from .storm_wiki import utils  # noqa: F401
-except ModuleNotFoundError:  # pragma: no cover
-    utils = None
+
+# attribute name -> (module path relative to this package, attribute or None)
+_LAZY_ATTRS = {
+    "lm": (".lm", None),
+    "rm": (".rm", None),
+    "utils": (".storm_wiki.utils", None),
+    "STORMWikiRunner": (".storm_wiki.engine", "STORMWikiRunner"),
+    "STORMWikiRunnerArguments": (".storm_wiki.engine", "STORMWikiRunnerArguments"),
+    "STORMWikiLMConfigs": (".storm_wiki.engine", "STORMWikiLMConfigs"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_path, attr = _LAZY_ATTRS[name]
+    try:
+        module = importlib.import_module(module_path, __name__)
+        value = module if attr is None else getattr(module, attr)
+    except ModuleNotFoundError:  # pragma: no cover - handled for optional deps
+        value = None
+    # Cache so later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
 
 __all__ = [
     "lm",
@@ -26,4 +52,7 @@ __all__ = [
     "EnhancedSTORMEngine",
     "AcademicWorkflowRunner",
     "ServiceUnavailableError",
+    "STORMWikiRunner",
+    "STORMWikiRunnerArguments",
+    "STORMWikiLMConfigs",
 ]
@@ -6,6 +6,9 @@ from abc import ABC, abstractmethod
 from collections import OrderedDict
 from typing import Dict, List, Optional, Union
 
+from .lm_history import JsonlHistoryWriter, LMCallHistory
+from .telemetry import TelemetryRecorder, recording
+
 logging.basicConfig(
     level=logging.INFO, format="%(name)s : %(levelname)-8s : %(message)s"
 )
@@ -342,11 +345,41 @@ class LMConfigs(ABC):
         history = []
         for attr_name in self.__dict__:
             if "_lm" in attr_name and hasattr(getattr(self, attr_name), "history"):
-                history.extend(getattr(self, attr_name).history)
-                getattr(self, attr_name).history = []
+                lm_history = getattr(self, attr_name).history
+                if isinstance(lm_history, LMCallHistory):
+                    history.extend(lm_history.drain())
+                else:
+                    history.extend(lm_history)
+                    getattr(self, attr_name).history = []
 
         return history
 
+    def stream_lm_history_to(self, path: str, exclude_keys=("kwargs",)):
+        """Write every LM call to a JSONL file as it happens.
+
+        Only models whose ``history`` is an ``LMCallHistory`` are attached. The
+        in-memory buffers stay bounded; the file holds the complete record.
+        """
+        self.stop_streaming_lm_history()
+        writer = JsonlHistoryWriter(path, exclude_keys=exclude_keys)
+        for attr_name in self.__dict__:
+            lm_history = getattr(getattr(self, attr_name), "history", None)
+            if "_lm" in attr_name and isinstance(lm_history, LMCallHistory):
+                lm_history.writer = writer
+        self.history_writer = writer
+        return writer
+
+    def stop_streaming_lm_history(self):
+        writer = self.__dict__.pop("history_writer", None)
+        if writer is None:
+            return None
+        for attr_name in self.__dict__:
+            lm_history = getattr(getattr(self, attr_name), "history", None)
+            if isinstance(lm_history, LMCallHistory) and lm_history.writer is writer:
+                lm_history.writer = None
+        writer.close()
+        return writer
+
     def collect_and_reset_lm_usage(self):
         combined_usage = []
         for attr_name in self.__dict__:
@@ -387,6 +420,8 @@ class Engine(ABC):
         self.time = {}
         self.lm_cost = {}  # Cost of language models measured by in/out tokens.
         self.rm_cost = {}  # Cost of retrievers measured by number of queries.
+        self.call_stats = {}  # Per-call latency percentiles of LM/RM calls.
+        self.telemetry = TelemetryRecorder()  # Per engine, so engines never mix spans
 
     def log_execution_time_and_lm_rm_usage(self, func):
         """Decorator to log the execution time, language model usage, and retrieval model usage of a function."""
@@ -394,10 +429,11 @@ class Engine(ABC):
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             start_time = time.time()
-            if inspect.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
+            with recording(self.telemetry, func.__name__):
+                if inspect.iscoroutinefunction(func):
+                    result = await func(*args, **kwargs)
+                else:
+                    result = func(*args, **kwargs)
             end_time = time.time()
             execution_time = end_time - start_time
             self.time[func.__name__] = execution_time
@@ -407,6 +443,7 @@ class Engine(ABC):
                 self.rm_cost[func.__name__] = (
                     self.retriever.collect_and_reset_rm_usage()
                 )
+            self.call_stats[func.__name__] = self.telemetry.summarize(func.__name__)
             return result
 
         return wrapper
@@ -458,7 +495,22 @@ class Engine(ABC):
         for k, v in self.rm_cost.items():
             print(f"{k}: {v}")
 
+        print("***** Per-call latency (p50 / p95 / p99): *****")
+        for k, v in self.call_stats.items():
+            print(f"{k}")
+            for call_name, stats in v.items():
+                print(
+                    f"    {call_name}: {stats['count']} calls, "
+                    f"{stats['p50']:.3f}s / {stats['p95']:.3f}s / {stats['p99']:.3f}s"
+                )
+
+    def export_call_telemetry(self, path: str, fmt: str = "json"):
+        """Write per-call spans to ``path`` as ``"json"`` or ``"otlp"`` (OTLP/JSON)."""
+        self.telemetry.dump(path, fmt=fmt)
+
     def reset(self):
         self.time = {}
         self.lm_cost = {}
         self.rm_cost = {}
+        self.call_stats = {}
+        self.telemetry.reset()
@@ -16,8 +16,12 @@ import requests
 
 # Legacy import removed - TGIClient now uses modern dspy.HFClientTGI
 # from dspy.dsp.modules.hf_client import send_hftgi_request_v01_wrapped
-from openai import OpenAI
-from transformers import AutoTokenizer
+# transformers is imported by TogetherClient only when a chat template is used.
+
+from .lm_history import LMCallHistory
+from .lm_pool import Endpoint, EndpointPool, http_health_check
+from .telemetry import trace_lm_call
+from .token_budget import register_tokenizer
 
 try:
     from anthropic import RateLimitError
@@ -43,6 +47,13 @@ class TokenTrackingLM(dspy.LM):
         self._token_usage_lock = threading.Lock()
         self.prompt_tokens = 0
         self.completion_tokens = 0
+        self.history = LMCallHistory()
+
+    def __init_subclass__(cls, **kwargs):
+        """Record a telemetry span for every ``basic_request`` of a subclass."""
+        super().__init_subclass__(**kwargs)
+        if "basic_request" in cls.__dict__:
+            cls.basic_request = trace_lm_call(cls.__dict__["basic_request"])
     
     def __call__(self, prompt: str, **kwargs):
         """Abstract method - must be implemented by subclasses."""
@@ -248,17 +259,87 @@ class OllamaClient(dspy.LM):
         self.kwargs = {**self.kwargs, **kwargs}
 
 
+class LoadBalancedClient(dspy.LM):
+    """Spread requests across several self-hosted model clients.
+
+    Each client talks to one endpoint (e.g. one ``OllamaClient`` per server or
+    one ``dspy.HFClientTGI`` per TGI port). Requests go to the least loaded
+    healthy endpoint and fail over to the others; see ``lm_pool.EndpointPool``.
+    """
+
+    def __init__(
+        self,
+        model: str,
+        clients: list,
+        urls: Optional[list] = None,
+        strategy: Literal["least_outstanding", "ewma"] = "least_outstanding",
+        health_check_path: Optional[str] = None,
+        health_check_interval: Optional[float] = None,
+        **pool_kwargs,
+    ):
+        super().__init__(model=model)
+        urls = urls or [getattr(c, "url", f"endpoint-{i}") for i, c in enumerate(clients)]
+        self.pool = EndpointPool(
+            [Endpoint(url, client) for url, client in zip(urls, clients)],
+            strategy=strategy,
+            health_check=http_health_check(health_check_path) if health_check_path else None,
+            **pool_kwargs,
+        )
+        if health_check_interval:
+            self.pool.start_health_checks(health_check_interval)
+
+    @classmethod
+    def for_ollama(cls, model: str, endpoints: list, **kwargs):
+        """Build a balanced client from ``(url, port)`` pairs of Ollama servers."""
+        clients = [OllamaClient(model=model, port=port, url=url) for url, port in endpoints]
+        urls = [c.kwargs.get("base_url") for c in clients]
+        kwargs.setdefault("health_check_path", "/api/tags")
+        return cls(model=model, clients=clients, urls=urls, **kwargs)
+
+    @trace_lm_call
+    def basic_request(self, prompt: str, **kwargs):
+        return self.pool.call(lambda client: client.basic_request(prompt, **kwargs))
+
+    def __call__(self, prompt: str, **kwargs):
+        return self.pool.call(lambda client: client(prompt, **kwargs))
+
+    def endpoint_stats(self) -> list:
+        return self.pool.stats()
+
+
 class TGIClient(dspy.LM):
-    """Modern TGI client using dspy.HFClientTGI instead of legacy mock functions"""
+    """Modern TGI client using dspy.HFClientTGI instead of legacy mock functions.
+
+    When ``port`` is a list, one ``dspy.HFClientTGI`` is created per port and
+    requests are load balanced across them with health-based failover.
+    """
     
-    def __init__(self, model, port, url, http_request_kwargs=None, **kwargs):
+    def __init__(
+        self,
+        model,
+        port,
+        url,
+        http_request_kwargs=None,
+        strategy: Literal["least_outstanding", "ewma"] = "least_outstanding",
+        **kwargs,
+    ):
+        ports = [port] if isinstance(port, int) else list(port)  # Support single port or list
+        clients = [
+            dspy.HFClientTGI(
+                model=model,
+                port=p,
+                url=url,
+                http_request_kwargs=http_request_kwargs or {},
+                **kwargs
+            )
+            for p in ports
+        ]
         # Initialize with modern dspy.HFClientTGI
-        self._modern_client = dspy.HFClientTGI(
-            model=model,
-            port=port,
-            url=url,
-            http_request_kwargs=http_request_kwargs or {},
-            **kwargs
+        self._modern_client = clients[0]
+        self.pool = EndpointPool(
+            [Endpoint(f"{url}:{p}", c) for p, c in zip(ports, clients)],
+            strategy=strategy,
+            health_check=http_health_check("/health"),
         )
         
         # Also initialize parent for compatibility
@@ -271,17 +352,22 @@ class TGIClient(dspy.LM):
         self.model = model
         self.port = port
         self.url = url
-        self.ports = [port] if isinstance(port, int) else port  # Support single port or list
+        self.ports = ports
         self.headers = {}
         self.http_request_kwargs = http_request_kwargs or {}
 
+    @trace_lm_call
     def basic_request(self, prompt: str, **kwargs):
-        """Delegate to modern dspy.HFClientTGI basic_request method"""
-        return self._modern_client.basic_request(prompt, **kwargs)
+        """Delegate to the least loaded dspy.HFClientTGI basic_request method"""
+        return self.pool.call(lambda client: client.basic_request(prompt, **kwargs))
     
     def __call__(self, prompt: str, only_completed: bool = True, return_sorted: bool = False, **kwargs):
-        """Delegate to modern dspy.HFClientTGI __call__ method"""
-        return self._modern_client(prompt, only_completed=only_completed, return_sorted=return_sorted, **kwargs)
+        """Delegate to the least loaded dspy.HFClientTGI __call__ method"""
+        return self.pool.call(
+            lambda client: client(
+                prompt, only_completed=only_completed, return_sorted=return_sorted, **kwargs
+            )
+        )
     
     def _generate(self, prompt, **kwargs):
         """Legacy method for backward compatibility - delegates to modern implementation"""
@@ -305,6 +391,7 @@ class TogetherClient(dspy.LM):
         """Copied from dspy/dsp/modules/hf_client.py with the support of applying tokenizer chat template."""
 
         super().__init__(model=model, is_client=True)
+        self.history = LMCallHistory()
         self.session = requests.Session()
         self.api_base = (
             "https://api.together.xyz/v1/completions"
@@ -319,12 +406,16 @@ class TogetherClient(dspy.LM):
         #     self.use_inst_template = True
         self.apply_tokenizer_chat_template = apply_tokenizer_chat_template
         if self.apply_tokenizer_chat_template:
+            from transformers import AutoTokenizer
+
             logging.info("Loading huggingface tokenizer.")
             if hf_tokenizer_name is None:
                 hf_tokenizer_name = self.model
             self.tokenizer = AutoTokenizer.from_pretrained(
                 hf_tokenizer_name, cache_dir=kwargs.get("cache_dir", None)
             )
+            # Let prompt budgeting count tokens with the model's own tokenizer.
+            register_tokenizer(self.model, self.tokenizer)
 
         stop_default = "\n\n---"
 
@@ -363,6 +454,7 @@ class TogetherClient(dspy.LM):
 
         return usage
 
+    @trace_lm_call
     def basic_request(self, prompt: str, **kwargs):
         raw_kwargs = kwargs
         kwargs = {
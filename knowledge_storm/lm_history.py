@@ -0,0 +1,107 @@
+"""Bounded, thread-safe storage for language model call history."""
+
+import json
+import threading
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+DEFAULT_HISTORY_SIZE = 1000
+
+
+class JsonlHistoryWriter:
+    """Append history entries to a JSONL file as calls happen.
+
+    A single writer can be shared by several histories; writes are serialized
+    with a lock so lines from concurrent calls never interleave.
+    """
+
+    def __init__(self, path: str, exclude_keys: Iterable[str] = (), mode: str = "w"):
+        self.path = path
+        self.exclude_keys = frozenset(exclude_keys)
+        self._lock = threading.Lock()
+        self._file = open(path, mode, encoding="utf-8")
+
+    def write(self, entry: Dict[str, Any]) -> None:
+        record = {k: v for k, v in entry.items() if k not in self.exclude_keys}
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class LMCallHistory:
+    """Ring buffer of LM calls with optional streaming to disk.
+
+    Behaves like the plain ``list`` that ``dspy.LM`` uses for ``history``
+    (``append``, ``pop``, iteration, indexing, ``len``) but keeps at most
+    ``maxlen`` entries in memory. dspy trims the list itself with ``pop(0)``
+    once it reaches ``settings.max_history_size``; the smaller of the two
+    limits applies. ``deque.append`` is atomic, so appends from worker
+    threads need no lock. When a writer is attached every entry is also
+    written to it immediately, so evicted entries are not lost.
+    """
+
+    def __init__(
+        self,
+        maxlen: Optional[int] = DEFAULT_HISTORY_SIZE,
+        writer: Optional[JsonlHistoryWriter] = None,
+    ):
+        self._entries = deque(maxlen=maxlen)
+        self.writer = writer
+
+    @property
+    def maxlen(self) -> Optional[int]:
+        return self._entries.maxlen
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        self._entries.append(entry)
+        writer = self.writer
+        if writer is not None:
+            writer.write(entry)
+
+    def extend(self, entries: Iterable[Dict[str, Any]]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def pop(self, index: int = -1) -> Dict[str, Any]:
+        """Remove and return the entry at ``index``, like ``list.pop``."""
+        if index == 0:
+            return self._entries.popleft()
+        if index == -1:
+            return self._entries.pop()
+        entry = self._entries[index]
+        del self._entries[index]
+        return entry
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """Remove and return the buffered entries, oldest first."""
+        drained = []
+        while True:
+            try:
+                drained.append(self._entries.popleft())
+            except IndexError:
+                return drained
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(list(self._entries))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._entries)[index]
+        return self._entries[index]
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
@@ -0,0 +1,265 @@
+"""Endpoint pool for spreading LM requests across self-hosted servers.
+
+Used by ``LoadBalancedClient`` and ``TGIClient`` in ``lm.py`` to drive several
+TGI / Ollama / vLLM endpoints from one deployment. Selection is either
+least-outstanding-requests or EWMA latency; endpoints that fail repeatedly are
+ejected for a cooldown and re-admitted after a passing health check or a
+successful trial request.
+
+Only connection errors, timeouts and 5xx/408/429 responses count as endpoint
+failures. Other errors, such as a 400 for an oversized prompt, say the request
+is bad; they are raised unchanged without failing over or ejecting anything.
+"""
+
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Literal, Optional
+
+from .telemetry import current_span
+
+try:
+    import requests
+except ImportError:  # pragma: no cover - optional dependency
+    requests = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK_TIMEOUT = 2.0
+# Request timeout and rate limiting are the endpoint's state, not the request's
+RETRYABLE_CLIENT_STATUSES = frozenset({408, 429})
+
+
+class NoHealthyEndpointError(RuntimeError):
+    """Raised when every endpoint in the pool failed a request."""
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    for owner in (getattr(error, "response", None), error):
+        for name in ("status_code", "status"):
+            status = getattr(owner, name, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """Whether ``error`` means the endpoint is unhealthy rather than the request bad."""
+    status = _status_code(error)
+    if status is not None:
+        return status >= 500 or status in RETRYABLE_CLIENT_STATUSES
+    if requests is not None and isinstance(error, requests.RequestException):
+        return isinstance(error, (requests.ConnectionError, requests.Timeout))
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    return isinstance(error, (ConnectionError, TimeoutError))
+
+
+class Endpoint:
+    """A single server in the pool with its load and health statistics."""
+
+    def __init__(self, url: str, client: Any):
+        self.url = url
+        self.client = client
+        self.outstanding = 0
+        self.ewma_latency: Optional[float] = None
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.total_requests = 0
+        self.total_failures = 0
+
+    def is_ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+    def stats(self) -> dict:
+        return {
+            "url": self.url,
+            "outstanding": self.outstanding,
+            "ewma_latency": self.ewma_latency,
+            "consecutive_failures": self.consecutive_failures,
+            "ejected": self.is_ejected(time.monotonic()),
+            "total_requests": self.total_requests,
+            "total_failures": self.total_failures,
+        }
+
+
+def http_health_check(path: str = "/health") -> Callable[[Endpoint], bool]:
+    """Build a health check that GETs ``endpoint.url + path``.
+
+    TGI and vLLM expose ``/health``; for Ollama use ``/api/tags``.
+    """
+    import requests
+
+    def check(endpoint: Endpoint) -> bool:
+        try:
+            resp = requests.get(endpoint.url.rstrip("/") + path, timeout=HEALTH_CHECK_TIMEOUT)
+            return resp.status_code < 500
+        except requests.RequestException:
+            return False
+
+    return check
+
+
+class EndpointPool:
+    """Thread-safe selection, ejection and re-admission of endpoints.
+
+    Args:
+        endpoints: Endpoints to balance across.
+        strategy: ``"least_outstanding"`` picks the endpoint with the fewest
+            in-flight requests; ``"ewma"`` weights in-flight requests by each
+            endpoint's exponentially weighted mean latency.
+        max_failures: Consecutive failures before an endpoint is ejected.
+        ejection_seconds: Cooldown before an ejected endpoint is retried.
+        ewma_alpha: Smoothing factor for the latency average.
+        health_check: Optional callable used to re-admit ejected endpoints.
+    """
+
+    def __init__(
+        self,
+        endpoints: List[Endpoint],
+        strategy: Literal["least_outstanding", "ewma"] = "least_outstanding",
+        max_failures: int = 3,
+        ejection_seconds: float = 30.0,
+        ewma_alpha: float = 0.3,
+        health_check: Optional[Callable[[Endpoint], bool]] = None,
+    ):
+        if not endpoints:
+            raise ValueError("EndpointPool requires at least one endpoint")
+        if strategy not in ("least_outstanding", "ewma"):
+            raise ValueError(f"Unknown load balancing strategy: {strategy}")
+        self.endpoints = endpoints
+        self.strategy = strategy
+        self.max_failures = max_failures
+        self.ejection_seconds = ejection_seconds
+        self.ewma_alpha = ewma_alpha
+        self.health_check = health_check
+        self._lock = threading.Lock()
+        self._health_thread: Optional[threading.Thread] = None
+        self._stop_health = threading.Event()
+
+    def _load(self, endpoint: Endpoint) -> float:
+        if self.strategy == "ewma":
+            # Unmeasured endpoints get a latency of 0 so they are tried first.
+            return (endpoint.outstanding + 1) * (endpoint.ewma_latency or 0.0)
+        return endpoint.outstanding
+
+    def acquire(self, exclude: Optional[set] = None) -> Optional[Endpoint]:
+        """Reserve the least loaded available endpoint not in ``exclude``, or ``None``."""
+        exclude = exclude or set()
+        now = time.monotonic()
+        with self._lock:
+            candidates = [
+                e for e in self.endpoints if e not in exclude and not e.is_ejected(now)
+            ]
+            if not candidates:
+                return None
+            lowest = min(self._load(e) for e in candidates)
+            endpoint = random.choice([e for e in candidates if self._load(e) == lowest])
+            endpoint.outstanding += 1
+            endpoint.total_requests += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, latency: Optional[float] = None, failed: bool = False) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if failed:
+                endpoint.total_failures += 1
+                endpoint.consecutive_failures += 1
+                if endpoint.consecutive_failures >= self.max_failures:
+                    endpoint.ejected_until = time.monotonic() + self.ejection_seconds
+                    logger.warning(
+                        "Ejecting endpoint %s after %d consecutive failures",
+                        endpoint.url,
+                        endpoint.consecutive_failures,
+                    )
+                return
+            if endpoint.consecutive_failures >= self.max_failures:
+                logger.info("Re-admitting endpoint %s", endpoint.url)
+            endpoint.consecutive_failures = 0
+            endpoint.ejected_until = 0.0
+            if latency is not None:
+                if endpoint.ewma_latency is None:
+                    endpoint.ewma_latency = latency
+                else:
+                    endpoint.ewma_latency = (
+                        self.ewma_alpha * latency + (1 - self.ewma_alpha) * endpoint.ewma_latency
+                    )
+
+    @contextmanager
+    def lease(self, exclude: Optional[set] = None) -> Iterator[Endpoint]:
+        endpoint = self.acquire(exclude)
+        if endpoint is None:
+            raise NoHealthyEndpointError("No healthy endpoint available")
+        start = time.monotonic()
+        try:
+            yield endpoint
+        except Exception as e:
+            self.release(endpoint, failed=is_endpoint_failure(e))
+            raise
+        self.release(endpoint, latency=time.monotonic() - start)
+
+    def call(self, fn: Callable[[Any], Any]) -> Any:
+        """Run ``fn(client)`` on the best endpoint, failing over to the others.
+
+        Errors that are not endpoint failures are raised unchanged.
+        """
+        tried: set = set()
+        last_error: Optional[Exception] = None
+        while len(tried) < len(self.endpoints):
+            try:
+                with self.lease(exclude=tried) as endpoint:
+                    tried.add(endpoint)
+                    return fn(endpoint.client)
+            except NoHealthyEndpointError:
+                break
+            except Exception as e:
+                if not is_endpoint_failure(e):
+                    raise
+                logger.warning("Request to %s failed: %s", endpoint.url, e)
+                last_error = e
+                span = current_span()
+                if span is not None:
+                    span.retry_count += 1
+        raise NoHealthyEndpointError(
+            f"All {len(self.endpoints)} endpoints failed or are ejected"
+        ) from last_error
+
+    def check_health(self) -> None:
+        """Probe ejected endpoints and re-admit the ones that pass."""
+        if self.health_check is None:
+            return
+        now = time.monotonic()
+        for endpoint in self.endpoints:
+            if endpoint.is_ejected(now) and self.health_check(endpoint):
+                with self._lock:
+                    endpoint.consecutive_failures = 0
+                    endpoint.ejected_until = 0.0
+                logger.info("Endpoint %s passed health check, re-admitted", endpoint.url)
+
+    def start_health_checks(self, interval: float = 10.0) -> None:
+        """Run ``check_health`` every ``interval`` seconds in a daemon thread."""
+        if self._health_thread is not None:
+            return
+        self._stop_health.clear()
+
+        def loop():
+            while not self._stop_health.wait(interval):
+                self.check_health()
+
+        self._health_thread = threading.Thread(target=loop, daemon=True)
+        self._health_thread.start()
+
+    def stop_health_checks(self) -> None:
+        self._stop_health.set()
+        self._health_thread = None
+
+    def stats(self) -> List[dict]:
+        with self._lock:
+            return [e.stats() for e in self.endpoints]
@@ -7,6 +7,7 @@ import dspy
 
 from ..services.crossref_service import CrossrefService
 from ..services.academic_source_service import SourceQualityScorer
+from ..telemetry import trace_rm_call
 
 
 class CrossrefRM(dspy.Retrieve):
@@ -67,6 +68,7 @@ class CrossrefRM(dspy.Retrieve):
         collected.sort(key=lambda r: r.get("score", 0), reverse=True)
         return collected[: self.k] if self.k else collected
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] | None = None
     ) -> List[Dict[str, Any]]:
@@ -7,9 +7,13 @@ Implements the PRISMA methodology with integration to STORM-Academic VERIFY syst
 
 from .core import Paper, SearchStrategy, ExtractionTemplate, ScreeningResult
 from .search_strategy import SearchStrategyBuilder
-from .screening import ScreeningAssistant, PRISMAScreener
+from .screening import ScreeningAssistant, PRISMAScreener, ScreeningDecision, ScreeningStats, iter_papers_jsonl
 from .extraction import DataExtractionHelper
-from .abstract_analyzer import AbstractAnalyzer, AbstractAnalysisResult
+from .abstract_analyzer import AbstractAnalyzer, AbstractAnalysisResult, AbstractAnalysisTable
+from .deduplication import PaperDeduplicator, DeduplicationResult
+from .paper_store import PaperStore, PaperView
+from .retrieval import PaperRetriever
+from .rule_engine import CriteriaIndex, RuleSet, compile_criteria, compile_rules
 from .draft_generation import ZeroDraftGenerator
 
 __all__ = [
@@ -20,8 +24,21 @@ __all__ = [
     'SearchStrategyBuilder',
     'ScreeningAssistant',
     'PRISMAScreener',
+    'ScreeningDecision',
+    'ScreeningStats',
+    'iter_papers_jsonl',
     'DataExtractionHelper',
     'AbstractAnalyzer',
     'AbstractAnalysisResult',
+    'AbstractAnalysisTable',
+    'PaperDeduplicator',
+    'DeduplicationResult',
+    'PaperStore',
+    'PaperView',
+    'PaperRetriever',
+    'RuleSet',
+    'compile_rules',
+    'CriteriaIndex',
+    'compile_criteria',
     'ZeroDraftGenerator'
 ]
\ No newline at end of file
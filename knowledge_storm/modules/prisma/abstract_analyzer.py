@@ -5,11 +5,11 @@ Specialized module for analyzing research paper abstracts to extract
 study characteristics, sample sizes, and other key information.
 """
 
-import re
-from typing import Dict, Any, List, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Sequence
+from dataclasses import dataclass, fields
 
 from .core import Paper
+from .rule_engine import compile_rules
 
 
 @dataclass
@@ -29,6 +29,40 @@ class AbstractAnalysisResult:
             self.outcome_measures = []
 
 
+@dataclass
+class AbstractAnalysisTable:
+    """
+    Columnar result of a batch analysis.
+    
+    Each attribute is a column with one entry per analyzed paper, in input
+    order; ``row(i)`` gives the AbstractAnalysisResult for paper ``i``.
+    """
+    paper_ids: List[str]
+    sample_size: List[Optional[int]]
+    study_design: List[Optional[str]]
+    outcome_measures: List[List[str]]
+    analysis_summary: List[str]
+    confidence_score: List[float]
+    
+    def __len__(self) -> int:
+        return len(self.paper_ids)
+    
+    def row(self, index: int) -> AbstractAnalysisResult:
+        design = self.study_design[index]
+        return AbstractAnalysisResult(
+            sample_size=self.sample_size[index],
+            study_design=design,
+            study_indicators=[design] if design else [],
+            outcome_measures=list(self.outcome_measures[index]),
+            analysis_summary=self.analysis_summary[index],
+            confidence_score=self.confidence_score[index]
+        )
+    
+    def columns(self) -> Dict[str, List[Any]]:
+        """The table as a dict of column name to values."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
 class AbstractAnalyzer:
     """
     Specialized analyzer for research paper abstracts.
@@ -128,6 +162,37 @@ class AbstractAnalyzer:
         Returns:
             AbstractAnalysisResult with extracted information
         """
+        return self._analyze(paper, *self._compiled_rules())
+    
+    def analyze_batch(self, papers: Sequence[Paper]) -> AbstractAnalysisTable:
+        """
+        Analyze many abstracts, returning a columnar table.
+        
+        Gives the same results as ``analyze_abstract`` per paper. Papers are
+        still analyzed one at a time, so batching gives no vectorized
+        speedup; it only skips the per-call rule table lookup.
+        """
+        rules = self._compiled_rules()
+        table = AbstractAnalysisTable([], [], [], [], [], [])
+        for paper in papers:
+            result = self._analyze(paper, *rules)
+            table.paper_ids.append(paper.id)
+            table.sample_size.append(result.sample_size)
+            table.study_design.append(result.study_design)
+            table.outcome_measures.append(result.outcome_measures)
+            table.analysis_summary.append(result.analysis_summary)
+            table.confidence_score.append(result.confidence_score)
+        return table
+    
+    def _compiled_rules(self):
+        """Compiled sample size, study design and outcome measure rules."""
+        return (
+            compile_rules({'sample_size': self.sample_size_patterns}),
+            compile_rules(self.study_design_patterns),
+            compile_rules(self.outcome_measure_patterns),
+        )
+    
+    def _analyze(self, paper: Paper, sample_rules, design_rules, outcome_rules) -> AbstractAnalysisResult:
         if not paper.abstract:
             return AbstractAnalysisResult(
                 analysis_summary=f"No abstract available for {paper.title}",
@@ -138,15 +203,16 @@ class AbstractAnalyzer:
         result = AbstractAnalysisResult()
         
         # Extract sample size
-        result.sample_size = self._extract_sample_size(abstract_text)
+        result.sample_size = self._extract_sample_size(abstract_text, sample_rules)
         
         # Identify study design
-        result.study_design = self._identify_study_design(abstract_text)
+        design = design_rules.first(abstract_text)
+        result.study_design = design.category if design else None
         if result.study_design:
             result.study_indicators.append(result.study_design)
         
-        # Extract outcome measures
-        result.outcome_measures = self._extract_outcome_measures(abstract_text)
+        # Extract outcome measures; each measure type is reported once
+        result.outcome_measures = outcome_rules.matched_categories(abstract_text)
         
         # Generate analysis summary
         result.analysis_summary = self._generate_analysis_summary(result)
@@ -156,42 +222,41 @@ class AbstractAnalyzer:
         
         return result
     
-    def _extract_sample_size(self, abstract_text: str) -> Optional[int]:
+    def _extract_sample_size(self, abstract_text: str, rules=None) -> Optional[int]:
         """Extract sample size from abstract text."""
-        for pattern in self.sample_size_patterns:
-            match = re.search(pattern, abstract_text, re.IGNORECASE)
-            if match:
-                try:
-                    # Get the first capturing group that contains digits
-                    for group in match.groups():
-                        if group and group.isdigit():
-                            sample_size = int(group)
-                            # Validate reasonable sample size (between 1 and 1,000,000)
-                            if 1 <= sample_size <= 1000000:
-                                return sample_size
-                except ValueError:
-                    continue
+        rules = rules or self._compiled_rules()[0]
+        for rule_match in rules.iter_matches(abstract_text):
+            sample_size = self._valid_sample_size(rule_match.match)
+            if sample_size is not None:
+                return sample_size
+        return None
+    
+    @staticmethod
+    def _valid_sample_size(match) -> Optional[int]:
+        """Sample size captured by a sample size pattern match, if plausible."""
+        try:
+            # Get the first capturing group that contains digits
+            for group in match.groups():
+                if group and group.isdigit():
+                    sample_size = int(group)
+                    # Validate reasonable sample size (between 1 and 1,000,000)
+                    if 1 <= sample_size <= 1000000:
+                        return sample_size
+        except ValueError:
+            pass
         return None
     
     def _identify_study_design(self, abstract_text: str) -> Optional[str]:
         """Identify study design from abstract text."""
-        for design_type, patterns in self.study_design_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, abstract_text, re.IGNORECASE):
-                    return design_type
-        return None
+        _, design_rules, _ = self._compiled_rules()
+        match = design_rules.first(abstract_text)
+        return match.category if match else None
     
     def _extract_outcome_measures(self, abstract_text: str) -> List[str]:
         """Extract outcome measures from abstract text."""
-        found_measures = []
-        
-        for measure_type, patterns in self.outcome_measure_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, abstract_text, re.IGNORECASE):
-                    found_measures.append(measure_type)
-                    break  # Only add each measure type once
-        
-        return found_measures
+        # Each measure type is reported once
+        _, _, outcome_rules = self._compiled_rules()
+        return outcome_rules.matched_categories(abstract_text)
     
     def _generate_analysis_summary(self, result: AbstractAnalysisResult) -> str:
         """Generate human-readable analysis summary."""
@@ -245,4 +310,4 @@ class AbstractAnalyzer:
 
 
 # Export classes
-__all__ = ['AbstractAnalyzer', 'AbstractAnalysisResult']
\ No newline at end of file
+__all__ = ['AbstractAnalyzer', 'AbstractAnalysisResult', 'AbstractAnalysisTable']
\ No newline at end of file
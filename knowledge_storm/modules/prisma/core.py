@@ -5,7 +5,7 @@ Focused module containing only core data structures and type definitions
 for PRISMA Assistant functionality.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 
@@ -29,6 +29,12 @@ class Paper:
     screening_decision: Optional[str] = None  # include, exclude, maybe
     exclusion_reason: Optional[str] = None
     confidence_score: float = 0.0
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Paper":
+        """Build a Paper from a dict, ignoring keys that are not Paper fields."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in names})
 
 
 @dataclass
@@ -0,0 +1,253 @@
+"""
+PRISMA Duplicate Detection.
+
+Removes duplicate records before screening, since the same paper is usually
+retrieved from several databases. Records are clustered in three passes,
+each linear in the number of records:
+
+1. normalized DOI,
+2. normalized title, when year (within a year) or first author also agree,
+3. MinHash/LSH over word shingles of title and abstract, for near-duplicates
+   whose metadata differs slightly (punctuation, truncated abstracts, ...).
+
+Signatures use one-permutation hashing: every shingle is hashed once and
+assigned to one signature bin, so a signature costs one hash per shingle
+instead of one per shingle and permutation. Records with different DOIs are
+never merged. The first record of each cluster, in input order, is kept.
+
+A ``PaperView`` is deduplicated on its store's columns, without building
+``Paper`` objects; the kept records are returned as a view of the same store.
+"""
+
+import logging
+import string
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set
+
+from .core import Paper
+from .paper_store import PaperView
+from .rule_engine import text_tokens
+from ...services.utils import normalize_doi, same_study_metadata
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.7
+DEFAULT_SHINGLE_SIZE = 3
+DEFAULT_NUM_BINS = 32
+DEFAULT_BANDS = 8
+# Shorter texts give unreliable MinHash estimates; titles alone are matched exactly
+MIN_SHINGLES = 8
+# Titles like "Editorial" or "Introduction" are not evidence of a duplicate
+MIN_TITLE_WORDS = 3
+
+_EMPTY_BIN = 0xFFFFFFFF
+_PUNCTUATION_TO_SPACE = bytes.maketrans(string.punctuation.encode(), b" " * len(string.punctuation))
+
+
+@dataclass
+class DeduplicationResult:
+    """Outcome of duplicate removal, with PRISMA identification counts."""
+    papers: Sequence[Paper]  # Unique records, in input order; a PaperView for PaperView input
+    records_identified: int
+    duplicates: Dict[str, str] = field(default_factory=dict)  # removed paper id -> kept paper id
+    removed_by: Dict[str, int] = field(default_factory=dict)  # 'doi', 'title', 'near_duplicate'
+
+    @property
+    def duplicates_removed(self) -> int:
+        return self.records_identified - len(self.papers)
+
+    @property
+    def prisma_counts(self) -> Dict[str, int]:
+        return {
+            'records_identified': self.records_identified,
+            'duplicates_removed': self.duplicates_removed,
+            'records_screened': len(self.papers),
+        }
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase ``title`` and reduce it to its words."""
+    return " ".join(text_tokens(title or ""))
+
+
+class PaperDeduplicator:
+    """
+    Cluster exact and near-duplicate papers.
+
+    Near-duplicates are found with LSH: signatures of ``num_bins`` bins are
+    split into ``bands`` bands, records sharing any band are compared, and a
+    pair whose estimated Jaccard similarity of shingles reaches
+    ``similarity_threshold`` is merged.
+    """
+
+    def __init__(self, similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 shingle_size: int = DEFAULT_SHINGLE_SIZE,
+                 num_bins: int = DEFAULT_NUM_BINS,
+                 bands: int = DEFAULT_BANDS):
+        if num_bins & (num_bins - 1) or num_bins % bands:
+            raise ValueError("num_bins must be a power of two divisible by bands")
+        self.similarity_threshold = similarity_threshold
+        self.shingle_size = shingle_size
+        self.num_bins = num_bins
+        self.bands = bands
+        self._rows = num_bins // bands
+        self._bin_bits = num_bins.bit_length() - 1
+
+    def deduplicate(self, papers: Sequence[Paper]) -> DeduplicationResult:
+        """Remove duplicate papers, keeping the first record of each cluster."""
+        records = _Records(papers)
+        clusters = _Clusters(records.dois)
+
+        by_doi: Dict[str, int] = {}
+        # Records that started a title group; a title shared by distinct
+        # studies has one entry per study
+        by_title: Dict[str, List[int]] = {}
+        for index, title in enumerate(records.titles):
+            doi = clusters.dois[index]
+            if doi:
+                clusters.merge(by_doi.setdefault(doi, index), index, 'doi')
+            title = normalize_title(title)
+            if title.count(" ") + 1 >= MIN_TITLE_WORDS:
+                candidates = by_title.setdefault(title, [])
+                if not any(
+                    same_study_metadata(records.years[other], records.authors(other),
+                                        records.years[index], records.authors(index))
+                    and clusters.merge(other, index, 'title')
+                    for other in candidates
+                ):
+                    candidates.append(index)
+
+        self._merge_near_duplicates(records, clusters)
+
+        roots = [clusters.find(index) for index in range(len(records.ids))]
+        kept = [index for index, root in enumerate(roots) if root == index]
+        duplicates = {
+            records.ids[index]: records.ids[root] for index, root in enumerate(roots) if root != index
+        }
+        if isinstance(papers, PaperView):
+            unique: Sequence[Paper] = papers.store.view([papers.rows[index] for index in kept])
+        else:
+            unique = [papers[index] for index in kept]
+        result = DeduplicationResult(unique, len(roots), duplicates, clusters.removed_by)
+        logger.info(
+            f"Deduplication removed {result.duplicates_removed} of {len(roots)} records "
+            f"({clusters.removed_by})"
+        )
+        return result
+
+    def signature(self, text: str) -> Optional[array]:
+        """One-permutation MinHash signature of ``text``, or None if it is too short."""
+        shingles = self._shingle_hashes(text)
+        if len(shingles) < MIN_SHINGLES:
+            return None
+        mask = self.num_bins - 1
+        bits = self._bin_bits
+        sig = [_EMPTY_BIN] * self.num_bins
+        for h in shingles:
+            value = h >> bits
+            if value < sig[h & mask]:
+                sig[h & mask] = value
+        return array('I', sig)
+
+    def _shingle_hashes(self, text: str) -> Set[int]:
+        lowered = text.lower()
+        if lowered.isascii():
+            # Same tokens as text_tokens, but hashed without re-encoding every shingle
+            tokens = lowered.encode().translate(_PUNCTUATION_TO_SPACE).split()
+        else:
+            tokens = [token.encode() for token in text_tokens(lowered)]
+        shingles = zip(*(tokens[i:] for i in range(self.shingle_size)))
+        return set(map(zlib.crc32, map(b" ".join, shingles)))
+
+    @staticmethod
+    def similarity(a: array, b: array) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        both = matches = 0
+        for x, y in zip(a, b):
+            if x != _EMPTY_BIN or y != _EMPTY_BIN:
+                both += 1
+                matches += x == y
+        return matches / both if both else 0.0
+
+    def _merge_near_duplicates(self, records: "_Records", clusters: "_Clusters"):
+        # Each band maps a band value to the first record that had it; a
+        # later record is compared against that one only, which keeps memory
+        # and work linear
+        buckets: List[Dict[bytes, int]] = [{} for _ in range(self.bands)]
+        signatures: Dict[int, array] = {}
+        empty_band = array('I', [_EMPTY_BIN] * self._rows).tobytes()
+        for index, (title, abstract) in enumerate(zip(records.titles, records.abstracts)):
+            if clusters.find(index) != index:
+                continue
+            sig = self.signature(f"{title} {abstract or ''}")
+            if sig is None:
+                continue
+            signatures[index] = sig
+            for band, bucket in enumerate(buckets):
+                key = sig[band * self._rows:(band + 1) * self._rows].tobytes()
+                if key == empty_band:
+                    continue
+                other = bucket.setdefault(key, index)
+                if other != index and clusters.find(other) != clusters.find(index):
+                    if self.similarity(signatures[other], sig) >= self.similarity_threshold:
+                        clusters.merge(other, index, 'near_duplicate')
+
+
+class _Records:
+    """The fields deduplication reads, as columns of Papers or of a PaperStore."""
+
+    def __init__(self, papers: Sequence[Paper]):
+        self._papers = papers
+        if isinstance(papers, PaperView):
+            store, rows = papers.store, papers.rows
+            self.ids, self.dois, self.titles, self.abstracts, self.years = (
+                store.column(name, rows) for name in ('id', 'doi', 'title', 'abstract', 'year')
+            )
+        else:
+            self.ids = [paper.id for paper in papers]
+            self.dois = [paper.doi for paper in papers]
+            self.titles = [paper.title for paper in papers]
+            self.abstracts = [paper.abstract for paper in papers]
+            self.years = [paper.year for paper in papers]
+
+    def authors(self, index: int) -> List[str]:
+        # Only needed for title matches, so not read as a column
+        if isinstance(self._papers, PaperView):
+            return self._papers.store.get('authors', self._papers.rows[index])
+        return self._papers[index].authors
+
+
+class _Clusters:
+    """Union-find over record positions; the earliest record is the root."""
+
+    def __init__(self, dois: Sequence[Optional[str]]):
+        self.parent = list(range(len(dois)))
+        self.dois = [normalize_doi(doi) if doi else None for doi in dois]
+        self.removed_by = {'doi': 0, 'title': 0, 'near_duplicate': 0}
+
+    def find(self, index: int) -> int:
+        parent = self.parent
+        root = index
+        while parent[root] != root:
+            root = parent[root]
+        while parent[index] != root:
+            parent[index], index = root, parent[index]
+        return root
+
+    def merge(self, a: int, b: int, method: str) -> bool:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if a > b:
+            a, b = b, a
+        if self.dois[a] and self.dois[b] and self.dois[a] != self.dois[b]:
+            return False
+        self.parent[b] = a
+        self.dois[a] = self.dois[a] or self.dois[b]
+        self.removed_by[method] += 1
+        return True
+
+
+__all__ = ['PaperDeduplicator', 'DeduplicationResult', 'normalize_title', 'same_study_metadata']
@@ -5,8 +5,10 @@ Focused module for systematic data extraction with standardized templates
 for different study types in systematic reviews.
 """
 
+import asyncio
+import logging
 import re
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, List, Optional, Sequence
 
 from .core import Paper, ExtractionTemplate
 from .abstract_analyzer import AbstractAnalyzer
@@ -29,6 +31,12 @@ except ImportError:
         """Fallback AcademicSourceService when VERIFY services unavailable."""
         pass
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXTRACTION_CONCURRENCY = 8
+# Seconds a paper's VERIFY lookup may take before the unverified confidence is used
+DEFAULT_VERIFY_TIMEOUT = 30.0
+
 
 class DataExtractionHelper:
     """Helper for systematic data extraction with standardized templates.
@@ -191,15 +199,87 @@ class DataExtractionHelper:
         
         return extracted
     
-    async def extract_data(self, paper: Paper, template: ExtractionTemplate) -> Dict[str, Any]:
-        """Extract data from paper using template with VERIFY system enhancement."""
+    async def extract_data_batch(self, papers: Sequence[Paper], templates: Sequence[ExtractionTemplate],
+                                 concurrency: int = DEFAULT_EXTRACTION_CONCURRENCY,
+                                 timeout: Optional[float] = DEFAULT_VERIFY_TIMEOUT,
+                                 on_progress: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Extract data from many papers, ``templates[i]`` applying to ``papers[i]``.
+        
+        DOIs of papers without an abstract are resolved in one batched
+        lookup up front, then at most ``concurrency`` papers are verified at
+        once, each VERIFY lookup bounded by ``timeout`` seconds. Results keep
+        the input order. ``on_progress(done, total)`` is called as each paper
+        completes.
+        
+        Abstracts are analyzed in one ``AbstractAnalyzer.analyze_batch`` pass;
+        each result gets the detected study design, outcome measures and
+        analysis confidence, and a sample size if the template found none.
+        """
+        sources = await self._resolve_sources(papers)
+        analysis = self.abstract_analyzer.analyze_batch(papers)
+        semaphore = asyncio.Semaphore(concurrency)
+        done = 0
+        
+        async def extract(paper: Paper, template: ExtractionTemplate) -> Dict[str, Any]:
+            nonlocal done
+            async with semaphore:
+                extracted = await self.extract_data(paper, template, sources.get(paper.doi), timeout)
+            done += 1
+            if on_progress:
+                on_progress(done, len(papers))
+            return extracted
+        
+        results = await asyncio.gather(*(extract(paper, template) for paper, template in zip(papers, templates)))
+        for extracted, sample_size, design, outcomes, summary, confidence in zip(
+            results, analysis.sample_size, analysis.study_design, analysis.outcome_measures,
+            analysis.analysis_summary, analysis.confidence_score
+        ):
+            if extracted.get('sample_size') is None and sample_size:
+                extracted['sample_size'] = sample_size
+            if design:
+                extracted['study_design'] = design
+            extracted['outcome_measures'] = outcomes
+            extracted['abstract_analysis'] = summary
+            extracted['analysis_confidence'] = confidence
+        return results
+    
+    async def _resolve_sources(self, papers: Sequence[Paper]) -> Dict[str, Dict[str, Any]]:
+        """VERIFY sources for papers without an abstract, from one batched DOI lookup."""
+        dois = list(dict.fromkeys(paper.doi for paper in papers if paper.doi and not paper.abstract))
+        resolve_dois = getattr(self.academic_source_service, 'resolve_dois', None)
+        if not dois or resolve_dois is None:
+            return {}
+        try:
+            metadata = await resolve_dois(dois)
+        except Exception as e:
+            logger.warning(f"Batched DOI lookup failed, verifying papers one by one: {e}")
+            return {}
+        # Without a 'doi' key the verifier uses this metadata instead of fetching it again
+        sources = {}
+        for doi, record in metadata.items():
+            if record:
+                source = {key: value for key, value in record.items() if key != 'doi'}
+                source.update(text=record.get('abstract', ''), url=f"https://doi.org/{doi}")
+                sources[doi] = source
+        return sources
+    
+    async def extract_data(self, paper: Paper, template: ExtractionTemplate,
+                           source: Optional[Dict[str, Any]] = None,
+                           timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Extract data from paper using template with VERIFY system enhancement.
+        
+        ``source`` overrides the VERIFY source built from the paper, and
+        ``timeout`` bounds the VERIFY lookup in seconds.
+        """
         # In production, this would use NLP/ML to extract structured data
         extracted = {}
         
         for field_name, field_info in template.fields.items():
             # Simple pattern-based extraction (would use NLP in production)
             if field_name == 'sample_size':
-                match = re.search(r'n\s*=\s*(\d+)', paper.abstract, re.IGNORECASE)
+                match = re.search(r'n\s*=\s*(\d+)', paper.abstract or '', re.IGNORECASE)
                 extracted[field_name] = int(match.group(1)) if match else None
             else:
                 # Placeholder - would extract based on field type
@@ -209,9 +289,12 @@ class DataExtractionHelper:
         if field_info.get('required', False) and extracted.get(field_name):
             try:
                 # Use VERIFY system to validate extracted data
-                verify_result = await self.citation_verifier.verify_citation_async(
-                    str(extracted[field_name]), 
-                    {'text': paper.abstract, 'doi': paper.doi}
+                verify_result = await asyncio.wait_for(
+                    self.citation_verifier.verify_citation_async(
+                        str(extracted[field_name]), 
+                        source or {'text': paper.abstract, 'doi': paper.doi}
+                    ),
+                    timeout
                 )
                 
                 # Add confidence score based on verification
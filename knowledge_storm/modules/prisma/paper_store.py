@@ -0,0 +1,229 @@
+"""
+Columnar PRISMA Paper Store.
+
+Holds the papers of a review column by column instead of as one ``Paper``
+object per record. Text fields are plain string columns, numbers live in
+typed arrays, and low-cardinality fields (journal, study type, screening
+decision and reason, author names, keywords) are dictionary-encoded: each
+distinct value is stored once and rows hold an integer code.
+
+Pipeline stages read and write single columns, and ``Paper`` objects are
+only built when a row is accessed through a ``PaperView``. Aggregates such
+as decision or study type counts run over the integer codes.
+"""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union, overload
+
+from .core import Paper
+
+# Stands in for a missing sample size in the integer column
+_NO_SAMPLE_SIZE = -1
+
+_TEXT_COLUMNS = ('id', 'title', 'abstract', 'doi', 'url')
+_ENCODED_COLUMNS = ('journal', 'study_type', 'screening_decision', 'exclusion_reason')
+_LIST_COLUMNS = ('authors', 'keywords')
+_NUMBER_COLUMNS = ('year', 'sample_size', 'confidence_score')
+
+
+class _Dictionary:
+    """Maps distinct values to dense integer codes."""
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+
+    def encode(self, value: Any) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class _ListColumn:
+    """Dictionary-encoded lists of strings, flattened with row offsets."""
+
+    def __init__(self):
+        self.dictionary = _Dictionary()
+        self.codes = array('I')
+        self.offsets = array('Q', [0])
+
+    def append(self, values: Iterable[str]):
+        self.codes.extend(map(self.dictionary.encode, values))
+        self.offsets.append(len(self.codes))
+
+    def get(self, row: int) -> List[str]:
+        values = self.dictionary.values
+        return [values[code] for code in self.codes[self.offsets[row]:self.offsets[row + 1]]]
+
+
+class PaperStore:
+    """
+    Column-oriented storage for the papers of a review.
+
+    Rows are addressed by position. Rows are appended, never removed;
+    ``take`` builds a new store holding a subset of rows.
+    """
+
+    def __init__(self):
+        self._text: Dict[str, List[Optional[str]]] = {name: [] for name in _TEXT_COLUMNS}
+        self._dictionaries = {name: _Dictionary() for name in _ENCODED_COLUMNS}
+        self._codes = {name: array('I') for name in _ENCODED_COLUMNS}
+        self._lists = {name: _ListColumn() for name in _LIST_COLUMNS}
+        self._year = array('i')
+        self._sample_size = array('q')
+        self._confidence = array('d')
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[Paper]) -> "PaperStore":
+        store = cls()
+        for paper in papers:
+            store.append(paper)
+        return store
+
+    def __len__(self) -> int:
+        return len(self._year)
+
+    def append(self, paper: Paper) -> int:
+        """Add ``paper`` as a new row and return its row number."""
+        for name, column in self._text.items():
+            column.append(getattr(paper, name))
+        for name, codes in self._codes.items():
+            codes.append(self._dictionaries[name].encode(getattr(paper, name)))
+        for name, column in self._lists.items():
+            column.append(getattr(paper, name) or ())
+        self._year.append(paper.year or 0)
+        self._sample_size.append(_NO_SAMPLE_SIZE if paper.sample_size is None else paper.sample_size)
+        self._confidence.append(paper.confidence_score)
+        return len(self) - 1
+
+    def take(self, rows: Iterable[int]) -> "PaperStore":
+        """New store with the given rows, in the given order, copied column by column."""
+        rows = rows if isinstance(rows, (range, array, list)) else list(rows)
+        store = PaperStore()
+        for name, column in self._text.items():
+            store._text[name] = [column[row] for row in rows]
+        for name, codes in self._codes.items():
+            # Re-encoded, so values only used by other rows are not carried over
+            values, encode = self._dictionaries[name].values, store._dictionaries[name].encode
+            store._codes[name] = array('I', [encode(values[codes[row]]) for row in rows])
+        for name, column in self._lists.items():
+            for row in rows:
+                store._lists[name].append(column.get(row))
+        store._year = array('i', [self._year[row] for row in rows])
+        store._sample_size = array('q', [self._sample_size[row] for row in rows])
+        store._confidence = array('d', [self._confidence[row] for row in rows])
+        return store
+
+    def paper(self, row: int) -> Paper:
+        """Materialize row ``row`` as a Paper. Changes to it are not written back."""
+        sample_size = self._sample_size[row]
+        return Paper(
+            **{name: column[row] for name, column in self._text.items()},
+            **{name: self._dictionaries[name].values[codes[row]] for name, codes in self._codes.items()},
+            **{name: column.get(row) for name, column in self._lists.items()},
+            year=self._year[row],
+            sample_size=None if sample_size == _NO_SAMPLE_SIZE else sample_size,
+            confidence_score=self._confidence[row],
+        )
+
+    def view(self, rows: Optional[Iterable[int]] = None) -> "PaperView":
+        """Lazy sequence of Papers over ``rows`` (all rows by default)."""
+        return PaperView(self, range(len(self)) if rows is None else rows)
+
+    def get(self, name: str, row: int) -> Any:
+        """Value of column ``name`` at ``row``."""
+        if name in self._text:
+            return self._text[name][row]
+        if name in self._codes:
+            return self._dictionaries[name].values[self._codes[name][row]]
+        if name in self._lists:
+            return self._lists[name].get(row)
+        if name == 'sample_size':
+            value = self._sample_size[row]
+            return None if value == _NO_SAMPLE_SIZE else value
+        return self._numbers(name)[row]
+
+    def column(self, name: str, rows: Optional[Iterable[int]] = None) -> List[Any]:
+        """Values of column ``name`` for ``rows`` (all rows by default)."""
+        rows = range(len(self)) if rows is None else rows
+        return [self.get(name, row) for row in rows]
+
+    def set(self, name: str, row: int, value: Any):
+        """Write ``value`` to column ``name`` at ``row``."""
+        if name in self._text:
+            self._text[name][row] = value
+        elif name in self._codes:
+            self._codes[name][row] = self._dictionaries[name].encode(value)
+        elif name == 'sample_size':
+            self._sample_size[row] = _NO_SAMPLE_SIZE if value is None else value
+        elif name in _NUMBER_COLUMNS:
+            self._numbers(name)[row] = value
+        else:
+            raise KeyError(f"Column {name} cannot be set by row")
+
+    def set_screening(self, row: int, decision: str, reason: Optional[str], confidence: float):
+        """Record the screening decision of ``row``."""
+        self.set('screening_decision', row, decision)
+        self.set('exclusion_reason', row, reason)
+        self._confidence[row] = confidence
+
+    def value_counts(self, name: str, rows: Optional[Iterable[int]] = None) -> Dict[Any, int]:
+        """Count the values of a dictionary-encoded or integer column over ``rows``."""
+        if name in self._codes:
+            codes = self._codes[name]
+            counts = Counter(codes) if rows is None else Counter(map(codes.__getitem__, rows))
+            values = self._dictionaries[name].values
+            return {values[code]: count for code, count in counts.most_common()}
+        if name in self._lists:
+            column = self._lists[name]
+            rows = range(len(self)) if rows is None else rows
+            counts = Counter(
+                code for row in rows for code in column.codes[column.offsets[row]:column.offsets[row + 1]]
+            )
+            return {column.dictionary.values[code]: count for code, count in counts.most_common()}
+        counts = Counter(self.column(name, rows))
+        return dict(counts.most_common())
+
+    def _numbers(self, name: str) -> array:
+        if name == 'year':
+            return self._year
+        if name == 'confidence_score':
+            return self._confidence
+        raise KeyError(f"Unknown column: {name}")
+
+
+class PaperView(Sequence[Paper]):
+    """
+    Lazy, read-only sequence of Papers over rows of a PaperStore.
+    Papers are materialized on access; slicing returns another view.
+    """
+
+    def __init__(self, store: PaperStore, rows: Iterable[int]):
+        self.store = store
+        self.rows: Sequence[int] = rows if isinstance(rows, (range, array)) else array('Q', rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    @overload
+    def __getitem__(self, index: int) -> Paper: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PaperView": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Paper, "PaperView"]:
+        if isinstance(index, slice):
+            return PaperView(self.store, self.rows[index])
+        return self.store.paper(self.rows[index])
+
+    def __iter__(self) -> Iterator[Paper]:
+        return map(self.store.paper, self.rows)
+
+    def __repr__(self) -> str:
+        return f"PaperView({len(self)} papers)"
+
+
+__all__ = ['PaperStore', 'PaperView']
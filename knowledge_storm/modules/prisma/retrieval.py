@@ -0,0 +1,242 @@
+"""
+PRISMA Paper Retrieval.
+
+Runs the queries of a SearchStrategy against OpenAlex and Crossref through
+the STORM-Academic AcademicSourceService. Every (source, query) pair is
+streamed concurrently with cursor paging, records are mapped to ``Paper`` as
+they arrive, and exact duplicates (same DOI, or same title with the same
+year or first author) are dropped on the fly. The strategy's ``date_range`` is sent as a server-side filter, so
+out-of-range records are never downloaded.
+"""
+
+import asyncio
+import logging
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .core import Paper, SearchStrategy
+from .deduplication import MIN_TITLE_WORDS, normalize_title, same_study_metadata
+from ...services.utils import normalize_doi
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RESULTS_PER_QUERY = 1000
+# Papers buffered between the source streams and the consumer
+RETRIEVAL_BUFFER_SIZE = 500
+SOURCES = ('openalex', 'crossref')
+
+_BOOLEAN_SYNTAX_RE = re.compile(r'\b(?:AND|OR|NOT)\b|[()"*]')
+_TAG_RE = re.compile(r"<[^>]+>")
+_END_OF_STREAM = object()
+
+
+def _abstract_from_inverted_index(index: Optional[Dict[str, List[int]]]) -> str:
+    if not index:
+        return ""
+    words: Dict[int, str] = {}
+    for word, positions in index.items():
+        for position in positions:
+            words[position] = word
+    return " ".join(words[position] for position in sorted(words))
+
+
+def paper_from_openalex(work: Dict[str, Any]) -> Paper:
+    """Map an OpenAlex work to a Paper."""
+    doi = normalize_doi(work['doi']) if work.get('doi') else None
+    source = ((work.get('primary_location') or {}).get('source') or {})
+    return Paper(
+        id=(work.get('id') or "").rsplit("/", 1)[-1] or (doi or ""),
+        title=work.get('title') or "",
+        abstract=_abstract_from_inverted_index(work.get('abstract_inverted_index')),
+        authors=[
+            a['author']['display_name'] for a in work.get('authorships') or []
+            if (a.get('author') or {}).get('display_name')
+        ],
+        year=work.get('publication_year') or 0,
+        journal=source.get('display_name') or "",
+        doi=doi,
+        url=f"https://doi.org/{doi}" if doi else work.get('id'),
+        study_type=work.get('type'),
+    )
+
+
+def paper_from_crossref(item: Dict[str, Any]) -> Paper:
+    """Map a Crossref work to a Paper."""
+    doi = normalize_doi(item['DOI']) if item.get('DOI') else None
+    date_parts = (item.get('issued') or {}).get('date-parts') or [[None]]
+    abstract = _TAG_RE.sub(" ", item.get('abstract') or "")
+    return Paper(
+        id=doi or "",
+        title=" ".join(item.get('title') or []),
+        abstract=" ".join(abstract.split()),
+        authors=[
+            " ".join(part for part in (a.get('given'), a.get('family')) if part)
+            for a in item.get('author') or [] if a.get('family')
+        ],
+        year=date_parts[0][0] or 0,
+        journal=" ".join(item.get('container-title') or []),
+        doi=doi,
+        url=item.get('URL'),
+        study_type=item.get('type'),
+    )
+
+
+def _plain_query(query: str) -> str:
+    # Crossref ranks bibliographic free text and has no boolean syntax
+    return " ".join(_BOOLEAN_SYNTAX_RE.sub(" ", query).split())
+
+
+class _SeenPapers:
+    """Exact-duplicate filter for streamed papers, keyed by DOI and title."""
+
+    def __init__(self):
+        self.by_doi: Dict[str, Paper] = {}
+        self.by_title: Dict[str, List[Paper]] = {}
+
+    def add(self, paper: Paper) -> bool:
+        """Record ``paper``; returns False if it duplicates an earlier one."""
+        kept = self.by_doi.get(paper.doi) if paper.doi else None
+        title = normalize_title(paper.title)
+        if title.count(" ") + 1 < MIN_TITLE_WORDS:
+            title = ""
+        if kept is None and title:
+            # Same title, no conflicting DOI, and same year or first author
+            kept = next((
+                other for other in self.by_title.get(title, ())
+                if not (other.doi and paper.doi and other.doi != paper.doi)
+                and same_study_metadata(other.year, other.authors, paper.year, paper.authors)
+            ), None)
+        if kept is not None:
+            # The first record was already handed out; complete it in place
+            kept.abstract = kept.abstract or paper.abstract
+            if not kept.doi and paper.doi:
+                kept.doi = paper.doi
+                self.by_doi[paper.doi] = kept
+            return False
+        if paper.doi:
+            self.by_doi[paper.doi] = paper
+        if title:
+            self.by_title.setdefault(title, []).append(paper)
+        return True
+
+
+class PaperRetriever:
+    """
+    Concurrent multi-database paper retrieval for a SearchStrategy.
+
+    Queries that are identical across the strategy's databases run once per
+    source. Sources that fail are logged and skipped, so one unavailable API
+    does not stop the review; pass a ``failed_sources`` list to find out
+    which (source, query) streams were cut short.
+    """
+
+    def __init__(self, academic_source_service,
+                 max_results_per_query: Optional[int] = DEFAULT_MAX_RESULTS_PER_QUERY,
+                 sources: Tuple[str, ...] = SOURCES):
+        self.academic_source_service = academic_source_service
+        self.max_results_per_query = max_results_per_query
+        self.sources = sources
+
+    async def iter_papers(self, search_strategy: SearchStrategy, ordered: bool = False,
+                          failed_sources: Optional[List[Dict[str, Any]]] = None) -> AsyncIterator[Paper]:
+        """
+        Yield the distinct papers found for the strategy.
+
+        All streams are fetched concurrently. By default papers are yielded as
+        they arrive, so their order varies between runs. With ``ordered`` they
+        are yielded query by query in source order, which makes the sequence
+        reproducible; later streams are buffered until their turn.
+
+        Each stream that fails appends ``{'source', 'query', 'records',
+        'error'}`` to ``failed_sources``; ``records`` counts what it delivered
+        before failing.
+        """
+        queries = list(dict.fromkeys(q for q in search_strategy.search_queries.values() if q))
+        streams = [(source, query) for query in queries for source in self.sources]
+        if not streams:
+            return
+        if ordered:
+            buffers: List[asyncio.Queue] = [asyncio.Queue() for _ in streams]
+            readers = [(buffer, 1) for buffer in buffers]
+        else:
+            buffers = [asyncio.Queue(maxsize=RETRIEVAL_BUFFER_SIZE)] * len(streams)
+            readers = [(buffers[0], len(streams))]
+
+        async def pump(buffer: asyncio.Queue, source: str, query: str) -> None:
+            count = 0
+            try:
+                async for paper in self._search(source, query, search_strategy.date_range):
+                    await buffer.put(paper)
+                    count += 1
+            except Exception as e:
+                logger.warning(f"Retrieval from {source} failed after {count} records for query {query}: {e}")
+                if failed_sources is not None:
+                    failed_sources.append({'source': source, 'query': query, 'records': count, 'error': str(e)})
+            else:
+                logger.info(f"Retrieved {count} records from {source} for query: {query}")
+            # Not reached on cancellation, when nobody is reading the buffer
+            await buffer.put(_END_OF_STREAM)
+
+        tasks = [
+            asyncio.ensure_future(pump(buffer, source, query))
+            for buffer, (source, query) in zip(buffers, streams)
+        ]
+        seen = _SeenPapers()
+        try:
+            for buffer, running in readers:
+                while running:
+                    paper = await buffer.get()
+                    if paper is _END_OF_STREAM:
+                        running -= 1
+                    elif seen.add(paper):
+                        yield paper
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def retrieve(self, search_strategy: SearchStrategy, max_papers: Optional[int] = None,
+                       failed_sources: Optional[List[Dict[str, Any]]] = None) -> List[Paper]:
+        """
+        Collect up to ``max_papers`` distinct papers for the strategy.
+
+        Papers are taken query by query in source order (see ``iter_papers``),
+        so the same responses always give the same selection, whichever API
+        answers first.
+        """
+        papers: List[Paper] = []
+        if max_papers is not None and max_papers <= 0:
+            return papers
+        stream = self.iter_papers(search_strategy, ordered=True, failed_sources=failed_sources)
+        try:
+            async for paper in stream:
+                papers.append(paper)
+                if len(papers) == max_papers:
+                    break
+        finally:
+            await stream.aclose()
+        return papers
+
+    async def _search(self, source: str, query: str,
+                      date_range: Optional[Tuple[int, int]]) -> AsyncIterator[Paper]:
+        service = self.academic_source_service
+        if source == 'openalex':
+            filters = None
+            if date_range:
+                filters = {
+                    'from_publication_date': f"{date_range[0]}-01-01",
+                    'to_publication_date': f"{date_range[1]}-12-31",
+                }
+            async for work in service.iter_openalex(query, self.max_results_per_query, filters):
+                yield paper_from_openalex(work)
+        elif source == 'crossref':
+            filters = None
+            if date_range:
+                filters = {'from-pub-date': str(date_range[0]), 'until-pub-date': str(date_range[1])}
+            async for item in service.iter_crossref(_plain_query(query), self.max_results_per_query, filters):
+                yield paper_from_crossref(item)
+        else:
+            raise ValueError(f"Unsupported retrieval source: {source}")
+
+
+__all__ = ['PaperRetriever', 'paper_from_openalex', 'paper_from_crossref']
@@ -0,0 +1,366 @@
+"""
+Compiled Rule Engine for PRISMA Text Screening.
+
+Shared matcher for the regex rule tables used by screening and abstract
+analysis. Rule tables map a category to a list of patterns; every pattern is
+compiled once per distinct table and guarded by literal trigger terms
+derived from the pattern itself, one of which every match must contain
+(``animal``, ``mice`` ... for ``\\b(animal|mice|...)\\b``). A pattern only
+runs when one of its triggers occurs in the text, so an abstract costs a
+handful of substring checks plus the few regexes that can actually match.
+
+Free-text inclusion/exclusion criteria are compiled into a ``CriteriaIndex``,
+an inverted index from keyword tokens to criteria, so each paper is
+tokenized once and matched by set intersection.
+"""
+
+import logging
+import re
+import string
+from collections import defaultdict
+from functools import lru_cache
+from typing import Collection, Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+# Triggers and lowercase regexes are derived from the parse trees of
+# ``re``'s internal parser, which is undocumented and changes between Python
+# versions. Only the opcodes listed here are understood. A pattern using any
+# other opcode gets neither, and if the parser is missing or fails the
+# self-check below, no pattern does; matching then falls back to plain
+# ``regex.search`` for every rule.
+try:
+    try:
+        from re import _parser as sre_parse  # Python 3.11+
+    except ImportError:  # pragma: no cover - older interpreters
+        import sre_parse
+    _BRANCH = sre_parse.BRANCH
+    _IN = sre_parse.IN
+    _LITERAL = sre_parse.LITERAL
+    _NOT_LITERAL = sre_parse.NOT_LITERAL
+    _RANGE = sre_parse.RANGE
+    _ASSERTS = (sre_parse.ASSERT, sre_parse.ASSERT_NOT)
+    _CASELESS_OPS = (sre_parse.AT, sre_parse.ANY, sre_parse.CATEGORY, sre_parse.GROUPREF, sre_parse.NEGATE)
+    _REPEATS = (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT)
+    _SUBPATTERN = sre_parse.SUBPATTERN
+except (ImportError, AttributeError):  # pragma: no cover - parser internals changed
+    sre_parse = None
+
+logger = logging.getLogger(__name__)
+
+RuleTable = Mapping[str, Sequence[str]]
+
+_WORD_RE = re.compile(r"\w+")
+_PUNCTUATION_TO_SPACE = str.maketrans({c: ' ' for c in string.punctuation})
+
+
+class RuleMatch(NamedTuple):
+    """First match of one rule pattern."""
+    category: str
+    pattern: str
+    match: "re.Match[str]"
+
+
+class _Rule(NamedTuple):
+    category: str
+    pattern: str
+    regex: "re.Pattern[str]"
+    triggers: Optional[Tuple[str, ...]]  # None: always run
+    lowercase_regex: Optional["re.Pattern[str]"]  # Same matches on lowercase ASCII text
+
+
+def _best(candidates: List[FrozenSet[str]]) -> Optional[FrozenSet[str]]:
+    # Longer literals are more selective; on ties prefer punctuation, which
+    # is rarer in prose than single letters ("=" over "n" in "n\\s*=\\s*\\d+")
+    def selectivity(candidate):
+        return min(map(len, candidate)), any(not c.isalnum() for t in candidate for c in t)
+    return max(candidates, key=selectivity) if candidates else None
+
+
+def _required_literals(items) -> Optional[FrozenSet[str]]:
+    """
+    Literal strings at least one of which every match of ``items`` contains.
+    Returns None when no such set can be derived.
+    """
+    candidates: List[FrozenSet[str]] = []
+    run = ""
+    for op, av in items:
+        if op is _LITERAL and av < 128:
+            run += chr(av).lower()
+            continue
+        if run:
+            candidates.append(frozenset([run]))
+            run = ""
+        if op is _SUBPATTERN:
+            required = _required_literals(av[-1])
+        elif op is _BRANCH:
+            branches = [_required_literals(branch) for branch in av[1]]
+            required = None if None in branches else frozenset().union(*branches)
+        elif op in _REPEATS and av[0] >= 1:
+            required = _required_literals(av[2])
+        elif op is _IN and all(o is _LITERAL and a < 128 for o, a in av):
+            required = frozenset(chr(a).lower() for _, a in av)
+        else:
+            required = None
+        if required:
+            candidates.append(required)
+    if run:
+        candidates.append(frozenset([run]))
+    return _best(candidates)
+
+
+def _has_cased_literals(items) -> bool:
+    """Whether ``items`` contain a character that IGNORECASE matches in another case."""
+    for op, av in items:
+        if op is _LITERAL or op is _NOT_LITERAL:
+            if av > 127 or chr(av).isupper():
+                return True
+        elif op is _RANGE:
+            if av[1] > 127 or (av[0] <= ord('Z') and av[1] >= ord('A')):
+                return True
+        elif op is _IN:
+            if _has_cased_literals(av):
+                return True
+        elif op is _SUBPATTERN:
+            if _has_cased_literals(av[-1]):
+                return True
+        elif op is _BRANCH:
+            if any(_has_cased_literals(branch) for branch in av[1]):
+                return True
+        elif op in _REPEATS or op in _ASSERTS:
+            if _has_cased_literals(av[-1]):
+                return True
+        elif op not in _CASELESS_OPS:
+            # Possessive and atomic groups, conditionals: not worth the detail
+            return True
+    return False
+
+
+def _known_ops(items) -> bool:
+    """Whether ``items`` only use opcodes, and operand layouts, understood here."""
+    for op, av in items:
+        if op is _LITERAL or op is _NOT_LITERAL or op in _CASELESS_OPS:
+            if av is not None and not isinstance(av, int):
+                return False
+        elif op is _RANGE:
+            if not (isinstance(av, tuple) and len(av) == 2):
+                return False
+        elif op is _IN:
+            if not _known_ops(av):
+                return False
+        elif op is _SUBPATTERN or op in _REPEATS or op in _ASSERTS:
+            if not (isinstance(av, tuple) and _known_ops(av[-1])):
+                return False
+        elif op is _BRANCH:
+            if not (isinstance(av, tuple) and all(_known_ops(branch) for branch in av[1])):
+                return False
+        else:
+            return False
+    return True
+
+
+def _parse(pattern: str, flags: int):
+    """Parse tree of ``pattern``, or None if it cannot be analyzed safely."""
+    if not _ANALYSIS_ENABLED:
+        return None
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+        return parsed if _known_ops(parsed) else None
+    except Exception:
+        return None
+
+
+def _lowercase_regex(pattern: str, flags: int, parsed) -> Optional["re.Pattern[str]"]:
+    # IGNORECASE disables the regex engine's literal prefix search; on text
+    # without uppercase letters a pattern without them needs no case folding
+    if parsed is None or not flags & re.IGNORECASE or _has_cased_literals(parsed):
+        return None
+    return re.compile(pattern, flags & ~re.IGNORECASE)
+
+
+def _triggers(parsed) -> Optional[Tuple[str, ...]]:
+    literals = _required_literals(parsed) if parsed is not None else None
+    if not literals:
+        return None
+    # "rat" already covers "rats"
+    return tuple(sorted(t for t in literals if not any(u != t and u in t for u in literals)))
+
+
+# Patterns with the analysis each must yield; if the parser disagrees, its
+# trees no longer look the way this module expects
+_SELF_CHECK = (
+    (r'\b(animal|mice|rats?)\b', ('animal', 'mice', 'rat'), True),
+    (r'^(editorial|comment)', ('comment', 'editorial'), True),
+    (r'n\s*=\s*\d+', ('=',), True),
+    (r'(?:odds|hazard)\s+ratio', ('ratio',), True),
+    (r'[A-Z]{3}-\d+', ('-',), False),
+    (r'CI\s+95', ('ci',), False),
+    (r'\d+', None, True),
+)
+
+
+def _self_check() -> bool:
+    for pattern, triggers, lowercase in _SELF_CHECK:
+        try:
+            parsed = sre_parse.parse(pattern, re.IGNORECASE)
+            if not _known_ops(parsed):
+                return False
+            if _triggers(parsed) != triggers or (not _has_cased_literals(parsed)) != lowercase:
+                return False
+        except Exception:
+            return False
+    return True
+
+
+_ANALYSIS_ENABLED = sre_parse is not None and _self_check()
+if not _ANALYSIS_ENABLED:  # pragma: no cover - depends on the interpreter
+    logger.warning("Regex parse trees not understood on this Python; rule triggers are disabled")
+
+
+class RuleSet:
+    """
+    Compiled rule table.
+
+    Rules keep the order of the table (categories first, then patterns), and
+    all lookups report them in that order, matching a plain loop of
+    ``re.search`` calls over the table.
+    """
+
+    def __init__(self, table: RuleTable, flags: int = re.IGNORECASE):
+        self.flags = flags
+        self._rules = []
+        for category, patterns in table.items():
+            for pattern in patterns:
+                parsed = _parse(pattern, flags)
+                self._rules.append(_Rule(category, pattern, re.compile(pattern, flags), _triggers(parsed),
+                                         _lowercase_regex(pattern, flags, parsed)))
+
+    @property
+    def categories(self) -> List[str]:
+        return list(dict.fromkeys(rule.category for rule in self._rules))
+
+    def iter_matches(self, text: str, first_per_category: bool = False):
+        """Yield a RuleMatch for every rule matching ``text``, in table order."""
+        # Case-insensitive matching may pair non-ASCII characters with ASCII
+        # triggers (e.g. the Kelvin sign and "k"), so only ASCII text is filtered
+        ascii_text = text.isascii()
+        lowered = text.lower() if ascii_text else text
+        already_lowered = ascii_text and lowered == text
+        matched_categories = set()
+        for rule in self._rules:
+            if first_per_category and rule.category in matched_categories:
+                continue
+            if ascii_text and rule.triggers is not None and not any(t in lowered for t in rule.triggers):
+                continue
+            regex = rule.lowercase_regex if already_lowered and rule.lowercase_regex else rule.regex
+            match = regex.search(text)
+            if match:
+                matched_categories.add(rule.category)
+                yield RuleMatch(rule.category, rule.pattern, match)
+
+    def matches(self, text: str) -> List[RuleMatch]:
+        """All matching rules in table order."""
+        return list(self.iter_matches(text))
+
+    def first(self, text: str) -> Optional[RuleMatch]:
+        """First matching rule in table order."""
+        return next(self.iter_matches(text), None)
+
+    def matched_categories(self, text: str) -> List[str]:
+        """Distinct matching categories in table order."""
+        return [m.category for m in self.iter_matches(text, first_per_category=True)]
+
+
+@lru_cache(maxsize=64)
+def _compile_frozen(table: Tuple[Tuple[str, Tuple[str, ...]], ...], flags: int) -> RuleSet:
+    return RuleSet(dict(table), flags)
+
+
+def compile_rules(table: RuleTable, flags: int = re.IGNORECASE) -> RuleSet:
+    """
+    Get the compiled RuleSet for a rule table.
+
+    Compiled sets are cached by table contents, so instances sharing the
+    default tables share one RuleSet and edits to a table take effect on the
+    next call.
+    """
+    frozen = tuple((category, tuple(patterns)) for category, patterns in table.items())
+    return _compile_frozen(frozen, flags)
+
+
+def _word_forms(token: str) -> FrozenSet[str]:
+    """Singular and simple plural forms of a keyword token."""
+    stem = token
+    if len(token) > 4 and token.endswith('ies'):
+        stem = token[:-3] + 'y'
+    elif len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        stem = token[:-1]
+    forms = {token, stem, stem + 's', stem + 'es'}
+    if stem.endswith('y'):
+        forms.add(stem[:-1] + 'ies')
+    return frozenset(forms)
+
+
+def text_tokens(text: str) -> List[str]:
+    """Lowercased word tokens of ``text``, for CriteriaIndex lookups."""
+    lowered = text.lower()
+    if lowered.isascii():
+        # Several times faster than a regex scan
+        return lowered.translate(_PUNCTUATION_TO_SPACE).split()
+    return _WORD_RE.findall(lowered)
+
+
+class CriteriaIndex:
+    """
+    Keyword criteria compiled into an inverted index.
+
+    A criterion matches when any of its whitespace-separated keywords occurs
+    in the text as a whole word, in singular or simple plural form. Keywords
+    made of several word tokens, like "follow-up", need all of their tokens.
+    The plural forms are expanded into the index, so texts are only split
+    into words.
+    """
+
+    def __init__(self, criteria: Sequence[str]):
+        self.criteria = tuple(criteria)
+        self._index: Dict[str, List[int]] = defaultdict(list)
+        self._compound: List[Tuple[Tuple[FrozenSet[str], ...], int]] = []
+        for position, criterion in enumerate(self.criteria):
+            for keyword in criterion.lower().split():
+                tokens = text_tokens(keyword)
+                if len(tokens) == 1:
+                    for form in _word_forms(tokens[0]):
+                        if position not in self._index[form]:
+                            self._index[form].append(position)
+                elif tokens:
+                    self._compound.append((tuple(_word_forms(t) for t in tokens), position))
+        self._index = dict(self._index)
+        self._vocabulary = frozenset(self._index).union(
+            *(forms for parts, _ in self._compound for forms in parts)
+        )
+
+    def matching(self, tokens: Collection[str]) -> List[int]:
+        """Positions of the criteria matched by a text's tokens, in criteria order."""
+        present = self._vocabulary.intersection(tokens)
+        matched = set()
+        for token in present:
+            matched.update(self._index.get(token, ()))
+        for parts, position in self._compound:
+            if position not in matched and all(not forms.isdisjoint(present) for forms in parts):
+                matched.add(position)
+        return sorted(matched)
+
+    def count_matches(self, tokens: Collection[str]) -> int:
+        """Number of criteria matched by a text's tokens (see ``text_tokens``)."""
+        return len(self.matching(tokens))
+
+
+@lru_cache(maxsize=64)
+def _compile_criteria_frozen(criteria: Tuple[str, ...]) -> CriteriaIndex:
+    return CriteriaIndex(criteria)
+
+
+def compile_criteria(criteria: Sequence[str]) -> CriteriaIndex:
+    """Get the CriteriaIndex for a list of criteria, cached by contents."""
+    return _compile_criteria_frozen(tuple(criteria))
+
+
+__all__ = ['RuleMatch', 'RuleSet', 'compile_rules', 'CriteriaIndex', 'compile_criteria', 'text_tokens']
@@ -5,12 +5,21 @@ Focused module for automated paper screening implementing the 80/20 methodology.
 Targets 80% automation rate with 80% confidence for systematic review screening.
 """
 
-import re
+import asyncio
+import json
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple,
+    Union
+)
 from collections import defaultdict
 
 from .core import Paper, SearchStrategy, ScreeningResult
+from .rule_engine import compile_criteria, compile_rules, text_tokens
 
 # Integration with existing STORM-Academic VERIFY system
 try:
@@ -27,6 +36,174 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_VERIFY_CONCURRENCY = 8
+# Below this batch size process start-up costs more than the regex phase
+PROCESS_POOL_MIN_PAPERS = 5000
+VERIFY_MIN_INCLUSION_SCORE = 2
+# 80% confidence for automatic include / exclude decisions
+CONFIDENCE_THRESHOLD_INCLUDE = 0.8
+CONFIDENCE_THRESHOLD_EXCLUDE = 0.8
+
+PaperStream = Union[Iterable[Paper], AsyncIterable[Paper]]
+
+
+@dataclass
+class ScreeningDecision:
+    """Screening decision for one paper, as yielded by streaming screening."""
+    paper: Paper
+    decision: str  # include, exclude, maybe
+    reason: str
+    confidence: float
+    bucket: str  # definitely_include, definitely_exclude or needs_human_review
+
+
+class ScreeningStats:
+    """
+    Running 80/20 screening statistics.
+    Holds only counters, so it can track reviews of any size.
+    """
+    
+    def __init__(self):
+        self.total_papers = 0
+        self.bucket_counts = {'definitely_exclude': 0, 'definitely_include': 0, 'needs_human_review': 0}
+        self.exclusion_stats = defaultdict(int)
+        self.confidence_distribution = {'high': 0, 'medium': 0, 'low': 0}
+        self.verify_system_checks = 0
+    
+    def record(self, decision: str, reason: str, confidence: float) -> str:
+        """Count a decision and return the bucket it falls in."""
+        self.total_papers += 1
+        # Apply 80% confidence thresholds
+        if decision == 'exclude' and confidence >= CONFIDENCE_THRESHOLD_EXCLUDE:
+            bucket = 'definitely_exclude'
+            self.exclusion_stats[reason] += 1
+            self.confidence_distribution['high'] += 1
+        elif decision == 'include' and confidence >= CONFIDENCE_THRESHOLD_INCLUDE:
+            bucket = 'definitely_include'
+            self.confidence_distribution['high'] += 1
+        else:
+            # Low confidence - needs human review
+            bucket = 'needs_human_review'
+            if confidence >= 0.5:
+                self.confidence_distribution['medium'] += 1
+            else:
+                self.confidence_distribution['low'] += 1
+        self.bucket_counts[bucket] += 1
+        return bucket
+    
+    @property
+    def performance_metrics(self) -> Dict[str, Any]:
+        """80/20 performance metrics for the decisions recorded so far."""
+        automated_decisions = self.bucket_counts['definitely_exclude'] + self.bucket_counts['definitely_include']
+        automation_rate = automated_decisions / self.total_papers if self.total_papers > 0 else 0
+        return {
+            'total_papers': self.total_papers,
+            'automated_decisions': automated_decisions,
+            'human_review_needed': self.bucket_counts['needs_human_review'],
+            'automation_rate': automation_rate,
+            'target_automation': 0.8,  # 80% target
+            'meets_80_20_target': automation_rate >= 0.6  # Allow some flexibility
+        }
+
+
+def iter_papers_jsonl(path: str) -> Iterator[Paper]:
+    """Read papers lazily from a JSON Lines file, one paper object per line."""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield Paper.from_dict(json.loads(line))
+
+
+async def _paper_chunks(papers: PaperStream, size: int) -> AsyncIterator[List[Paper]]:
+    chunk = []
+    if isinstance(papers, AsyncIterable):
+        async for paper in papers:
+            chunk.append(paper)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    else:
+        for paper in papers:
+            chunk.append(paper)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+class _RuleOutcome(NamedTuple):
+    """Result of the CPU-bound rule phase for one paper."""
+    exclusion: Optional[Tuple[str, str, float]]
+    inclusion_score: int
+    inclusion_reasons: List[str]
+    criteria_matches: int
+    exclusion_matches: int
+
+
+def _paper_text(paper: Paper) -> str:
+    return f"{paper.title} {paper.abstract}".lower()
+
+
+def _exclusion_decision(exclusion_patterns: Dict[str, List[str]],
+                        text: str) -> Optional[Tuple[str, str, float]]:
+    match = compile_rules(exclusion_patterns).first(text)
+    if match:
+        confidence = 0.9  # High confidence exclusion
+        return 'exclude', f"Excluded: {match.category.replace('_', ' ')}", confidence
+    return None
+
+
+def _inclusion_indicators(inclusion_indicators: Dict[str, List[str]], text: str) -> Tuple[int, List[str]]:
+    matches = compile_rules(inclusion_indicators).matches(text)
+    inclusion_reasons = [match.category.replace('_', ' ') for match in matches]
+    return len(inclusion_reasons), inclusion_reasons
+
+
+def _count_criteria_matches(criteria: Sequence[str], text: str) -> int:
+    return compile_criteria(criteria).count_matches(text_tokens(text))
+
+
+def _apply_rules(exclusion_patterns: Dict[str, List[str]],
+                 inclusion_indicators: Dict[str, List[str]],
+                 inclusion_criteria: Sequence[str],
+                 exclusion_criteria: Sequence[str],
+                 texts: Sequence[str]) -> List[_RuleOutcome]:
+    """
+    Run the rule phase over a chunk of screening texts.
+    Module-level and argument-only so chunks can run in worker processes.
+    """
+    inclusion_index = compile_criteria(inclusion_criteria)
+    exclusion_index = compile_criteria(exclusion_criteria)
+    outcomes = []
+    for text in texts:
+        exclusion = _exclusion_decision(exclusion_patterns, text)
+        if exclusion:
+            outcomes.append(_RuleOutcome(exclusion, 0, [], 0, 0))
+            continue
+        inclusion_score, inclusion_reasons = _inclusion_indicators(inclusion_indicators, text)
+        # Tokenize once for both criteria indexes
+        tokens = text_tokens(text)
+        outcomes.append(_RuleOutcome(
+            None,
+            inclusion_score,
+            inclusion_reasons,
+            inclusion_index.count_matches(tokens),
+            exclusion_index.count_matches(tokens),
+        ))
+    return outcomes
+
+
+# Errors after which a process pool is given up for in-process screening
+_POOL_ERRORS = (BrokenProcessPool, OSError, pickle.PicklingError)
+
+
+def _shutdown_pool(pool: Optional[Executor]):
+    """Shut ``pool`` down without blocking the event loop on its workers."""
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
 
 class ScreeningAssistant:
     """
@@ -36,10 +213,22 @@ class ScreeningAssistant:
     Integrated with STORM-Academic VERIFY system for enhanced validation.
     """
     
-    def __init__(self, citation_verifier: Optional[CitationVerifier] = None):
+    def __init__(self, citation_verifier: Optional[CitationVerifier] = None,
+                 max_workers: Optional[int] = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 verify_concurrency: int = DEFAULT_VERIFY_CONCURRENCY,
+                 process_pool_min_papers: int = PROCESS_POOL_MIN_PAPERS):
         # Integration with existing VERIFY system
         self.citation_verifier = citation_verifier or CitationVerifier()
         
+        # Batch screening: the rule phase runs over chunks of papers, in a
+        # process pool for large batches (max_workers=1 keeps it in-process),
+        # and at most verify_concurrency VERIFY lookups run at once
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.verify_concurrency = verify_concurrency
+        self.process_pool_min_papers = process_pool_min_papers
+        
         # High-confidence exclusion patterns (>90% confidence)
         self.exclusion_patterns = {
             'wrong_population': [
@@ -97,119 +286,179 @@ class ScreeningAssistant:
         - Leave ~20% for human review where confidence is lower
         
         Enhanced with VERIFY system for additional validation.
+        
+        Papers are screened as a batch: the rule phase runs over chunks (in
+        worker processes for large batches) and VERIFY lookups run
+        concurrently. Results keep the input order.
         """
         results = {
             'definitely_exclude': [],
             'definitely_include': [],
             'needs_human_review': [],
-            'exclusion_stats': defaultdict(int),
-            'confidence_distribution': {'high': 0, 'medium': 0, 'low': 0},
-            'performance_metrics': {},
-            'verify_system_checks': 0  # Track VERIFY integration
         }
+        stats = ScreeningStats()
         
-        # Track for 80/20 metrics
-        total_papers = len(papers)
-        confidence_threshold_include = 0.8  # 80% confidence for auto-include
-        confidence_threshold_exclude = 0.8  # 80% confidence for auto-exclude
+        outcomes = await self._apply_rules_batch([_paper_text(paper) for paper in papers], criteria)
+        decisions = await self._decide_batch(papers, outcomes, stats)
         
-        for paper in papers:
-            decision, reason, confidence = await self._screen_single_paper(paper, criteria)
-            
+        for paper, (decision, reason, confidence) in zip(papers, decisions):
             # Store screening decision
             paper.screening_decision = decision
             paper.exclusion_reason = reason
             paper.confidence_score = confidence
-            
-            # Apply 80% confidence thresholds
-            if decision == 'exclude' and confidence >= confidence_threshold_exclude:
-                results['definitely_exclude'].append(paper)
-                results['exclusion_stats'][reason] += 1
-                results['confidence_distribution']['high'] += 1
-            elif decision == 'include' and confidence >= confidence_threshold_include:
-                results['definitely_include'].append(paper)
-                results['confidence_distribution']['high'] += 1
-            else:
-                # Low confidence - needs human review
-                results['needs_human_review'].append(paper)
-                if confidence >= 0.5:
-                    results['confidence_distribution']['medium'] += 1
-                else:
-                    results['confidence_distribution']['low'] += 1
+            results[stats.record(decision, reason, confidence)].append(paper)
         
-        # Calculate 80/20 performance metrics
-        automated_decisions = len(results['definitely_exclude']) + len(results['definitely_include'])
-        automation_rate = automated_decisions / total_papers if total_papers > 0 else 0
-        
-        results['performance_metrics'] = {
-            'total_papers': total_papers,
-            'automated_decisions': automated_decisions,
-            'human_review_needed': len(results['needs_human_review']),
-            'automation_rate': automation_rate,
-            'target_automation': 0.8,  # 80% target
-            'meets_80_20_target': automation_rate >= 0.6  # Allow some flexibility
-        }
+        results['exclusion_stats'] = stats.exclusion_stats
+        results['confidence_distribution'] = stats.confidence_distribution
+        results['performance_metrics'] = stats.performance_metrics
+        results['verify_system_checks'] = stats.verify_system_checks  # Track VERIFY integration
+        automation_rate = stats.performance_metrics['automation_rate']
         
         logger.info(f"PRISMA Screening completed: {automation_rate:.1%} automation rate")
         
         return results
     
-    async def _screen_single_paper(self, paper: Paper, 
-                                  criteria: SearchStrategy) -> Tuple[str, str, float]:
+    async def screen_stream(self, papers: PaperStream, criteria: SearchStrategy,
+                            stats: Optional[ScreeningStats] = None) -> AsyncIterator[ScreeningDecision]:
         """
-        Screen a single paper and return (decision, reason, confidence).
-        Enhanced with VERIFY system for additional validation.
+        Screen a stream of papers, yielding decisions in input order.
+        
+        ``papers`` may be any iterable or async iterable, such as a
+        cursor-paginated search or ``iter_papers_jsonl``. Papers are read a
+        window at a time and not retained, so memory stays constant however
+        long the stream is. Pass ``stats`` to follow the running
+        exclusion_stats, confidence_distribution and 80/20 metrics.
+        """
+        stats = stats if stats is not None else ScreeningStats()
+        pool: Optional[ProcessPoolExecutor] = None
+        use_pool = self.max_workers != 1
+        pool_window = max(self.chunk_size, self.process_pool_min_papers)
+        try:
+            async for window in _paper_chunks(papers, pool_window if use_pool else self.chunk_size):
+                texts = [_paper_text(p) for p in window]
+                try:
+                    if pool is None and use_pool and len(window) >= self.process_pool_min_papers:
+                        pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                    outcomes = await self._apply_rules_batch(texts, criteria, pool, use_pool)
+                except _POOL_ERRORS as e:
+                    logger.warning(f"Process pool screening unavailable, screening the rest of the stream in-process: {e}")
+                    _shutdown_pool(pool)
+                    pool, use_pool = None, False
+                    outcomes = await self._apply_rules_batch(texts, criteria, use_pool=False)
+                decisions = await self._decide_batch(window, outcomes, stats)
+                for paper, (decision, reason, confidence) in zip(window, decisions):
+                    paper.screening_decision = decision
+                    paper.exclusion_reason = reason
+                    paper.confidence_score = confidence
+                    bucket = stats.record(decision, reason, confidence)
+                    yield ScreeningDecision(paper, decision, reason, confidence, bucket)
+        finally:
+            _shutdown_pool(pool)
+        
+        logger.info(
+            f"PRISMA streaming screening completed: {stats.performance_metrics['automation_rate']:.1%} "
+            f"automation rate over {stats.total_papers} papers"
+        )
+    
+    async def _apply_rules_batch(self, texts: List[str], criteria: SearchStrategy,
+                                 pool: Optional[Executor] = None,
+                                 use_pool: bool = True) -> List[_RuleOutcome]:
+        """
+        Run the rule phase over all texts in chunks, preserving order.
+        Uses ``pool`` if given, otherwise a process pool for large batches;
+        ``use_pool=False`` keeps it in-process. Failures of a given ``pool``
+        are raised so the caller can drop it; if the batch's own pool fails,
+        the batch is screened in-process.
         """
-        text = f"{paper.title} {paper.abstract}".lower()
+        rule_args = (self.exclusion_patterns, self.inclusion_indicators,
+                     criteria.inclusion_criteria, criteria.exclusion_criteria)
+        chunks = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
         
-        # Check high-confidence exclusion patterns first
-        exclusion_result = self._check_exclusion_patterns(text)
-        if exclusion_result:
-            return exclusion_result
+        if len(chunks) > 1 and use_pool and pool is not None:
+            return await self._apply_rules_in_pool(pool, rule_args, chunks)
+        if len(chunks) > 1 and use_pool and len(texts) >= self.process_pool_min_papers and self.max_workers != 1:
+            own_pool = None
+            try:
+                own_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                return await self._apply_rules_in_pool(own_pool, rule_args, chunks)
+            except _POOL_ERRORS as e:
+                logger.warning(f"Process pool screening unavailable, screening in-process: {e}")
+            finally:
+                _shutdown_pool(own_pool)
         
-        # Check inclusion indicators
-        inclusion_score, inclusion_reasons = self._check_inclusion_indicators(text)
+        outcomes = []
+        for chunk in chunks:
+            outcomes.extend(_apply_rules(*rule_args, chunk))
+            await asyncio.sleep(0)  # Let other tasks run between chunks
+        return outcomes
+    
+    @staticmethod
+    async def _apply_rules_in_pool(pool: Executor, rule_args: Tuple, chunks: List[List[str]]) -> List[_RuleOutcome]:
+        loop = asyncio.get_running_loop()
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(pool, _apply_rules, *rule_args, chunk) for chunk in chunks
+        ))
+        return [outcome for part in parts for outcome in part]
+    
+    async def _decide_batch(self, papers: List[Paper], outcomes: List[_RuleOutcome],
+                            stats: ScreeningStats) -> List[Tuple[str, str, float]]:
+        """Run VERIFY lookups concurrently and make the screening decisions in input order."""
+        semaphore = asyncio.Semaphore(self.verify_concurrency)
+        
+        async def decide(paper: Paper, outcome: _RuleOutcome) -> Tuple[str, str, float]:
+            async with semaphore:
+                return await self._decide(paper, outcome)
+        
+        decisions: List[Any] = [None] * len(papers)
+        pending = {}
+        for index, (paper, outcome) in enumerate(zip(papers, outcomes)):
+            if outcome.exclusion or outcome.inclusion_score < VERIFY_MIN_INCLUSION_SCORE:
+                decisions[index] = await self._decide(paper, outcome)
+            else:
+                pending[index] = decide(paper, outcome)
+        for index, decision in zip(pending, await asyncio.gather(*pending.values())):
+            decisions[index] = decision
+        stats.verify_system_checks += len(pending)
+        return decisions
+    
+    async def _decide(self, paper: Paper, outcome: _RuleOutcome) -> Tuple[str, str, float]:
+        # High-confidence exclusion patterns take precedence
+        if outcome.exclusion:
+            return outcome.exclusion
         
         # Enhanced validation with VERIFY system for high-quality papers
         inclusion_score, inclusion_reasons = await self._verify_with_system(
-            paper, inclusion_score, inclusion_reasons
+            paper, outcome.inclusion_score, list(outcome.inclusion_reasons)
         )
         
-        # Check against search strategy criteria
-        criteria_matches = self._check_inclusion_criteria(text, criteria)
-        exclusion_matches = self._check_exclusion_criteria(text, criteria)
-        
         # Apply decision logic with confidence scoring
         return self._make_screening_decision(
-            inclusion_score, inclusion_reasons, criteria_matches, exclusion_matches
+            inclusion_score, inclusion_reasons, outcome.criteria_matches, outcome.exclusion_matches
         )
     
+    async def _screen_single_paper(self, paper: Paper, 
+                                  criteria: SearchStrategy) -> Tuple[str, str, float]:
+        """
+        Screen a single paper and return (decision, reason, confidence).
+        Enhanced with VERIFY system for additional validation.
+        """
+        outcome, = _apply_rules(self.exclusion_patterns, self.inclusion_indicators,
+                                criteria.inclusion_criteria, criteria.exclusion_criteria,
+                                [_paper_text(paper)])
+        return await self._decide(paper, outcome)
+    
     def _check_exclusion_patterns(self, text: str) -> Optional[Tuple[str, str, float]]:
         """Check high-confidence exclusion patterns."""
-        for category, patterns in self.exclusion_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    confidence = 0.9  # High confidence exclusion
-                    return 'exclude', f"Excluded: {category.replace('_', ' ')}", confidence
-        return None
+        return _exclusion_decision(self.exclusion_patterns, text)
     
     def _check_inclusion_indicators(self, text: str) -> Tuple[int, List[str]]:
         """Check inclusion indicators and return score and reasons."""
-        inclusion_score = 0
-        inclusion_reasons = []
-        
-        for category, patterns in self.inclusion_indicators.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    inclusion_score += 1
-                    inclusion_reasons.append(category.replace('_', ' '))
-        
-        return inclusion_score, inclusion_reasons
+        return _inclusion_indicators(self.inclusion_indicators, text)
     
     async def _verify_with_system(self, paper: Paper, inclusion_score: int, 
                                  inclusion_reasons: List[str]) -> Tuple[int, List[str]]:
         """Enhanced validation with VERIFY system for high-quality papers."""
-        if inclusion_score >= 2:
+        if inclusion_score >= VERIFY_MIN_INCLUSION_SCORE:
             try:
                 # Use existing citation verification for additional validation
                 verify_result = await self.citation_verifier.verify_citation_async(
@@ -229,21 +478,11 @@ class ScreeningAssistant:
     
     def _check_inclusion_criteria(self, text: str, criteria: SearchStrategy) -> int:
         """Check against inclusion criteria."""
-        criteria_matches = 0
-        for criterion in criteria.inclusion_criteria:
-            criterion_keywords = criterion.lower().split()
-            if any(keyword in text for keyword in criterion_keywords):
-                criteria_matches += 1
-        return criteria_matches
+        return _count_criteria_matches(criteria.inclusion_criteria, text)
     
     def _check_exclusion_criteria(self, text: str, criteria: SearchStrategy) -> int:
         """Check against exclusion criteria."""
-        exclusion_matches = 0
-        for criterion in criteria.exclusion_criteria:
-            criterion_keywords = criterion.lower().split()
-            if any(keyword in text for keyword in criterion_keywords):
-                exclusion_matches += 1
-        return exclusion_matches
+        return _count_criteria_matches(criteria.exclusion_criteria, text)
     
     def _make_screening_decision(self, inclusion_score: int, inclusion_reasons: List[str],
                                 criteria_matches: int, exclusion_matches: int) -> Tuple[str, str, float]:
@@ -298,8 +537,16 @@ class PRISMAScreener:
     
     async def screen_papers(self, papers: List[Paper]) -> Dict[str, Any]:
         """Screen papers using the PRISMA assistant with VERIFY integration."""
+        return await self.screening_assistant.screen_papers(papers, self._search_strategy())
+    
+    def screen_stream(self, papers: PaperStream,
+                      stats: Optional[ScreeningStats] = None) -> AsyncIterator[ScreeningDecision]:
+        """Stream screening decisions; see ScreeningAssistant.screen_stream."""
+        return self.screening_assistant.screen_stream(papers, self._search_strategy(), stats)
+    
+    def _search_strategy(self) -> SearchStrategy:
         # Create a basic search strategy for screening
-        search_strategy = SearchStrategy(
+        return SearchStrategy(
             research_question="Screening based on provided patterns",
             pico_elements={
                 'population': self.include_patterns[:3] if self.include_patterns else [],
@@ -311,9 +558,7 @@ class PRISMAScreener:
             inclusion_criteria=self.include_patterns,
             exclusion_criteria=self.exclude_patterns
         )
-        
-        return await self.screening_assistant.screen_papers(papers, search_strategy)
 
 
 # Export classes
-__all__ = ['ScreeningAssistant', 'PRISMAScreener']
\ No newline at end of file
+__all__ = ['ScreeningAssistant', 'PRISMAScreener', 'ScreeningDecision', 'ScreeningStats', 'iter_papers_jsonl']
\ No newline at end of file
@@ -22,6 +22,7 @@ from .prisma.search_strategy import SearchStrategyBuilder
 from .prisma.screening import ScreeningAssistant
 from .prisma.extraction import DataExtractionHelper
 from .prisma.draft_generation import ZeroDraftGenerator
+from .prisma.retrieval import PaperRetriever
 
 # Integration with existing STORM-Academic VERIFY system
 try:
@@ -76,6 +77,7 @@ class VERIFYPRISMAIntegration:
             lm_model=lm_model,
             citation_verifier=self.citation_verifier
         )
+        self.paper_retriever = PaperRetriever(self.academic_source_service)
         
         # Track metrics
         self.time_saved = 0
@@ -139,21 +141,21 @@ class VERIFYPRISMAIntegration:
             }
         }
     
-    async def _retrieve_papers_via_storm(self, search_strategy: SearchStrategy) -> List[Paper]:
-        """Retrieve papers using STORM-Academic source services."""
-        papers = []
+    async def _retrieve_papers_via_storm(self, search_strategy: SearchStrategy,
+                                         max_papers: Optional[int] = None,
+                                         failed_sources: Optional[List[Dict[str, Any]]] = None) -> List[Paper]:
+        """
+        Retrieve papers using STORM-Academic source services.
         
+        All search queries run concurrently against OpenAlex and Crossref,
+        restricted to the strategy's date range; exact duplicates across
+        sources are dropped. Sources that fail are added to ``failed_sources``.
+        """
         try:
-            # Use STORM-Academic academic source service for paper retrieval
-            for query in search_strategy.search_queries.values():
-                # This would integrate with the actual STORM academic retrieval
-                # For now, return empty list as placeholder
-                logger.info(f"Would retrieve papers for query: {query}")
-                
+            return await self.paper_retriever.retrieve(search_strategy, max_papers, failed_sources)
         except Exception as e:
             logger.error(f"Error retrieving papers via STORM sources: {e}")
-        
-        return papers
+            return []
 
 
 # Export VERIFY system component
@@ -7,12 +7,12 @@ import dspy
 import requests
 from dsp import backoff_hdlr, giveup_hdlr
 
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_qdrant import Qdrant
-from qdrant_client import QdrantClient
-
+from .telemetry import trace_rm_call
 from .utils import WebPageHelper
 
+# langchain_huggingface, langchain_qdrant and qdrant_client (which pull in
+# sentence_transformers and torch) are imported by VectorRM on first use.
+
 
 class YouRM(dspy.Retrieve):
     def __init__(self, ydc_api_key=None, k=3, is_valid_source: Callable = None):
@@ -39,6 +39,7 @@ class YouRM(dspy.Retrieve):
 
         return {"YouRM": usage}
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] = []
     ):
@@ -129,6 +130,7 @@ class BingSearch(dspy.Retrieve):
 
         return {"BingSearch": usage}
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] = []
     ):
@@ -215,6 +217,8 @@ class VectorRM(dspy.Retrieve):
         if not embedding_model:
             raise ValueError("Please provide an embedding model.")
 
+        from langchain_huggingface import HuggingFaceEmbeddings
+
         model_kwargs = {"device": device}
         encode_kwargs = {"normalize_embeddings": True}
         self.model = HuggingFaceEmbeddings(
@@ -231,6 +235,8 @@ class VectorRM(dspy.Retrieve):
         """
         Check if the Qdrant collection exists and create it if it does not.
         """
+        from langchain_qdrant import Qdrant
+
         if self.client is None:
             raise ValueError("Qdrant client is not initialized.")
         if self.client.collection_exists(collection_name=f"{self.collection_name}"):
@@ -263,6 +269,8 @@ class VectorRM(dspy.Retrieve):
             raise ValueError("Please provide a url for the Qdrant server.")
 
         try:
+            from qdrant_client import QdrantClient
+
             self.client = QdrantClient(url=url, api_key=api_key)
             self._check_collection()
         except Exception as e:
@@ -279,6 +287,8 @@ class VectorRM(dspy.Retrieve):
             raise ValueError("Please provide a folder path.")
 
         try:
+            from qdrant_client import QdrantClient
+
             self.client = QdrantClient(path=vector_store_path)
             self._check_collection()
         except Exception as e:
@@ -299,6 +309,7 @@ class VectorRM(dspy.Retrieve):
         """
         return self.qdrant.client.count(collection_name=self.collection_name)
 
+    @trace_rm_call
     def forward(self, query_or_queries: Union[str, List[str]], exclude_urls: List[str]):
         """
         Search in your data for self.k top passages for query or queries.
@@ -396,6 +407,7 @@ class SerperRM(dspy.Retrieve):
         self.usage = 0
         return {"SerperRM": usage}
 
+    @trace_rm_call
     def forward(self, query_or_queries: Union[str, List[str]], exclude_urls: List[str]):
         """
         Calls the API and searches for the query passed in.
@@ -496,6 +508,7 @@ class BraveRM(dspy.Retrieve):
 
         return {"BraveRM": usage}
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] = []
     ):
@@ -578,6 +591,7 @@ class SearXNG(dspy.Retrieve):
         self.usage = 0
         return {"SearXNG": usage}
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] = []
     ):
@@ -701,6 +715,7 @@ class DuckDuckGoSearchRM(dspy.Retrieve):
         )
         return results
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] = []
     ):
@@ -819,6 +834,7 @@ class TavilySearchRM(dspy.Retrieve):
         self.usage = 0
         return {"TavilySearchRM": usage}
 
+    @trace_rm_call
     def forward(
         self, query_or_queries: Union[str, List[str]], exclude_urls: List[str] = []
     ):
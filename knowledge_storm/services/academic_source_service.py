@@ -1,13 +1,23 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Dict, List, Optional
-from urllib import parse, request
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from ..exceptions import ServiceUnavailableError
+from ..telemetry import current_span
 from .cache_service import CacheService
-from .utils import CacheKeyBuilder, ConnectionManager, CircuitBreaker
+from .utils import (
+    CacheKeyBuilder,
+    CircuitBreaker,
+    ConnectionManager,
+    HostCircuitBreakers,
+    SingleFlight,
+    default_single_flight,
+    fetch_doi_batches,
+    normalize_doi,
+    stream_cursor_pages,
+)
 
 try:
     import aiohttp  # type: ignore
@@ -19,6 +29,40 @@ logger = logging.getLogger(__name__)
 DEFAULT_LIMIT = 5
 BASE_YEAR = 2000
 RECENCY_WEIGHT = 0.1
+NOT_FOUND_STATUS = 404
+# DOIs per filter query; keeps request URLs well below the providers' limits.
+CROSSREF_DOI_BATCH_SIZE = 20
+OPENALEX_DOI_BATCH_SIZE = 50
+# Largest page sizes the APIs accept for cursor paging.
+OPENALEX_MAX_PAGE_SIZE = 200
+CROSSREF_MAX_PAGE_SIZE = 1000
+# Attempts per cursor page, with exponential backoff between them.
+PAGE_ATTEMPTS = 3
+PAGE_RETRY_BACKOFF = 1.0
+# Fields requested by the streaming searches; enough for scoring and screening.
+OPENALEX_SELECT_FIELDS = (
+    "id",
+    "doi",
+    "title",
+    "publication_year",
+    "publication_date",
+    "cited_by_count",
+    "authorships",
+    "primary_location",
+    "abstract_inverted_index",
+    "type",
+)
+CROSSREF_SELECT_FIELDS = (
+    "DOI",
+    "title",
+    "author",
+    "issued",
+    "container-title",
+    "abstract",
+    "is-referenced-by-count",
+    "type",
+    "URL",
+)
 
 
 class AcademicSourceService:
@@ -34,12 +78,18 @@ class AcademicSourceService:
         conn_manager: ConnectionManager | None = None,
         key_builder: CacheKeyBuilder | None = None,
         breaker: CircuitBreaker | None = None,
+        single_flight: SingleFlight | None = None,
+        breakers: HostCircuitBreakers | None = None,
     ) -> None:
         self.cache = cache or CacheService(ttl=ttl)
         self.ttl = ttl
         self.conn_manager = conn_manager or ConnectionManager()
         self.key_builder = key_builder or CacheKeyBuilder()
-        self.breaker = breaker or CircuitBreaker()
+        # An explicit ``breaker`` is shared by all hosts; otherwise OpenAlex and
+        # Crossref each get their own from ``breakers``.
+        self.breaker = breaker
+        self.breakers = breakers or HostCircuitBreakers()
+        self.single_flight = single_flight or default_single_flight
 
     async def close(self) -> None:
         await self.conn_manager.close()
@@ -55,6 +105,70 @@ class AcademicSourceService:
         data = await self._fetch_json(self.OPENALEX_URL, params)
         return data.get("results", [])
 
+    async def iter_openalex(
+        self,
+        query: Optional[str] = None,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = OPENALEX_SELECT_FIELDS,
+        page_size: int = OPENALEX_MAX_PAGE_SIZE,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every OpenAlex work matching ``query`` using cursor paging.
+
+        ``filters`` become ``filter=key:value,...``; ``select`` limits the
+        returned fields (``None`` returns full records). Pages are not cached.
+        A page that still fails after retries raises ``ServiceUnavailableError``
+        rather than ending the stream early.
+        """
+        params: Dict[str, Any] = {"per-page": _page_size(page_size, max_results)}
+        if query:
+            params["search"] = query
+        if filters:
+            params["filter"] = _format_filters(filters)
+        if select:
+            params["select"] = ",".join(select)
+
+        async def fetch_page(cursor: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            data = await self._request_page(self.OPENALEX_URL, {**params, "cursor": cursor})
+            results = data.get("results", [])
+            next_cursor = data.get("meta", {}).get("next_cursor")
+            return results, next_cursor if len(results) >= params["per-page"] else None
+
+        async for work in _stream_items(fetch_page, max_results, prefetch):
+            yield work
+
+    async def iter_crossref(
+        self,
+        query: Optional[str] = None,
+        max_results: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        select: Optional[Sequence[str]] = CROSSREF_SELECT_FIELDS,
+        page_size: int = CROSSREF_MAX_PAGE_SIZE,
+        prefetch: int = 1,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every Crossref work matching ``query`` using deep paging (``cursor=*``).
+
+        Takes the same arguments as ``iter_openalex``.
+        """
+        params: Dict[str, Any] = {"rows": _page_size(page_size, max_results)}
+        if query:
+            params["query"] = query
+        if filters:
+            params["filter"] = _format_filters(filters)
+        if select:
+            params["select"] = ",".join(select)
+
+        async def fetch_page(cursor: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+            data = await self._request_page(self.CROSSREF_URL, {**params, "cursor": cursor})
+            message = data.get("message", {})
+            items = message.get("items", [])
+            next_cursor = message.get("next-cursor")
+            return items, next_cursor if len(items) >= params["rows"] else None
+
+        async for item in _stream_items(fetch_page, max_results, prefetch):
+            yield item
+
     async def get_paper_details(self, paper_id: str) -> Dict[str, Any]:
         return await self._fetch_json(f"{self.OPENALEX_URL}/{paper_id}")
 
@@ -70,6 +184,76 @@ class AcademicSourceService:
     async def get_publication_metadata(self, doi: str) -> Dict[str, Any]:
         return await self.resolve_doi(doi)
 
+    async def get_work_by_doi(self, doi: str) -> Dict[str, Any]:
+        return await self._fetch_json(f"{self.OPENALEX_URL}/doi:{doi}")
+
+    async def resolve_dois(self, dois: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Resolve many DOIs with a few batched filter queries.
+
+        Cached DOIs are served first. The rest go to Crossref as
+        ``filter=doi:a,doi:b`` queries, and DOIs Crossref does not know (e.g.
+        DataCite DOIs) are retried against OpenAlex with ``filter=doi:a|b``.
+        Results are cached per DOI under the same keys as ``resolve_doi`` and
+        ``get_work_by_doi``. Returns metadata keyed by the DOIs as given;
+        unknown DOIs map to ``{}``.
+        """
+        normalized = {doi: normalize_doi(doi) for doi in dois}
+        unique = list(dict.fromkeys(normalized.values()))
+        resolved = await self._resolve_crossref_dois(unique)
+        unresolved = [doi for doi in unique if not resolved.get(doi)]
+        if unresolved:
+            resolved.update(await self._resolve_openalex_dois(unresolved))
+        return {doi: resolved.get(norm, {}) for doi, norm in normalized.items()}
+
+    async def _resolve_crossref_dois(self, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+        keys = {doi: self.key_builder.build_key(f"{self.CROSSREF_URL}/{doi}") for doi in dois}
+        cached = await self.cache.get_many(keys.values())
+        resolved = {doi: cached[key].get("message", {}) for doi, key in keys.items() if key in cached}
+        found, unbatched = await fetch_doi_batches(
+            [doi for doi in dois if doi not in resolved],
+            CROSSREF_DOI_BATCH_SIZE,
+            ",",
+            self._crossref_doi_batch,
+        )
+        await self.cache.set_many(
+            {keys[doi]: {"message": item} if item else {} for doi, item in found.items()}, self.ttl
+        )
+        singles = await asyncio.gather(*(self.resolve_doi(doi) for doi in unbatched))
+        resolved.update(found)
+        resolved.update(zip(unbatched, singles))
+        return resolved
+
+    async def _resolve_openalex_dois(self, dois: List[str]) -> Dict[str, Dict[str, Any]]:
+        keys = {doi: self.key_builder.build_key(f"{self.OPENALEX_URL}/doi:{doi}") for doi in dois}
+        cached = await self.cache.get_many(keys.values())
+        resolved = {doi: cached[key] for doi, key in keys.items() if key in cached}
+        found, unbatched = await fetch_doi_batches(
+            [doi for doi in dois if doi not in resolved],
+            OPENALEX_DOI_BATCH_SIZE,
+            "|,",
+            self._openalex_doi_batch,
+        )
+        await self.cache.set_many({keys[doi]: work for doi, work in found.items()}, self.ttl)
+        singles = await asyncio.gather(*(self.get_work_by_doi(doi) for doi in unbatched))
+        resolved.update(found)
+        resolved.update(zip(unbatched, singles))
+        return resolved
+
+    async def _crossref_doi_batch(self, dois: Sequence[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        params = {"filter": ",".join(f"doi:{doi}" for doi in dois), "rows": len(dois)}
+        data = await self._fetch_json(self.CROSSREF_URL, params)
+        if "message" not in data:
+            return None
+        items = data["message"].get("items", [])
+        return {normalize_doi(item.get("DOI", "")): item for item in items}
+
+    async def _openalex_doi_batch(self, dois: Sequence[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        params = {"filter": "doi:" + "|".join(dois), "per-page": len(dois)}
+        data = await self._fetch_json(self.OPENALEX_URL, params)
+        if "results" not in data:
+            return None
+        return {normalize_doi(work.get("doi") or ""): work for work in data["results"]}
+
     async def search_combined(self, query: str, limit: int = DEFAULT_LIMIT) -> List[Dict[str, Any]]:
         openalex_coro = self.search_openalex(query, limit)
         crossref_coro = self.search_crossref(query, limit)
@@ -85,40 +269,92 @@ class AcademicSourceService:
 
         cached = await self.cache.get(cache_key)
         if cached is not None:
+            span = current_span()
+            if span is not None:
+                span.cache_hits += 1
             return cached
 
-        if not self.breaker.should_allow_request():
+        return await self.single_flight.do(
+            cache_key, lambda: self._fetch_and_cache(url, params, cache_key)
+        )
+
+    async def _fetch_and_cache(
+        self, url: str, params: Optional[Dict[str, Any]], cache_key: str
+    ) -> Dict[str, Any]:
+        data = await self._request_json(url, params)
+        if data is not None:
+            await self.cache.set(cache_key, data, self.ttl)
+        return data or {}
+
+    def _breaker_for(self, url: str) -> CircuitBreaker:
+        if self.breaker is not None:
+            return self.breaker
+        return self.breakers.for_url(url)
+
+    async def _request_page(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Uncached GET of one cursor page, retried with exponential backoff."""
+        for attempt in range(PAGE_ATTEMPTS):
+            data = await self._request_json(url, params)
+            if data is not None:
+                return data
+            if attempt < PAGE_ATTEMPTS - 1:
+                await asyncio.sleep(PAGE_RETRY_BACKOFF * 2 ** attempt)
+        raise ServiceUnavailableError(
+            f"Page {params.get('cursor')} of {url} failed after {PAGE_ATTEMPTS} attempts"
+        )
+
+    async def _request_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Uncached GET; returns ``None`` on failure while the breaker stays closed."""
+        breaker = self._breaker_for(url)
+        if not breaker.should_allow_request():
             raise RuntimeError("Circuit breaker open")
 
+        session = await self.conn_manager.get_session()
         try:
-            try:
-                session = await self.conn_manager.get_session()
-            except RuntimeError:
-                session = None
-
-            if session is not None:
-                async with session.get(url, params=params, timeout=10) as resp:
+            async with session.get(url, params=params, timeout=10) as resp:
+                if resp.status == NOT_FOUND_STATUS:
+                    data = {}  # negatively cached by CacheService
+                else:
                     resp.raise_for_status()
                     data = await resp.json()
-            else:
-                def _sync() -> Dict[str, Any]:
-                    full_url = url
-                    if params:
-                        full_url += f"?{parse.urlencode(params)}"
-                    with request.urlopen(full_url) as resp:
-                        return json.load(resp)
-
-                data = await asyncio.to_thread(_sync)
-
-            await self.cache.set(cache_key, data, self.ttl)
-            self.breaker.record_success()
+            breaker.record_success()
             return data
         except Exception:  # pragma: no cover - network errors
-            self.breaker.record_failure()
+            breaker.record_failure()
             logger.exception("Failed request to %s", url)
-            if not self.breaker.should_allow_request():
+            if breaker.state == CircuitBreaker.OPEN:
                 raise
-            return {}
+            return None
+
+
+def _page_size(page_size: int, max_results: Optional[int]) -> int:
+    if max_results is None:
+        return page_size
+    return max(1, min(page_size, max_results))
+
+
+def _format_filters(filters: Dict[str, Any]) -> str:
+    return ",".join(f"{key}:{value}" for key, value in filters.items())
+
+
+async def _stream_items(
+    fetch_page: Callable[[str], Awaitable[Tuple[List[Any], Optional[str]]]],
+    max_results: Optional[int],
+    prefetch: int,
+) -> AsyncIterator[Any]:
+    if max_results is not None and max_results <= 0:
+        return
+    pages = stream_cursor_pages(fetch_page, prefetch)
+    count = 0
+    try:
+        async for page in pages:
+            for item in page:
+                yield item
+                count += 1
+                if count == max_results:
+                    return
+    finally:
+        await pages.aclose()
 
 
 class SourceQualityScorer:
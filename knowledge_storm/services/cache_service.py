@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
 
 try:
     import redis.asyncio as redis  # type: ignore
@@ -10,13 +13,102 @@ except Exception:  # pragma: no cover - optional
     redis = None
     RedisError = Exception
 
+DEFAULT_LOCAL_MAX_ENTRIES = 10_000
+DEFAULT_NEGATIVE_TTL = 300
+
+_MISSING = object()
+
+
+class CacheStats:
+    """Hit/miss counters for one cache tier."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def record(self, hit: bool) -> None:
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hit_ratio}
+
+
+class LocalLRUCache:
+    """Size- and TTL-bounded in-process LRU cache."""
+
+    def __init__(self, max_entries: int = DEFAULT_LOCAL_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or ``_MISSING``."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return _MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, (dict, list)) and not value)
+
 
 class CacheService:
-    """Simple async cache service using Redis if available."""
+    """Two-tier async cache: bounded in-process LRU (L1) in front of Redis (L2).
 
-    def __init__(self, url: str = "redis://localhost:6379/0", ttl: int = 3600) -> None:
+    Hot keys are served from L1 without a network round trip. L1 keeps the
+    JSON text, so every read returns a fresh value that callers may mutate.
+    Empty responses are cached with the shorter ``negative_ttl`` so repeated
+    lookups of unknown items do not hit the providers again right away.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        ttl: int = 3600,
+        max_local_entries: int = DEFAULT_LOCAL_MAX_ENTRIES,
+        local_ttl: Optional[int] = None,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL,
+    ) -> None:
         self.ttl = ttl
-        self._local_cache: dict[str, Any] = {}
+        self.local_ttl = local_ttl
+        self.negative_ttl = negative_ttl
+        self._local_cache = LocalLRUCache(max_local_entries)
+        self.l1_stats = CacheStats()
+        self.l2_stats = CacheStats()
+        self.negative_hits = 0
         self.redis: Optional["redis.Redis"] = None
         if redis is not None:
             try:
@@ -24,25 +116,111 @@ class CacheService:
             except RedisError:
                 self.redis = None
 
+    def _effective_ttl(self, value: Any, ttl: Optional[int]) -> int:
+        ttl = ttl or self.ttl
+        if _is_empty(value):
+            return min(ttl, self.negative_ttl)
+        return ttl
+
+    def _local_set(self, key: str, raw: Any, ttl: int) -> None:
+        if self.local_ttl is not None:
+            ttl = min(ttl, self.local_ttl)
+        self._local_cache.set(key, raw, ttl)
+
+    def _local_get(self, key: str) -> Any:
+        raw = self._local_cache.get(key)
+        self.l1_stats.record(raw is not _MISSING)
+        if raw is _MISSING:
+            return _MISSING
+        value = json.loads(raw)
+        if _is_empty(value):
+            self.negative_hits += 1
+        return value
+
     async def get(self, key: str) -> Any:
+        value = self._local_get(key)
+        if value is not _MISSING:
+            return value
         if self.redis is not None:
             try:
-                value = await self.redis.get(key)
-                if value is not None:
-                    return json.loads(value)
+                raw = await self.redis.get(key)
             except RedisError:
-                pass
-        return self._local_cache.get(key)
+                raw = None
+            self.l2_stats.record(raw is not None)
+            if raw is not None:
+                value = json.loads(raw)
+                self._local_set(key, raw, self._effective_ttl(value, None))
+                return value
+        return None
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Return the cached values for ``keys``; misses are omitted.
+
+        L1 is consulted first and the remaining keys are fetched from Redis
+        with a single ``MGET``.
+        """
+        found: Dict[str, Any] = {}
+        remote: List[str] = []
+        for key in keys:
+            value = self._local_get(key)
+            if value is _MISSING:
+                remote.append(key)
+            else:
+                found[key] = value
+        if remote and self.redis is not None:
+            try:
+                raws = await self.redis.mget(remote)
+            except RedisError:
+                raws = [None] * len(remote)
+            for key, raw in zip(remote, raws):
+                self.l2_stats.record(raw is not None)
+                if raw is not None:
+                    value = json.loads(raw)
+                    self._local_set(key, raw, self._effective_ttl(value, None))
+                    found[key] = value
+        return found
 
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
-        ttl = ttl or self.ttl
+        ttl = self._effective_ttl(value, ttl)
+        raw = json.dumps(value)
+        self._local_set(key, raw, ttl)
+        if self.redis is not None:
+            try:
+                await self.redis.set(key, raw, ex=ttl)
+            except RedisError:
+                pass
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        """Store several values, writing them to Redis in one pipeline."""
+        if not items:
+            return
+        ttls = {key: self._effective_ttl(value, ttl) for key, value in items.items()}
+        raws = {key: json.dumps(value) for key, value in items.items()}
+        for key, raw in raws.items():
+            self._local_set(key, raw, ttls[key])
+        if self.redis is not None:
+            try:
+                pipe = self.redis.pipeline(transaction=False)
+                for key, raw in raws.items():
+                    pipe.set(key, raw, ex=ttls[key])
+                await pipe.execute()
+            except RedisError:
+                pass
+
+    async def delete(self, key: str) -> None:
+        self._local_cache.delete(key)
         if self.redis is not None:
             try:
-                await self.redis.set(key, json.dumps(value), ex=ttl)
-                return
+                await self.redis.delete(key)
             except RedisError:
                 pass
-        self._local_cache[key] = value
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "l1": {**self.l1_stats.as_dict(), "size": len(self._local_cache)},
+            "l2": {**self.l2_stats.as_dict(), "enabled": self.redis is not None},
+            "negative_hits": self.negative_hits,
+        }
 
     async def close(self) -> None:
         if self.redis is not None:
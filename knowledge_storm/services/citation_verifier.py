@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
-from difflib import SequenceMatcher
 from typing import Any, Dict, List, Tuple
 
 from .academic_source_service import AcademicSourceService, SourceQualityScorer
 from .cache_service import CacheService
 from .config import VerificationConfig
+from .similarity import SimilarityScorer, create_scorer
+from .utils import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -17,13 +17,15 @@ logger = logging.getLogger(__name__)
 class CitationVerifier:
     """Verify textual claims against academic sources."""
 
-    def __init__(self, cache: CacheService | None = None) -> None:
+    def __init__(self, cache: CacheService | None = None, similarity: SimilarityScorer | None = None) -> None:
         self.cache = cache or CacheService()
         self.source_service = AcademicSourceService(cache=self.cache)
         self.scorer = SourceQualityScorer()
+        self.similarity = similarity or create_scorer(VerificationConfig.SIMILARITY_SCORER)
 
     def verify_citation(self, claim: str, source: Dict[str, Any]) -> Dict[str, Any]:
-        return asyncio.run(self.verify_citation_async(claim, source))
+        """Sync façade; runs on the shared background loop instead of a new loop per call."""
+        return run_sync(self.verify_citation_async(claim, source))
 
     async def verify_citation_async(self, claim: str, source: Dict[str, Any]) -> Dict[str, Any]:
         cache_key = self._build_cache_key(claim, source)
@@ -79,12 +81,7 @@ class CitationVerifier:
         }
 
     def _calculate_verification_score(self, claim: str, source_text: str) -> float:
-        normalized_claim = self._normalize_text(claim)
-        normalized_source = self._normalize_text(source_text)
-        return SequenceMatcher(None, normalized_claim, normalized_source).ratio()
-
-    def _normalize_text(self, text: str) -> str:
-        return text.lower()
+        return self.similarity.score(claim, source_text)
 
     def _assess_source_quality(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         if not metadata:
@@ -4,3 +4,4 @@ class VerificationConfig:
     VERIFICATION_THRESHOLD = 0.7
     CACHE_TTL = 3600
     MAX_RETRIES = 3
+    SIMILARITY_SCORER = "minhash"  # "minhash", "bm25" or "embedding"
@@ -3,13 +3,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional
-from urllib import parse, request
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Optional, Sequence
 
 from dataclasses import dataclass
 
+from ..exceptions import ServiceUnavailableError
+from ..telemetry import current_span
 from .cache_service import CacheService
-from .utils import CacheKeyBuilder, ConnectionManager, CircuitBreaker
+from .utils import (
+    CacheKeyBuilder,
+    CircuitBreaker,
+    ConnectionManager,
+    SingleFlight,
+    default_single_flight,
+    fetch_doi_batches,
+    normalize_doi,
+)
 
 try:
     import aiohttp  # type: ignore
@@ -18,6 +28,11 @@ except Exception:  # pragma: no cover - optional dependency
 
 logger = logging.getLogger(__name__)
 
+NOT_FOUND_STATUS = 404
+TOO_MANY_REQUESTS_STATUS = 429
+DEFAULT_RETRY_AFTER = 5.0
+DOI_BATCH_SIZE = 20
+
 
 @dataclass
 class CrossrefConfig:
@@ -25,68 +40,132 @@ class CrossrefConfig:
 
     ttl: int = 86400
     rate_limit_interval: float = 3.6
+    rate_limit_burst: int = 3
     cache: CacheService | None = None
     conn_manager: ConnectionManager | None = None
     key_builder: CacheKeyBuilder | None = None
     breaker: CircuitBreaker | None = None
+    single_flight: SingleFlight | None = None
 
 
 class RateLimiter:
-    """Asynchronous rate limiter."""
-
-    def __init__(self, interval: float = 3.6) -> None:
-        self.interval = interval
-        self._last_request = 0.0
+    """Asynchronous token bucket rate limiter.
+
+    Up to ``burst`` requests go out back to back, after which requests are
+    spaced ``interval`` seconds apart. ``update_from_headers`` adopts the
+    allowance the provider advertises in ``X-Rate-Limit-Limit`` /
+    ``X-Rate-Limit-Interval`` and ``pause`` backs off after a 429.
+    """
+
+    def __init__(self, interval: float = 3.6, burst: int = 1) -> None:
+        self.rate = 1.0 / interval
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
         self._lock = asyncio.Lock()
 
+    @property
+    def interval(self) -> float:
+        return 1.0 / self.rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._tokens < 1:
+            return (1 - self._tokens) / self.rate
+        return 0.0
+
     async def wait(self) -> None:
+        start = time.monotonic()
         async with self._lock:
-            wait = self.interval - (time.time() - self._last_request)
-            if wait > 0:
-                await asyncio.sleep(wait)
-            self._last_request = time.time()
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                delay = self._delay(now)
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+            self._tokens -= 1
+        span = current_span()
+        if span is not None:
+            span.queue_wait += time.monotonic() - start
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt the rate advertised by ``X-Rate-Limit-*`` response headers."""
+        if not isinstance(headers, Mapping):
+            return
+        headers = {k.lower(): v for k, v in headers.items()}
+        limit = _parse_seconds(headers.get("x-rate-limit-limit"))
+        interval = _parse_seconds(headers.get("x-rate-limit-interval"))
+        if not limit or not interval:
+            return
+        rate = limit / interval
+        if rate != self.rate or limit != self.capacity:
+            self._refill(time.monotonic())
+            self.rate = rate
+            self.capacity = limit
+
+    def paused_for(self) -> float:
+        return max(0.0, self._blocked_until - time.monotonic())
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for ``seconds``, e.g. after a 429."""
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse header values such as ``"50"``, ``"1s"`` or ``"500ms"``."""
+    if not value:
+        return None
+    value = value.strip().lower()
+    scale = 1.0
+    if value.endswith("ms"):
+        value, scale = value[:-2], 0.001
+    elif value.endswith("s"):
+        value = value[:-1]
+    try:
+        return float(value) * scale
+    except ValueError:
+        return None
 
 
 class HttpFetcher:
-    """Fetch JSON from a URL using aiohttp with sync fallback."""
+    """Fetch JSON from a URL using the shared aiohttp session."""
 
-    def __init__(self, conn_manager: ConnectionManager) -> None:
+    def __init__(self, conn_manager: ConnectionManager, limiter: RateLimiter | None = None) -> None:
         self.conn_manager = conn_manager
-
-    async def safe_session(self) -> Optional["aiohttp.ClientSession"]:
-        try:
-            return await self.conn_manager.get_session()
-        except RuntimeError:
-            return None
+        self.limiter = limiter
 
     async def fetch_async(
         self, session: "aiohttp.ClientSession", url: str, params: Optional[Dict[str, Any]]
     ) -> Dict[str, Any]:
         async with session.get(url, params=params, timeout=10) as resp:
+            if self.limiter is not None:
+                self.limiter.update_from_headers(resp.headers)
+                if resp.status == TOO_MANY_REQUESTS_STATUS:
+                    retry_after = _parse_seconds(resp.headers.get("Retry-After"))
+                    self.limiter.pause(retry_after or DEFAULT_RETRY_AFTER)
+            if resp.status == NOT_FOUND_STATUS:
+                # A definitive "no such record": returned as an empty payload
+                # so it is negatively cached instead of retried.
+                return {}
             resp.raise_for_status()
             return await resp.json()
 
-    async def fetch_sync(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        def _sync() -> Dict[str, Any]:
-            full_url = url
-            if params:
-                full_url += f"?{parse.urlencode(params)}"
-            with request.urlopen(full_url) as resp:
-                return json.load(resp)  # type: ignore
-
-        import json
-        return await asyncio.to_thread(_sync)
-
     async def attempt_fetch(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
-        session = await self.safe_session()
-        if session:
-            return await self.fetch_async(session, url, params)
-        return await self.fetch_sync(url, params)
+        session = await self.conn_manager.get_session()
+        return await self.fetch_async(session, url, params)
 
     async def try_fetch(self, url: str, params: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         try:
             return await self.attempt_fetch(url, params)
-        except asyncio.CancelledError:
+        except (asyncio.CancelledError, ServiceUnavailableError):
             raise
         except Exception as e:  # pragma: no cover - network errors
             logger.exception("Failed request to %s: %s", url, e)
@@ -94,7 +173,8 @@ class HttpFetcher:
 
     async def fetch_with_retry(
         self, url: str, params: Optional[Dict[str, Any]], breaker: CircuitBreaker
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
+        """Return the response payload, or ``None`` if every attempt failed."""
         for attempt in range(3):
             result = await self.try_fetch(url, params)
             if result is not None:
@@ -102,9 +182,12 @@ class HttpFetcher:
                 return result
             if attempt >= 2 or not breaker.should_allow_request():
                 break
-            await asyncio.sleep(2 ** attempt)
+            backoff = 2 ** attempt
+            if self.limiter is not None:
+                backoff = max(backoff, self.limiter.paused_for())
+            await asyncio.sleep(backoff)
         breaker.record_failure()
-        return {}
+        return None
 
 
 class CrossrefService:
@@ -125,8 +208,9 @@ class CrossrefService:
         self.conn_manager = config.conn_manager or ConnectionManager()
         self.key_builder = config.key_builder or CacheKeyBuilder()
         self.breaker = config.breaker or CircuitBreaker()
-        self.fetcher = fetcher or HttpFetcher(self.conn_manager)
-        self.limiter = limiter or RateLimiter(config.rate_limit_interval)
+        self.single_flight = config.single_flight or default_single_flight
+        self.limiter = limiter or RateLimiter(config.rate_limit_interval, config.rate_limit_burst)
+        self.fetcher = fetcher or HttpFetcher(self.conn_manager, self.limiter)
 
     async def close(self) -> None:
         await self.conn_manager.close()
@@ -152,14 +236,22 @@ class CrossrefService:
 
     async def _retrieve_data(self, key: str, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         data = await self.fetcher.fetch_with_retry(url, params, self.breaker)
-        if data:
-            await self._record_success(key, data)
+        if data is None:
+            return {}
+        # Empty payloads are cached too; CacheService applies its negative TTL.
+        await self._record_success(key, data)
         return data
 
     async def _fetch_json(self, url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         key, cached = await self._get_cached(url, params)
         if cached is not None:
+            span = current_span()
+            if span is not None:
+                span.cache_hits += 1
             return cached
+        return await self.single_flight.do(key, lambda: self._call_api(key, url, params))
+
+    async def _call_api(self, key: str, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         await self._ensure_can_call()
         return await self._retrieve_data(key, url, params)
 
@@ -172,6 +264,37 @@ class CrossrefService:
         data = await self._fetch_json(f"{self.BASE_URL}/{doi}")
         return data.get("message", {})
 
+    async def get_metadata_by_dois(self, dois: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Resolve many DOIs with ``filter=doi:a,doi:b`` queries.
+
+        Each batch costs one rate limiter slot instead of one per DOI. Results
+        are cached per DOI under the ``get_metadata_by_doi`` keys, and DOIs from
+        failed batches fall back to single lookups. Returns metadata keyed by
+        the DOIs as given; unknown DOIs map to ``{}``.
+        """
+        normalized = {doi: normalize_doi(doi) for doi in dois}
+        keys = {norm: self.key_builder.build_key(f"{self.BASE_URL}/{norm}") for norm in normalized.values()}
+        cached = await self.cache.get_many(keys.values())
+        resolved = {doi: cached[key].get("message", {}) for doi, key in keys.items() if key in cached}
+        found, unbatched = await fetch_doi_batches(
+            [doi for doi in keys if doi not in resolved], DOI_BATCH_SIZE, ",", self._fetch_doi_batch
+        )
+        await self.cache.set_many(
+            {keys[doi]: {"message": item} if item else {} for doi, item in found.items()}, self.ttl
+        )
+        resolved.update(found)
+        for doi in unbatched:
+            resolved[doi] = await self.get_metadata_by_doi(doi)
+        return {doi: resolved.get(norm, {}) for doi, norm in normalized.items()}
+
+    async def _fetch_doi_batch(self, dois: Sequence[str]) -> Optional[Dict[str, Dict[str, Any]]]:
+        params = {"filter": ",".join(f"doi:{doi}" for doi in dois), "rows": len(dois)}
+        data = await self._fetch_json(self.BASE_URL, params)
+        if "message" not in data:
+            return None
+        items = data["message"].get("items", [])
+        return {normalize_doi(item.get("DOI", "")): item for item in items}
+
     async def validate_citation(self, citation_data: Dict[str, Any]) -> bool:
         doi = citation_data.get("doi")
         if not doi:
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from typing import Any, Dict, List
 
 from .citation_verifier import CitationVerifier
+from .utils import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +18,12 @@ class SectionCitationVerifier:
         self.verifier = verifier
 
     def verify_section(self, section_text: str, info_list: List[Any]) -> List[Dict[str, Any]]:
+        return run_sync(self.verify_section_async(section_text, info_list))
+
+    async def verify_section_async(self, section_text: str, info_list: List[Any]) -> List[Dict[str, Any]]:
+        """Verify all citations of a section concurrently."""
         indices = self._extract_citation_indices(section_text)
-        return self._verify_citations_by_indices(indices, info_list)
+        return await self._verify_citations_by_indices(indices, info_list)
 
     def _extract_citation_indices(self, section_text: str) -> List[int]:
         indices: List[int] = []
@@ -28,19 +34,17 @@ class SectionCitationVerifier:
                 logger.warning("Invalid citation format: %s", match)
         return indices
 
-    def _verify_citations_by_indices(self, indices: List[int], info_list: List[Any]) -> List[Dict[str, Any]]:
-        results = []
-        for idx in indices:
-            result = self._verify_single_citation(idx, info_list)
-            if result:
-                results.append(result)
-        return results
+    async def _verify_citations_by_indices(self, indices: List[int], info_list: List[Any]) -> List[Dict[str, Any]]:
+        unique = list(dict.fromkeys(indices))
+        verified = await asyncio.gather(*(self._verify_single_citation(idx, info_list) for idx in unique))
+        by_index = dict(zip(unique, verified))
+        return [by_index[idx] for idx in indices if by_index[idx]]
 
-    def _verify_single_citation(self, idx: int, info_list: List[Any]) -> Dict[str, Any] | None:
+    async def _verify_single_citation(self, idx: int, info_list: List[Any]) -> Dict[str, Any] | None:
         if not (0 < idx <= len(info_list)):
             return None
         snippet = self._get_snippet_text(info_list[idx - 1])
-        return self.verifier.verify_citation(snippet, {"text": snippet})
+        return await self.verifier.verify_citation_async(snippet, {"text": snippet})
 
     def _get_snippet_text(self, info_item: Any) -> str:
         return info_item.snippets[0] if info_item.snippets else ""
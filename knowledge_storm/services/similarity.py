@@ -0,0 +1,258 @@
+"""Claim-to-source similarity scorers for ``CitationVerifier``.
+
+Every scorer splits the source into overlapping sentence windows, keeps the
+few windows sharing the most terms with the claim, and scores only those, so
+the cost is linear in the source length instead of quadratic like
+``difflib.SequenceMatcher``. Scores are in ``[0, 1]``; the claim's best
+matching passage determines the score.
+
+* ``MinHashScorer``: word-shingle containment of the claim in a passage,
+  estimated with MinHash signatures.
+* ``BM25Scorer``: BM25 over the passage windows, normalized by the claim's
+  total term weight.
+* ``EmbeddingScorer``: cosine similarity of local sentence-transformers
+  embeddings (optional dependency).
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import random
+import re
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Protocol, Sequence
+
+_TOKEN_RE = re.compile(r"\w+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+|\n+")
+_MERSENNE_PRIME = (1 << 61) - 1
+
+DEFAULT_WINDOW_SENTENCES = 3
+DEFAULT_TOP_K = 3
+
+
+class SimilarityScorer(Protocol):
+    def score(self, claim: str, source_text: str) -> float:
+        ...
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def split_sentences(text: str) -> List[str]:
+    return [s for s in _SENTENCE_RE.split(text) if s.strip()]
+
+
+def sentence_windows(text: str, window: int = DEFAULT_WINDOW_SENTENCES) -> List[str]:
+    """Overlapping windows of ``window`` consecutive sentences."""
+    sentences = split_sentences(text)
+    if len(sentences) <= window:
+        return [" ".join(sentences)] if sentences else []
+    return [" ".join(sentences[i : i + window]) for i in range(len(sentences) - window + 1)]
+
+
+def _token_windows(sentences: List[List[str]], window: int) -> List[List[str]]:
+    if len(sentences) <= window:
+        return [[t for s in sentences for t in s]] if sentences else []
+    return [[t for s in sentences[i : i + window] for t in s] for i in range(len(sentences) - window + 1)]
+
+
+def best_windows(
+    claim_terms: set, source_text: str, window: int, top_k: Optional[int]
+) -> List[List[str]]:
+    """Tokenized sentence windows sharing the most terms with the claim.
+
+    Sentences are tokenized once and windows are ranked by a sliding sum of
+    per-sentence term matches, so only the ``top_k`` winners are assembled.
+    With ``top_k=None`` every window is returned.
+    """
+    sentences = [_TOKEN_RE.findall(s) for s in split_sentences(source_text.lower())]
+    if top_k is None or len(sentences) <= window:
+        return _token_windows(sentences, window)
+    matches = [len(claim_terms.intersection(s)) for s in sentences]
+    starts = range(len(sentences) - window + 1)
+    sums = [sum(matches[:window])]
+    for i in starts[1:]:
+        sums.append(sums[-1] + matches[i + window - 1] - matches[i - 1])
+    top = heapq.nlargest(top_k, starts, key=sums.__getitem__)
+    return [[t for s in sentences[i : i + window] for t in s] for i in top]
+
+
+class PassageScorer(ABC):
+    """Base class for scorers that pre-filter sentence windows and score the best few.
+
+    Subclasses implement ``score``, using ``candidate_passages`` to pick the
+    windows worth scoring.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW_SENTENCES, top_k: int = DEFAULT_TOP_K) -> None:
+        self.window = window
+        self.top_k = top_k
+
+    @abstractmethod
+    def score(self, claim: str, source_text: str) -> float:
+        """Similarity of ``claim`` to its best matching passage of ``source_text``, in ``[0, 1]``."""
+
+    def candidate_passages(self, claim_tokens: List[str], source_text: str) -> List[List[str]]:
+        return best_windows(set(claim_tokens), source_text, self.window, self.top_k)
+
+
+def _shingles(tokens: Sequence[str], size: int) -> set:
+    if len(tokens) < size:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+
+
+class MinHashScorer(PassageScorer):
+    """Estimated containment of the claim's word shingles in a passage.
+
+    Containment ``|C & P| / |C|`` is derived from the MinHash Jaccard
+    estimate, so a short claim fully quoted in a long passage scores ~1.
+    """
+
+    def __init__(
+        self,
+        num_perm: int = 128,
+        shingle_size: int = 2,
+        seed: int = 1,
+        window: int = DEFAULT_WINDOW_SENTENCES,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> None:
+        super().__init__(window, top_k)
+        self.shingle_size = shingle_size
+        rng = random.Random(seed)
+        self._perms = [
+            (rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME)) for _ in range(num_perm)
+        ]
+
+    def signature(self, shingles: set) -> List[int]:
+        hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles]
+        return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in self._perms]
+
+    def score(self, claim: str, source_text: str) -> float:
+        claim_tokens = tokenize(claim)
+        if not claim_tokens or not source_text:
+            return 0.0
+        claim_shingles = _shingles(claim_tokens, self.shingle_size)
+        claim_sig = self.signature(claim_shingles)
+        passages = self.candidate_passages(claim_tokens, source_text)
+        return max((self._containment(claim_shingles, claim_sig, p) for p in passages), default=0.0)
+
+    def _containment(self, claim_shingles: set, claim_sig: List[int], passage_tokens: List[str]) -> float:
+        passage_shingles = _shingles(passage_tokens, self.shingle_size)
+        passage_sig = self.signature(passage_shingles)
+        jaccard = sum(c == p for c, p in zip(claim_sig, passage_sig)) / len(self._perms)
+        if jaccard == 0:
+            return 0.0
+        # |C & P| = J * (|C| + |P|) / (1 + J)
+        overlap = jaccard * (len(claim_shingles) + len(passage_shingles)) / (1 + jaccard)
+        return min(1.0, overlap / len(claim_shingles))
+
+
+class BM25Scorer(PassageScorer):
+    """BM25 over the source's sentence windows.
+
+    Term frequencies are saturated at their single-occurrence value, so a
+    passage containing every claim term once at average length scores 1.
+    """
+
+    def __init__(
+        self,
+        k1: float = 1.2,
+        b: float = 0.75,
+        window: int = DEFAULT_WINDOW_SENTENCES,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> None:
+        super().__init__(window, top_k)
+        self.k1 = k1
+        self.b = b
+
+    def score(self, claim: str, source_text: str) -> float:
+        claim_tokens = tokenize(claim)
+        if not claim_tokens or not source_text:
+            return 0.0
+        claim_terms = set(claim_tokens)
+        sentences = [_TOKEN_RE.findall(s) for s in split_sentences(source_text.lower())]
+        if not sentences:
+            return 0.0
+        # Window statistics are derived from per-sentence counts, so only the
+        # top-ranked windows are ever materialized.
+        matched_terms = [claim_terms.intersection(s) for s in sentences]
+        lengths = [len(s) for s in sentences]
+        n = max(1, len(sentences) - self.window + 1)
+        doc_freq: Counter = Counter()
+        for i in range(n):
+            doc_freq.update(set().union(*matched_terms[i : i + self.window]))
+        idf = {t: math.log(1 + (n - doc_freq[t] + 0.5) / (doc_freq[t] + 0.5)) for t in claim_terms}
+        avg_len = sum(sum(lengths[i : i + self.window]) for i in range(n)) / n
+        top = heapq.nlargest(
+            self.top_k, range(n), key=lambda i: sum(len(m) for m in matched_terms[i : i + self.window])
+        )
+        return max(
+            self._score(claim_terms, idf, [t for s in sentences[i : i + self.window] for t in s], avg_len)
+            for i in top
+        )
+
+    def _score(self, claim_terms: set, idf: Dict[str, float], tokens: List[str], avg_len: float) -> float:
+        tf = Counter(t for t in tokens if t in claim_terms)
+        norm = 1 - self.b + self.b * len(tokens) / (avg_len or 1)
+        total = sum(idf.values())
+        matched = sum(idf[t] * min(1.0, f * (self.k1 + 1) / (f + self.k1 * norm)) for t, f in tf.items())
+        return matched / total if total else 0.0
+
+
+class EmbeddingScorer(PassageScorer):
+    """Cosine similarity of local sentence-transformers embeddings.
+
+    The model is loaded on first use; install ``sentence-transformers`` to
+    enable it.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        window: int = DEFAULT_WINDOW_SENTENCES,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> None:
+        super().__init__(window, top_k)
+        self.model_name = model_name
+        self._model: Any = None
+
+    def _get_model(self) -> Any:
+        if self._model is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "EmbeddingScorer requires sentence-transformers: pip install sentence-transformers"
+                ) from e
+            self._model = SentenceTransformer(self.model_name)
+        return self._model
+
+    def score(self, claim: str, source_text: str) -> float:
+        claim_tokens = tokenize(claim)
+        if not claim_tokens or not source_text:
+            return 0.0
+        passages = [" ".join(p) for p in self.candidate_passages(claim_tokens, source_text)]
+        if not passages:
+            return 0.0
+        vectors = self._get_model().encode([claim] + passages, normalize_embeddings=True)
+        claim_vec = vectors[0]
+        return max(0.0, max(float(claim_vec @ v) for v in vectors[1:]))
+
+
+SCORERS: Dict[str, Callable[..., PassageScorer]] = {
+    "minhash": MinHashScorer,
+    "bm25": BM25Scorer,
+    "embedding": EmbeddingScorer,
+}
+
+
+def create_scorer(name: str, **kwargs: Any) -> PassageScorer:
+    try:
+        return SCORERS[name](**kwargs)
+    except KeyError:
+        raise ValueError(f"Unknown similarity scorer: {name!r} (choose from {sorted(SCORERS)})") from None
@@ -1,13 +1,155 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+import concurrent.futures
+import re
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
 from urllib import parse
 
+from ..exceptions import ServiceUnavailableError
+
 try:
     import aiohttp  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     aiohttp = None
 
+T = TypeVar("T")
+
+
+DOI_PATTERN = re.compile(r"10\.\d{4,9}/[^\s\"'<>]+")
+DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "http://dx.doi.org/", "doi:")
+
+
+def normalize_doi(doi: str) -> str:
+    """Lower-case ``doi`` and strip resolver URL or ``doi:`` prefixes."""
+    doi = doi.strip().lower()
+    for prefix in DOI_PREFIXES:
+        if doi.startswith(prefix):
+            return doi[len(prefix):]
+    return doi
+
+
+# Generic titles recur across distinct studies and review updates, so a
+# title match also needs the years (within this gap) or first authors to agree
+MAX_TITLE_MATCH_YEAR_GAP = 1
+_NAME_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+
+def _first_author_names(authors: Optional[Sequence[str]]) -> Set[str]:
+    # Name words without initials, so "Smith J", "J. Smith" and "Smith, John" agree
+    if not authors:
+        return set()
+    return {word for word in _NAME_WORD_PATTERN.findall(authors[0].lower()) if len(word) > 1}
+
+
+def same_study_metadata(year_a: Optional[int], authors_a: Optional[Sequence[str]],
+                        year_b: Optional[int], authors_b: Optional[Sequence[str]]) -> bool:
+    """Whether two records with the same title agree on year or first author."""
+    if year_a and year_b and abs(year_a - year_b) <= MAX_TITLE_MATCH_YEAR_GAP:
+        return True
+    return not _first_author_names(authors_a).isdisjoint(_first_author_names(authors_b))
+
+
+def extract_dois(text: str) -> List[str]:
+    """Return the distinct DOIs mentioned in ``text`` in order of appearance."""
+    dois = (m.rstrip(".,;)]") for m in DOI_PATTERN.findall(text))
+    return list(dict.fromkeys(dois))
+
+
+def chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+async def fetch_doi_batches(
+    dois: Iterable[str],
+    batch_size: int,
+    reserved: str,
+    fetch_batch: Callable[[Sequence[str]], Awaitable[Optional[Dict[str, Any]]]],
+) -> Tuple[Dict[str, Any], List[str]]:
+    """Look up normalized ``dois`` through a filter endpoint, ``batch_size`` at a time.
+
+    ``fetch_batch`` returns the records it found keyed by normalized DOI, or
+    ``None`` if the request failed. DOIs absent from a successful batch map to
+    ``{}``. Returns ``(found, unbatched)`` where ``unbatched`` lists DOIs from
+    failed batches and DOIs containing one of the ``reserved`` filter
+    separators; callers resolve those one by one.
+    """
+    batchable: List[str] = []
+    unbatched: List[str] = []
+    for doi in dois:
+        (unbatched if any(c in doi for c in reserved) else batchable).append(doi)
+
+    batches = list(chunked(batchable, batch_size))
+    responses = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+    found: Dict[str, Any] = {}
+    for batch, records in zip(batches, responses):
+        if records is None:
+            unbatched.extend(batch)
+            continue
+        for doi in batch:
+            found[doi] = records.get(doi, {})
+    return found, unbatched
+
+
+_END_OF_PAGES = object()
+
+
+async def stream_cursor_pages(
+    fetch_page: Callable[[str], Awaitable[Tuple[List[Any], Optional[str]]]],
+    prefetch: int = 1,
+    first_cursor: str = "*",
+) -> AsyncIterator[List[Any]]:
+    """Yield the pages of a cursor-paginated API.
+
+    ``fetch_page(cursor)`` returns ``(items, next_cursor)``; iteration stops at
+    an empty page or a ``None`` cursor. The next pages are fetched in the
+    background while the consumer works on the current one, but at most
+    ``prefetch`` pages are buffered, so a slow consumer throttles requests.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+
+    async def produce() -> None:
+        cursor: Optional[str] = first_cursor
+        try:
+            while cursor is not None:
+                items, cursor = await fetch_page(cursor)
+                if not items:
+                    break
+                await queue.put(items)
+            await queue.put(_END_OF_PAGES)
+        except Exception as exc:
+            await queue.put(exc)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await queue.get()
+            if page is _END_OF_PAGES:
+                return
+            if isinstance(page, Exception):
+                raise page
+            yield page
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+
 
 class CacheKeyBuilder:
     """Builds cache keys for API requests."""
@@ -22,25 +164,51 @@ class CacheKeyBuilder:
 
 
 class ConnectionManager:
-    """Manages a reusable aiohttp session."""
+    """Manages reusable aiohttp sessions, one per event loop.
+
+    aiohttp sessions are bound to the event loop that created them, so each
+    loop using the manager gets its own session, keyed by loop like
+    ``SingleFlight``. Sessions stay open while their loop is alive, so a
+    loop never closes a session another loop still has requests in flight
+    on; sessions of loops that have since been closed are cleaned up when
+    the next session is opened.
+    """
 
     def __init__(self) -> None:
-        self._session: aiohttp.ClientSession | None = None
+        self._sessions: Dict[asyncio.AbstractEventLoop, "aiohttp.ClientSession"] = {}
 
     async def _create_session(self) -> "aiohttp.ClientSession":
         if aiohttp is None:
-            raise RuntimeError("aiohttp not installed")
+            raise ServiceUnavailableError("aiohttp is required for academic API requests")
         return aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
 
     async def get_session(self) -> "aiohttp.ClientSession":
-        if self._session is None:
-            self._session = await self._create_session()
-        return self._session
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            await self._close_sessions(lambda other: other.is_closed())
+            session = self._sessions[loop] = await self._create_session()
+        return session
+
+    async def _close_sessions(self, should_close: Callable[[asyncio.AbstractEventLoop], bool]) -> None:
+        current = asyncio.get_running_loop()
+        for loop, session in list(self._sessions.items()):
+            if not should_close(loop):
+                continue
+            del self._sessions[loop]
+            if session.closed:
+                continue
+            if loop is not current and loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+                continue
+            try:
+                await session.close()
+            except Exception:  # pragma: no cover - transports of a closed loop
+                session.detach()
 
     async def close(self) -> None:
-        if self._session is not None:
-            await self._session.close()
-            self._session = None
+        """Close the sessions of every loop, each on its own loop if it is still running."""
+        await self._close_sessions(lambda loop: True)
 
     async def __aenter__(self) -> "ConnectionManager":
         return self
@@ -49,18 +217,182 @@ class ConnectionManager:
         await self.close()
 
 
+class BackgroundLoop:
+    """An event loop in a daemon thread for running coroutines from sync code.
+
+    Unlike calling ``asyncio.run`` per call, the loop, and the HTTP sessions
+    bound to it, are reused for the lifetime of the process.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name="storm-background-loop", daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run ``coro`` on the background loop and block until it finishes."""
+        if self.owns_current_thread():
+            coro.close()  # type: ignore[attr-defined]
+            raise RuntimeError("BackgroundLoop.run() called from its own loop; await the coroutine instead")
+        return self.submit(coro).result(timeout)
+
+    def submit(self, coro: Awaitable[T]) -> concurrent.futures.Future[T]:
+        """Schedule ``coro`` on the background loop without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def owns_current_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._loop is None:
+                return
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            if self._thread is not None:
+                self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+
+
+_background_loop = BackgroundLoop()
+
+
+def run_sync(coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+    """Run ``coro`` to completion from synchronous code on the shared background loop."""
+    return _background_loop.run(coro, timeout)
+
+
+async def run_on_background_loop(coro: Awaitable[T]) -> T:
+    """Await ``coro`` on the shared background loop, from any event loop.
+
+    Loop-bound resources such as HTTP sessions can then live on the
+    background loop and be shared by callers on short-lived loops.
+    """
+    if _background_loop.owns_current_thread():
+        return await coro
+    return await asyncio.wrap_future(_background_loop.submit(coro))
+
+
 class CircuitBreaker:
-    """Simple circuit breaker for failing external calls."""
+    """Circuit breaker with a cooldown and half-open probes.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    rejects requests for ``reset_timeout`` seconds. It then turns half-open
+    and lets ``half_open_max_calls`` probe requests through: a success closes
+    it again, a failure re-opens it for another cooldown.
+    """
 
-    def __init__(self, failure_threshold: int = 3) -> None:
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
         self.failure_count = 0
         self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._opened_at = 0.0
+        self._probes = 0
+
+    @property
+    def state(self) -> str:
+        if self.failure_count < self.failure_threshold:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return self.OPEN
+        return self.HALF_OPEN
 
     def record_success(self) -> None:
         self.failure_count = 0
+        self._probes = 0
 
     def record_failure(self) -> None:
         self.failure_count += 1
+        if self.failure_count >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+            self._probes = 0
 
     def should_allow_request(self) -> bool:
-        return self.failure_count < self.failure_threshold
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN or self._probes >= self.half_open_max_calls:
+            return False
+        self._probes += 1
+        return True
+
+
+class HostCircuitBreakers:
+    """One ``CircuitBreaker`` per host, so an outage of one API does not block the others."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = parse.urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            self._breakers[host] = breaker
+        return breaker
+
+    def states(self) -> Dict[str, str]:
+        return {host: breaker.state for host, breaker in self._breakers.items()}
+
+
+class SingleFlight:
+    """Coalesce concurrent identical requests into one in-flight call.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task. Calls are keyed per event loop, so one
+    instance can be shared by services running on different loops.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Tuple[int, str], asyncio.Task] = {}
+        self.shared_calls = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        call_key = (id(loop), key)
+        task = self._calls.get(call_key)
+        if task is None:
+            task = loop.create_task(fn())
+            self._calls[call_key] = task
+            task.add_done_callback(lambda t: self._finish(call_key, t))
+        else:
+            self.shared_calls += 1
+        # shield: a cancelled caller must not cancel the call for the others.
+        return await asyncio.shield(task)
+
+    def _finish(self, call_key: Tuple[int, str], task: asyncio.Task) -> None:
+        if self._calls.get(call_key) is task:
+            del self._calls[call_key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every caller was cancelled
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+
+# Shared by the academic services so that e.g. a Crossref DOI lookup from
+# AcademicSourceService and CrossrefService is only sent once.
+default_single_flight = SingleFlight()
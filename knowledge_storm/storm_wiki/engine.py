@@ -132,6 +132,13 @@ class STORMWikiRunnerArguments:
             "Consider reducing it if keep getting 'Exceed rate limit' error when calling LM API."
         },
     )
+    stream_llm_call_history: bool = field(
+        default=False,
+        metadata={
+            "help": "If True, write llm_call_history.jsonl incrementally while the pipeline runs "
+            "instead of collecting all calls in memory until post_run."
+        },
+    )
 
 
 class STORMWikiRunner(Engine):
@@ -269,17 +276,24 @@ class STORMWikiRunner(Engine):
         """
         Post-run operations, including:
         1. Dumping the run configuration.
-        2. Dumping the LLM call history.
+        2. Dumping per-call LM/RM telemetry.
+        3. Dumping the LLM call history.
         """
         config_log = self.lm_configs.log()
         FileIOHelper.dump_json(
             config_log, os.path.join(self.article_output_dir, "run_config.json")
         )
+        self.export_call_telemetry(
+            os.path.join(self.article_output_dir, "call_telemetry.json")
+        )
 
         llm_call_history = self.lm_configs.collect_and_reset_lm_history()
-        with open(
-            os.path.join(self.article_output_dir, "llm_call_history.jsonl"), "w"
-        ) as f:
+        history_path = os.path.join(self.article_output_dir, "llm_call_history.jsonl")
+        writer = self.lm_configs.stop_streaming_lm_history()
+        if writer is not None and writer.path == history_path:
+            # Calls were already written incrementally during the run.
+            return
+        with open(history_path, "w") as f:
             for call in llm_call_history:
                 if "kwargs" in call:
                     call.pop(
@@ -361,6 +375,10 @@ class STORMWikiRunner(Engine):
             self.args.output_dir, self.article_dir_name
         )
         os.makedirs(self.article_output_dir, exist_ok=True)
+        if self.args.stream_llm_call_history:
+            self.lm_configs.stream_lm_history_to(
+                os.path.join(self.article_output_dir, "llm_call_history.jsonl")
+            )
 
         # research module
         information_table: StormInformationTable = None
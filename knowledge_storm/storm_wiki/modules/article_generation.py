@@ -1,4 +1,5 @@
 import concurrent.futures
+import contextvars
 import copy
 import logging
 from concurrent.futures import as_completed
@@ -13,6 +14,10 @@ from .callback import BaseCallbackHandler
 from .storm_dataclass import StormInformationTable, StormArticle, StormInformation
 from ...interface import ArticleGenerationModule
 from ...utils import ArticleTextProcessing
+from ...token_budget import fit_to_budget
+
+# Token budget for collected information (roughly the former 1500 word cap).
+SECTION_INFO_TOKENS = 2000
 
 
 class StormArticleGenerationModule(ArticleGenerationModule):
@@ -118,6 +123,7 @@ class StormArticleGenerationModule(ArticleGenerationModule):
                     section_outline = "\n".join(queries_with_hashtags)
                     future_to_sec_title[
                         executor.submit(
+                            contextvars.copy_context().run,
                             self.generate_section,
                             topic,
                             section_title,
@@ -166,7 +172,7 @@ class ConvToSection(dspy.Module):
             info += f"[{idx + 1}]\n" + "\n".join(storm_info.snippets)
             info += "\n\n"
 
-        info = ArticleTextProcessing.limit_word_count_preserve_newline(info, 1500)
+        info = fit_to_budget(info, self.engine, SECTION_INFO_TOKENS)
 
         with dspy.settings.context(lm=self.engine):
             section = ArticleTextProcessing.clean_up_section(
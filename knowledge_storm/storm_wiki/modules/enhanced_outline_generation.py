@@ -6,6 +6,8 @@ from .callback import BaseCallbackHandler
 from .storm_dataclass import StormInformationTable, StormArticle
 from ...interface import OutlineGenerationModule
 from ...utils import ArticleTextProcessing
+from ...token_budget import fit_to_budget
+from .outline_generation import OUTLINE_CONV_TOKENS
 
 
 class EnhancedWritePageOutline(dspy.Signature):
@@ -191,7 +193,7 @@ class EnhancedWriteOutline(dspy.Module):
             ]
         )
         conv = ArticleTextProcessing.remove_citations(conv)
-        conv = ArticleTextProcessing.limit_word_count_preserve_newline(conv, 5000)
+        conv = fit_to_budget(conv, self.engine, OUTLINE_CONV_TOKENS)
         
         with dspy.settings.context(lm=self.engine):
             # Generate initial draft if needed
@@ -1,4 +1,5 @@
 import concurrent.futures
+import contextvars
 import logging
 import os
 from concurrent.futures import as_completed
@@ -11,6 +12,11 @@ from .persona_generator import StormPersonaGenerator
 from .storm_dataclass import DialogueTurn, StormInformationTable, StormInformation
 from ...interface import KnowledgeCurationModule, Retriever
 from ...utils import ArticleTextProcessing
+from ...token_budget import fit_to_budget
+
+# Token budgets for prompt context (roughly the former 2500/1000 word caps).
+ASK_QUESTION_CONV_TOKENS = 3200
+ANSWER_QUESTION_INFO_TOKENS = 1300
 
 try:
     from streamlit.runtime.scriptrunner import add_script_run_ctx
@@ -110,7 +116,7 @@ class WikiWriter(dspy.Module):
             )
         conv = "\n".join(conv)
         conv = conv.strip() or "N/A"
-        conv = ArticleTextProcessing.limit_word_count_preserve_newline(conv, 2500)
+        conv = fit_to_budget(conv, self.engine, ASK_QUESTION_CONV_TOKENS)
 
         with dspy.settings.context(lm=self.engine):
             if persona is not None and len(persona.strip()) > 0:
@@ -222,9 +228,7 @@ class TopicExpert(dspy.Module):
                     info += "\n".join(f"[{n + 1}]: {s}" for s in r.snippets[:1])
                     info += "\n\n"
 
-                info = ArticleTextProcessing.limit_word_count_preserve_newline(
-                    info, 1000
-                )
+                info = fit_to_budget(info, self.engine, ANSWER_QUESTION_INFO_TOKENS)
 
                 try:
                     answer = self.answer_question(
@@ -327,7 +331,9 @@ class StormKnowledgeCurationModule(KnowledgeCurationModule):
 
         with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_persona = {
-                executor.submit(run_conv, persona): persona
+                # Each conversation runs in a copy of this context so its LM/RM
+                # calls are recorded under the calling engine's stage
+                executor.submit(contextvars.copy_context().run, run_conv, persona): persona
                 for persona in considered_personas
             }
 
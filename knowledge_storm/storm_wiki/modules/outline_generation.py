@@ -6,6 +6,10 @@ from .callback import BaseCallbackHandler
 from .storm_dataclass import StormInformationTable, StormArticle
 from ...interface import OutlineGenerationModule
 from ...utils import ArticleTextProcessing
+from ...token_budget import fit_to_budget
+
+# Token budget for the conversation history (roughly the former 5000 word cap).
+OUTLINE_CONV_TOKENS = 6500
 
 
 class StormOutlineGenerationModule(OutlineGenerationModule):
@@ -103,7 +107,7 @@ class WriteOutline(dspy.Module):
             ]
         )
         conv = ArticleTextProcessing.remove_citations(conv)
-        conv = ArticleTextProcessing.limit_word_count_preserve_newline(conv, 5000)
+        conv = fit_to_budget(conv, self.engine, OUTLINE_CONV_TOKENS)
 
         with dspy.settings.context(lm=self.engine):
             if old_outline is None:
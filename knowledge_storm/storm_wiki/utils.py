@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import concurrent.futures
 import json
 import logging
@@ -5,19 +7,17 @@ import os
 import pickle
 import re
 import sys
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 
 import httpx
-import pandas as pd
 import toml
-from langchain_core.documents import Document
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_qdrant import Qdrant
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from qdrant_client import QdrantClient, models
-from tqdm import tqdm
 from trafilatura import extract
 
+if TYPE_CHECKING:  # pragma: no cover - vector store deps are imported on use
+    from langchain_huggingface import HuggingFaceEmbeddings
+    from qdrant_client import QdrantClient
+
 logging.getLogger("httpx").setLevel(logging.WARNING)  # Disable INFO logging for httpx.
 
 
@@ -71,6 +71,9 @@ class QdrantVectorStoreManager:
         client: QdrantClient, collection_name: str, model: HuggingFaceEmbeddings
     ):
         """Check if the Qdrant collection exists and create it if it does not."""
+        from langchain_qdrant import Qdrant
+        from qdrant_client import models
+
         if client is None:
             raise ValueError("Qdrant client is not initialized.")
         if client.collection_exists(collection_name=f"{collection_name}"):
@@ -115,6 +118,8 @@ class QdrantVectorStoreManager:
             raise ValueError("Please provide a url for the Qdrant server.")
 
         try:
+            from qdrant_client import QdrantClient
+
             client = QdrantClient(url=url, api_key=api_key)
             return QdrantVectorStoreManager._check_create_collection(
                 client=client, collection_name=collection_name, model=model
@@ -135,6 +140,8 @@ class QdrantVectorStoreManager:
             raise ValueError("Please provide a folder path.")
 
         try:
+            from qdrant_client import QdrantClient
+
             client = QdrantClient(path=vector_store_path)
             return QdrantVectorStoreManager._check_create_collection(
                 client=client, collection_name=collection_name, model=model
@@ -186,6 +193,11 @@ class QdrantVectorStoreManager:
         if collection_name is None:
             raise ValueError("Please provide a collection name.")
 
+        import pandas as pd
+        from langchain_core.documents import Document
+        from langchain_huggingface import HuggingFaceEmbeddings
+        from tqdm import tqdm
+
         model_kwargs = {"device": device}
         encode_kwargs = {"normalize_embeddings": True}
         model = HuggingFaceEmbeddings(
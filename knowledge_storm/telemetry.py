@@ -0,0 +1,294 @@
+"""Per-call latency and token telemetry for LM and RM calls.
+
+Every ``TokenTrackingLM.basic_request`` (and ``TogetherClient``) and every RM
+``forward()`` records a ``CallSpan``. Each ``Engine`` records the spans of its
+``run_*`` stages in its own recorder, tagged with the stage that issued them,
+and stores p50/p95/p99 summaries per stage. Calls made outside ``recording()``
+go to the process-wide ``get_recorder()``. Spans can be exported as plain
+JSON or as OTLP/JSON, which OpenTelemetry collectors accept directly.
+
+Code running inside a call can enrich the active span through
+``current_span()``, e.g. the Crossref service marks cache hits and rate
+limiter waits, and the endpoint pool counts failovers as retries.
+"""
+
+import contextvars
+import functools
+from contextlib import contextmanager
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+DEFAULT_MAX_SPANS = 100_000
+PERCENTILES = (50, 95, 99)
+
+_current_span: contextvars.ContextVar = contextvars.ContextVar("storm_current_span", default=None)
+_current_stage: contextvars.ContextVar = contextvars.ContextVar("storm_current_stage", default=None)
+_current_recorder: contextvars.ContextVar = contextvars.ContextVar("storm_current_recorder", default=None)
+
+
+@dataclass
+class CallSpan:
+    """One LM or RM call."""
+
+    kind: str  # "lm" or "rm"
+    name: str  # model name or RM class
+    stage: Optional[str] = None
+    start_time: float = 0.0  # wall clock, seconds since epoch
+    duration: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    queue_wait: float = 0.0
+    network_time: float = 0.0
+    cache_hits: int = 0
+    retry_count: int = 0
+    num_queries: int = 0
+    error: Optional[str] = None
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+
+    @property
+    def cache_hit(self) -> bool:
+        return self.cache_hits > 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["cache_hit"] = self.cache_hit
+        return data
+
+
+def current_span() -> Optional[CallSpan]:
+    """Return the span of the LM/RM call in progress, if any."""
+    return _current_span.get()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(len(sorted_values) * pct / 100))
+    return sorted_values[rank - 1]
+
+
+class TelemetryRecorder:
+    """Thread-safe, bounded store of call spans."""
+
+    def __init__(self, max_spans: int = DEFAULT_MAX_SPANS):
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self.enabled = True
+        self.trace_id = os.urandom(16).hex()
+
+    def record(self, span: CallSpan) -> None:
+        if self.enabled:
+            with self._lock:
+                self._spans.append(span)
+
+    def spans(self, stage: Optional[str] = None) -> List[CallSpan]:
+        with self._lock:
+            spans = list(self._spans)
+        if stage is None:
+            return spans
+        return [s for s in spans if s.stage == stage]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._spans.clear()
+        self.trace_id = os.urandom(16).hex()
+
+    def summarize(self, stage: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Latency percentiles and totals per ``"<kind>:<name>"``."""
+        groups: Dict[str, List[CallSpan]] = {}
+        for span in self.spans(stage):
+            groups.setdefault(f"{span.kind}:{span.name}", []).append(span)
+
+        summary = {}
+        for key, spans in groups.items():
+            durations = sorted(s.duration for s in spans)
+            stats = {
+                "count": len(spans),
+                "errors": sum(1 for s in spans if s.error),
+                "mean": sum(durations) / len(durations),
+                "max": durations[-1],
+                "prompt_tokens": sum(s.prompt_tokens for s in spans),
+                "completion_tokens": sum(s.completion_tokens for s in spans),
+                "queue_wait": sum(s.queue_wait for s in spans),
+                "cache_hits": sum(s.cache_hits for s in spans),
+                "retries": sum(s.retry_count for s in spans),
+            }
+            for pct in PERCENTILES:
+                stats[f"p{pct}"] = _percentile(durations, pct)
+            summary[key] = stats
+        return summary
+
+    def summarize_by_stage(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        stages = {s.stage for s in self.spans()}
+        return {str(stage): self.summarize(stage) for stage in stages}
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "spans": [s.to_dict() for s in self.spans()],
+            "summary": self.summarize_by_stage(),
+        }
+
+    def to_otlp(self, service_name: str = "knowledge_storm") -> Dict[str, Any]:
+        """Spans in the OTLP/JSON trace format."""
+        otlp_spans = []
+        for span in self.spans():
+            start_ns = int(span.start_time * 1e9)
+            attributes = {
+                "storm.kind": span.kind,
+                "storm.name": span.name,
+                "storm.stage": span.stage or "",
+                "storm.prompt_tokens": span.prompt_tokens,
+                "storm.completion_tokens": span.completion_tokens,
+                "storm.queue_wait_s": span.queue_wait,
+                "storm.network_time_s": span.network_time,
+                "storm.cache_hit": span.cache_hit,
+                "storm.retry_count": span.retry_count,
+                "storm.num_queries": span.num_queries,
+            }
+            otlp_span = {
+                "traceId": self.trace_id,
+                "spanId": span.span_id,
+                "name": f"{span.kind}.{span.name}",
+                "kind": 3,  # SPAN_KIND_CLIENT
+                "startTimeUnixNano": str(start_ns),
+                "endTimeUnixNano": str(start_ns + int(span.duration * 1e9)),
+                "attributes": [_otlp_attribute(k, v) for k, v in attributes.items()],
+                "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+            }
+            otlp_spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", service_name)]},
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": otlp_spans}],
+                }
+            ]
+        }
+
+    def dump(self, path: str, fmt: str = "json") -> None:
+        data = self.to_otlp() if fmt == "otlp" else self.to_json()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+_recorder = TelemetryRecorder()
+
+
+def get_recorder() -> TelemetryRecorder:
+    return _recorder
+
+
+def current_stage() -> Optional[str]:
+    """Return the stage set by the enclosing ``recording()``, if any."""
+    return _current_stage.get()
+
+
+@contextmanager
+def recording(recorder: TelemetryRecorder, stage: Optional[str] = None) -> Iterator[TelemetryRecorder]:
+    """Record the spans of calls made in this context into ``recorder``, tagged with ``stage``.
+
+    The setting follows the current context, so concurrent engines do not see
+    each other's stages. Worker threads inherit it only when run in a copy of
+    the context (``contextvars.copy_context().run``).
+    """
+    recorder_token = _current_recorder.set(recorder)
+    stage_token = _current_stage.set(stage)
+    try:
+        yield recorder
+    finally:
+        _current_stage.reset(stage_token)
+        _current_recorder.reset(recorder_token)
+
+
+class _SpanScope:
+    """Activates a span for the duration of a call and records it."""
+
+    def __init__(self, span: CallSpan, recorder: TelemetryRecorder):
+        self.span = span
+        self.recorder = recorder
+
+    def __enter__(self) -> CallSpan:
+        self.span.stage = _current_stage.get()
+        self.span.start_time = time.time()
+        self._start = time.perf_counter()
+        self._token = _current_span.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        _current_span.reset(self._token)
+        span = self.span
+        span.duration = time.perf_counter() - self._start
+        span.network_time = max(0.0, span.duration - span.queue_wait)
+        if exc is not None:
+            span.error = f"{exc_type.__name__}: {exc}"
+        self.recorder.record(span)
+
+
+def start_span(kind: str, name: str, recorder: Optional[TelemetryRecorder] = None) -> _SpanScope:
+    recorder = recorder or _current_recorder.get() or _recorder
+    return _SpanScope(CallSpan(kind=kind, name=name), recorder)
+
+
+def _lm_name(lm: Any) -> str:
+    kwargs = getattr(lm, "kwargs", None)
+    if isinstance(kwargs, dict) and kwargs.get("model"):
+        return str(kwargs["model"])
+    return str(getattr(lm, "model", type(lm).__name__))
+
+
+def _record_usage(span: CallSpan, response: Any) -> None:
+    usage = response.get("usage") if isinstance(response, dict) else getattr(response, "usage", None)
+    if isinstance(usage, dict):
+        span.prompt_tokens += usage.get("prompt_tokens", 0) or 0
+        span.completion_tokens += usage.get("completion_tokens", 0) or 0
+
+
+def trace_lm_call(func: Callable) -> Callable:
+    """Decorate an LM ``basic_request`` to record a span per call."""
+    if getattr(func, "_storm_traced", False):
+        return func
+
+    @functools.wraps(func)
+    def wrapper(self, prompt, **kwargs):
+        active = current_span()
+        if active is not None and active.kind == "lm":
+            # Already inside a traced request (e.g. a subclass calling super()).
+            return func(self, prompt, **kwargs)
+        with start_span("lm", _lm_name(self)) as span:
+            response = func(self, prompt, **kwargs)
+            _record_usage(span, response)
+            return response
+
+    wrapper._storm_traced = True
+    return wrapper
+
+
+def trace_rm_call(func: Callable) -> Callable:
+    """Decorate an RM ``forward`` to record a span per call."""
+
+    @functools.wraps(func)
+    def wrapper(self, query_or_queries, *args, **kwargs):
+        with start_span("rm", type(self).__name__) as span:
+            span.num_queries = 1 if isinstance(query_or_queries, str) else len(query_or_queries)
+            return func(self, query_or_queries, *args, **kwargs)
+
+    return wrapper
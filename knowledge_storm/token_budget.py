@@ -0,0 +1,211 @@
+"""Token-based prompt budgeting using locally available tokenizers.
+
+Prompt builders used to cap context by word count, which is only a rough proxy
+for the number of tokens a model actually sees. ``fit_to_budget`` trims text to
+a token budget instead, using (in order of preference):
+
+1. a Hugging Face tokenizer registered for the model (``TogetherClient``
+   registers the one it already loads for chat templates);
+2. ``tiktoken`` when it is installed and its encoding loads. Loading may
+   download BPE files; if that takes longer than ``TIKTOKEN_LOAD_TIMEOUT``,
+   the estimate is used until the download finishes in the background;
+3. a fast regex estimate that never under-counts ordinary English text by much.
+
+Counters are cached per model, so the cost per prompt is one encode pass in
+the common case where the text already fits.
+"""
+
+import concurrent.futures
+import logging
+import re
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
+
+try:
+    import tiktoken  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIKTOKEN_ENCODING = "cl100k_base"
+CHARS_PER_TOKEN = 4
+
+# Words are split into chunks of at most CHARS_PER_TOKEN characters, so a
+# single ``findall`` yields one piece per short word or symbol and roughly one
+# per CHARS_PER_TOKEN characters for longer words.
+_TOKEN_PIECE_PATTERN = re.compile(r"\w{1,%d}|[^\w\s]" % CHARS_PER_TOKEN)
+
+# tiktoken downloads BPE files that are not cached yet, so encodings load in a
+# daemon thread and a caller waits at most this long before estimating instead
+TIKTOKEN_LOAD_TIMEOUT = 1.0
+
+_tiktoken_loads: Dict[str, "concurrent.futures.Future"] = {}
+_tiktoken_lock = threading.Lock()
+
+_registered_tokenizers: Dict[str, Any] = {}
+_registry_lock = threading.Lock()
+
+
+class TokenCounter:
+    """Counts tokens in a string with a specific backend."""
+
+    def __init__(self, name: str, count_fn: Callable[[str], int]):
+        self.name = name
+        self._count_fn = count_fn
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return self._count_fn(text)
+
+
+def _estimate_tokens(text: str) -> int:
+    """Approximate BPE token count without a tokenizer."""
+    return len(_TOKEN_PIECE_PATTERN.findall(text))
+
+
+def _hf_counter(name: str, tokenizer: Any) -> TokenCounter:
+    def count(text: str) -> int:
+        return len(tokenizer.encode(text, add_special_tokens=False))
+
+    return TokenCounter(f"hf:{name}", count)
+
+
+def _load_tiktoken_encoding(encoding_name: str) -> "concurrent.futures.Future":
+    """Start loading ``encoding_name`` once per process; returns its future."""
+    with _tiktoken_lock:
+        loading = _tiktoken_loads.get(encoding_name)
+        if loading is None:
+            loading = _tiktoken_loads[encoding_name] = concurrent.futures.Future()
+
+            def load():
+                try:
+                    loading.set_result(tiktoken.get_encoding(encoding_name))
+                except Exception as e:
+                    loading.set_exception(e)
+
+            # Daemon, so a stalled download never holds up interpreter exit
+            threading.Thread(target=load, name=f"tiktoken-{encoding_name}", daemon=True).start()
+    return loading
+
+
+def _tiktoken_counter(model: Optional[str]) -> Optional[TokenCounter]:
+    if tiktoken is None:
+        return None
+    try:
+        encoding_name = tiktoken.model.encoding_name_for_model(model or "")
+    except KeyError:
+        encoding_name = DEFAULT_TIKTOKEN_ENCODING
+    loading = _load_tiktoken_encoding(encoding_name)
+    try:
+        encoding = loading.result(timeout=TIKTOKEN_LOAD_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        logger.debug("tiktoken %s is still loading; estimating until it is ready", encoding_name)
+        return _loading_tiktoken_counter(encoding_name, loading)
+    except Exception as e:  # BPE file not available offline
+        logger.debug("tiktoken encoding unavailable for %s: %s", model, e)
+        return None
+
+    def count(text: str) -> int:
+        return len(encoding.encode(text, disallowed_special=()))
+
+    return TokenCounter(f"tiktoken:{encoding.name}", count)
+
+
+def _loading_tiktoken_counter(encoding_name: str, loading: "concurrent.futures.Future") -> TokenCounter:
+    """Estimate tokens until ``loading`` yields the encoding, then use it."""
+
+    def count(text: str) -> int:
+        if loading.done() and loading.exception() is None:
+            return len(loading.result().encode(text, disallowed_special=()))
+        return _estimate_tokens(text)
+
+    return TokenCounter(f"tiktoken:{encoding_name}(loading)", count)
+
+
+def register_tokenizer(model: str, tokenizer: Any) -> None:
+    """Use ``tokenizer`` (anything with a HF-style ``encode``) for ``model``."""
+    with _registry_lock:
+        _registered_tokenizers[model] = tokenizer
+    get_token_counter.cache_clear()
+
+
+def resolve_model_name(model: Union[str, Any, None]) -> Optional[str]:
+    """Return the model name for a model string or an LM instance."""
+    if model is None or isinstance(model, str):
+        return model
+    kwargs = getattr(model, "kwargs", None)
+    if isinstance(kwargs, dict) and kwargs.get("model"):
+        return kwargs["model"]
+    name = getattr(model, "model", None)
+    return name if isinstance(name, str) else None
+
+
+@lru_cache(maxsize=64)
+def get_token_counter(model: Optional[str] = None) -> TokenCounter:
+    """Return the cached token counter for ``model``."""
+    with _registry_lock:
+        tokenizer = _registered_tokenizers.get(model) if model else None
+    if tokenizer is not None:
+        return _hf_counter(model, tokenizer)
+    counter = _tiktoken_counter(model)
+    if counter is not None:
+        return counter
+    return TokenCounter("estimate", _estimate_tokens)
+
+
+def count_tokens(text: str, model: Union[str, Any, None] = None) -> int:
+    return get_token_counter(resolve_model_name(model)).count(text)
+
+
+def _fit_line(line: str, budget: int, counter: TokenCounter) -> str:
+    """Longest word prefix of ``line`` that fits in ``budget`` tokens."""
+    words = line.split()
+    lo, hi = 0, len(words)
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if counter.count(" ".join(words[:mid])) <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return " ".join(words[:lo])
+
+
+def fit_to_budget(
+    text: str, model: Union[str, Any, None] = None, max_tokens: int = 2048
+) -> str:
+    """Truncate ``text`` to at most ``max_tokens`` tokens for ``model``.
+
+    Like ``ArticleTextProcessing.limit_word_count_preserve_newline``, complete
+    lines are kept while they fit and the first line that does not fit is cut
+    at a word boundary.
+
+    Args:
+        text: The prompt context to trim.
+        model: Model name or LM instance used to pick the tokenizer.
+        max_tokens: Maximum number of tokens allowed in the result.
+
+    Returns:
+        str: ``text`` unchanged if it fits, otherwise the truncated text.
+    """
+    counter = get_token_counter(resolve_model_name(model))
+    if counter.count(text) <= max_tokens:
+        return text
+
+    kept = []
+    used = 0
+    for line in text.split("\n"):
+        # +1 accounts for the newline joining this line to the previous one.
+        line_tokens = counter.count(line) + (1 if kept else 0)
+        if used + line_tokens <= max_tokens:
+            kept.append(line)
+            used += line_tokens
+            continue
+        partial = _fit_line(line, max_tokens - used - (1 if kept else 0), counter)
+        if partial:
+            kept.append(partial)
+        break
+
+    return "\n".join(kept).strip()
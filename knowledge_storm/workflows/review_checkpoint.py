@@ -0,0 +1,148 @@
+"""
+Run directories for resumable systematic reviews.
+
+Each review run gets a directory holding a small JSON manifest plus one file
+per step output. Paper lists, screening decisions and extraction rows are
+JSON Lines, appended a chunk at a time while a step runs, so an interrupted
+run can resume inside a step. A line cut short by a crash is ignored on read.
+
+Layout::
+
+    <runs_dir>/<review_id>/
+        manifest.json       config, completed steps, step timings
+        <step>.json         step summary (strategy, counts, report)
+        papers.jsonl        retrieved or provided papers
+        screening.jsonl     one decision per screened paper
+        extraction.jsonl    one extraction row per included paper
+"""
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from ..modules.prisma import Paper, SearchStrategy
+
+MANIFEST_FILE = "manifest.json"
+PAPERS_FILE = "papers.jsonl"
+SCREENING_FILE = "screening.jsonl"
+EXTRACTION_FILE = "extraction.jsonl"
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def strategy_to_dict(strategy: SearchStrategy) -> Dict[str, Any]:
+    return asdict(strategy)
+
+
+def strategy_from_dict(data: Dict[str, Any]) -> SearchStrategy:
+    data = dict(data)
+    if data.get('date_range'):
+        data['date_range'] = tuple(data['date_range'])
+    return SearchStrategy(**data)
+
+
+class ReviewCheckpoint:
+    """Persisted state of one systematic review run."""
+
+    def __init__(self, run_dir: Union[str, Path], manifest: Dict[str, Any]):
+        self.run_dir = Path(run_dir)
+        self.manifest = manifest
+
+    @classmethod
+    def create(cls, runs_dir: Union[str, Path], review_id: str, config: Dict[str, Any]) -> "ReviewCheckpoint":
+        """Start a new run directory; fails if ``review_id`` already has one."""
+        run_dir = Path(runs_dir) / review_id
+        run_dir.mkdir(parents=True, exist_ok=False)
+        checkpoint = cls(run_dir, {
+            'review_id': review_id,
+            'config': config,
+            'completed_steps': [],
+            'step_timings': {},
+        })
+        checkpoint._write_manifest()
+        return checkpoint
+
+    @classmethod
+    def open(cls, runs_dir: Union[str, Path], review_id: str) -> "ReviewCheckpoint":
+        """Open an existing run directory."""
+        run_dir = Path(runs_dir) / review_id
+        with open(run_dir / MANIFEST_FILE, encoding='utf-8') as f:
+            return cls(run_dir, json.load(f))
+
+    @property
+    def review_id(self) -> str:
+        return self.manifest['review_id']
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        return self.manifest['config']
+
+    @property
+    def step_timings(self) -> Dict[str, float]:
+        return self.manifest['step_timings']
+
+    def is_complete(self, step: str) -> bool:
+        return step in self.manifest['completed_steps']
+
+    def complete_step(self, step: str, step_time: float, summary: Optional[Dict[str, Any]] = None):
+        """Record ``step`` as done, with its JSON-serializable ``summary``."""
+        if summary is not None:
+            self._write_atomic(f"{step}.json", _dumps(summary))
+        self.manifest['step_timings'][step] = step_time
+        if step not in self.manifest['completed_steps']:
+            self.manifest['completed_steps'].append(step)
+        self._write_manifest()
+
+    def load_step(self, step: str) -> Dict[str, Any]:
+        with open(self.run_dir / f"{step}.json", encoding='utf-8') as f:
+            return json.load(f)
+
+    def write_papers(self, papers: Iterable[Paper]):
+        self._write_atomic(PAPERS_FILE, "".join(_dumps(asdict(paper)) + "\n" for paper in papers))
+
+    def read_papers(self) -> List[Paper]:
+        return [Paper.from_dict(record) for record in self.read_records(PAPERS_FILE)]
+
+    def append_records(self, name: str, records: Iterable[Dict[str, Any]]):
+        """Append records to the JSON Lines file ``name`` and flush them to disk."""
+        with open(self.run_dir / name, 'a', encoding='utf-8') as f:
+            f.writelines(_dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read_records(self, name: str) -> List[Dict[str, Any]]:
+        """Complete records of the JSON Lines file ``name``; [] if it does not exist."""
+        records = []
+        try:
+            with open(self.run_dir / name, encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith("\n"):
+                        break  # Partial write of an interrupted run
+                    records.append(json.loads(line))
+        except FileNotFoundError:
+            pass
+        return records
+
+    def truncate_records(self, name: str, count: int):
+        """Keep only the first ``count`` complete records of ``name``."""
+        records = self.read_records(name)[:count]
+        self._write_atomic(name, "".join(_dumps(record) + "\n" for record in records))
+
+    def _write_manifest(self):
+        self._write_atomic(MANIFEST_FILE, json.dumps(self.manifest, indent=2, default=str))
+
+    def _write_atomic(self, name: str, text: str):
+        path = self.run_dir / name
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+
+__all__ = ['ReviewCheckpoint', 'strategy_from_dict', 'strategy_to_dict']
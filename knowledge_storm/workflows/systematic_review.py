@@ -6,10 +6,11 @@ to provide end-to-end systematic review automation.
 """
 
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Union
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Any, Sequence, Union
 from datetime import datetime
 import asyncio
+import uuid
 
 # PRISMA components - refactored modules
 from ..modules.prisma import (
@@ -18,9 +19,17 @@ from ..modules.prisma import (
     SearchStrategyBuilder,
     ScreeningAssistant,
     DataExtractionHelper,
+    PaperDeduplicator,
+    PaperStore,
+    PaperView,
+    ScreeningStats,
     ZeroDraftGenerator
 )
+from ..modules.prisma.extraction import DEFAULT_EXTRACTION_CONCURRENCY, DEFAULT_VERIFY_TIMEOUT
 from ..modules.prisma_assistant_refactored import VERIFYPRISMAIntegration
+from .review_checkpoint import (
+    EXTRACTION_FILE, SCREENING_FILE, ReviewCheckpoint, strategy_from_dict, strategy_to_dict
+)
 
 # Check integration availability
 try:
@@ -36,6 +45,12 @@ from ..agents.base_agent import AgentRegistry
 
 logger = logging.getLogger(__name__)
 
+# Papers screened or extracted between two checkpoints of a run
+CHECKPOINT_INTERVAL = 200
+# Papers built at a time when a step runs without checkpoints; large enough
+# for screening to use its process pool
+STEP_CHUNK_SIZE = 5000
+
 
 @dataclass
 class SystematicReviewConfig:
@@ -47,6 +62,8 @@ class SystematicReviewConfig:
     max_papers: Optional[int] = None
     date_range: Optional[tuple] = None
     languages: List[str] = None
+    extraction_concurrency: int = DEFAULT_EXTRACTION_CONCURRENCY
+    extraction_timeout: Optional[float] = DEFAULT_VERIFY_TIMEOUT  # Seconds per paper's VERIFY lookup
     
     def __post_init__(self):
         if self.languages is None:
@@ -88,7 +105,8 @@ class SystematicReviewWorkflow:
     
     def __init__(self, 
                  agent_registry: Optional[AgentRegistry] = None,
-                 prisma_agent: Optional[PRISMAScreenerAgent] = None):
+                 prisma_agent: Optional[PRISMAScreenerAgent] = None,
+                 runs_dir: Optional[str] = None):
         
         # Initialize agent infrastructure
         self.agent_registry = agent_registry or AgentRegistry()
@@ -102,9 +120,12 @@ class SystematicReviewWorkflow:
         # Initialize PRISMA components
         self.prisma_assistant = VERIFYPRISMAIntegration()
         self.search_builder = SearchStrategyBuilder()
+        self.deduplicator = PaperDeduplicator()
         
-        # Track workflow state
+        # Track workflow state; with runs_dir set, every run is checkpointed
+        # to runs_dir/<review_id> and can be continued with resume()
         self.active_reviews: Dict[str, ReviewProgress] = {}
+        self.runs_dir = runs_dir
         
         logger.info("SystematicReviewWorkflow initialized with PRISMA integration")
     
@@ -120,49 +141,142 @@ class SystematicReviewWorkflow:
             
         Returns:
             Complete systematic review results including all outputs
+        
+        Paper lists in the results (retrieved, included, excluded and final
+        papers) are ``PaperView``s over column-wise stores, not lists. They
+        support ``len``, indexing, slicing and iteration, but each access
+        builds a fresh ``Paper``: changing it does not change the results.
+        Use ``list(view)`` for a list of independent copies.
+        
+        With ``runs_dir`` set, each step's output is saved under
+        ``runs_dir/<review_id>`` as it completes, so a failed or interrupted
+        run can be continued with ``resume(review_id)``.
         """
-        review_id = f"review_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        progress = ReviewProgress()
-        self.active_reviews[review_id] = progress
+        # The suffix keeps IDs, and run directories, distinct within a second
+        review_id = f"review_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        checkpoint = None
+        if self.runs_dir:
+            checkpoint = ReviewCheckpoint.create(self.runs_dir, review_id, asdict(config))
         
         logger.info(f"Starting systematic review: {review_id}")
         logger.info(f"Research question: {config.research_question}")
         
+        return await self._run_review(review_id, config, papers, checkpoint)
+    
+    async def resume(self, review_id: str) -> Dict[str, Any]:
+        """
+        Continue a checkpointed systematic review.
+        
+        Completed steps are loaded from the run directory instead of being
+        run again; screening and data extraction continue after the last
+        saved paper.
+        
+        Args:
+            review_id: ID of a review started with ``runs_dir`` set
+            
+        Returns:
+            Complete systematic review results, as from conduct_systematic_review
+        """
+        if not self.runs_dir:
+            raise ValueError("resume requires a workflow created with runs_dir")
+        checkpoint = ReviewCheckpoint.open(self.runs_dir, review_id)
+        config_data = dict(checkpoint.config)
+        if config_data.get('date_range'):
+            config_data['date_range'] = tuple(config_data['date_range'])
+        config = SystematicReviewConfig(**config_data)
+        
+        logger.info(f"Resuming systematic review {review_id}; completed: {checkpoint.manifest['completed_steps']}")
+        return await self._run_review(review_id, config, None, checkpoint)
+    
+    async def _run_review(self,
+                          review_id: str,
+                          config: SystematicReviewConfig,
+                          papers: Optional[List[Paper]],
+                          checkpoint: Optional[ReviewCheckpoint]) -> Dict[str, Any]:
+        """Run the six workflow steps, skipping those the checkpoint has completed."""
+        progress = ReviewProgress()
+        if checkpoint:
+            progress.step_timings.update(checkpoint.step_timings)
+        self.active_reviews[review_id] = progress
+        
+        def completed(step: str) -> bool:
+            return checkpoint is not None and checkpoint.is_complete(step)
+        
         try:
             # Step 1: Strategy Development
             progress.current_step = 1
-            strategy_result = await self._develop_search_strategy(config, progress)
+            if completed('strategy_development'):
+                strategy_result = checkpoint.load_step('strategy_development')
+                strategy_result['search_strategy'] = strategy_from_dict(strategy_result['search_strategy'])
+            else:
+                strategy_result = await self._develop_search_strategy(config, progress)
+                if checkpoint:
+                    checkpoint.complete_step('strategy_development', strategy_result['time_taken'], dict(
+                        strategy_result, search_strategy=strategy_to_dict(strategy_result['search_strategy'])
+                    ))
             search_strategy = strategy_result['search_strategy']
             
             # Step 2: Paper Retrieval (if needed)
             progress.current_step = 2
-            if papers is None:
-                retrieval_result = await self._retrieve_papers(search_strategy, config, progress)
-                papers = retrieval_result['papers']
+            if completed('paper_retrieval'):
+                papers = PaperStore.from_papers(checkpoint.read_papers()).view()
+                retrieval_result = dict(checkpoint.load_step('paper_retrieval'), papers=papers)
             else:
-                retrieval_result = {'papers': papers, 'source': 'provided'}
+                if papers is None:
+                    retrieval_result = await self._retrieve_papers(search_strategy, config, progress)
+                    papers = retrieval_result['papers']
+                else:
+                    retrieval_result = {'papers': papers, 'source': 'provided'}
+                # From here on papers are held column-wise; result lists are lazy views
+                papers = retrieval_result['papers'] = PaperStore.from_papers(papers).view()
+                if checkpoint:
+                    checkpoint.write_papers(papers)
+                    checkpoint.complete_step(
+                        'paper_retrieval', retrieval_result.get('time_taken', 0.0),
+                        {key: value for key, value in retrieval_result.items() if key != 'papers'}
+                    )
             
             # Step 3: Initial Screening with PRISMA 80/20
+            # Reruns over the saved decisions when resuming, screening only
+            # papers that have none yet
             progress.current_step = 3
-            screening_result = await self._screen_papers(papers, search_strategy, config, progress)
+            screening_result = await self._screen_papers(papers, search_strategy, config, progress, checkpoint)
+            self._checkpoint_step('initial_screening', screening_result, progress, checkpoint)
             
             # Step 4: Full-text Review (simulation for now)
             progress.current_step = 4
-            fulltext_result = await self._fulltext_review(
-                screening_result['included_papers'], config, progress
-            )
+            included_papers = screening_result['included_papers']
+            if completed('fulltext_review'):
+                # Saved as rows of the screening step's paper store
+                fulltext_result = checkpoint.load_step('fulltext_review')
+                for key in ('final_papers', 'excluded_fulltext'):
+                    fulltext_result[key] = included_papers.store.view(fulltext_result[key])
+            else:
+                fulltext_result = await self._fulltext_review(included_papers, config, progress)
+                if checkpoint:
+                    checkpoint.complete_step('fulltext_review', fulltext_result['time_taken'], dict(
+                        fulltext_result,
+                        final_papers=list(fulltext_result['final_papers'].rows),
+                        excluded_fulltext=list(fulltext_result['excluded_fulltext'].rows)
+                    ))
             
             # Step 5: Data Extraction
             progress.current_step = 5
             extraction_result = await self._extract_data(
-                fulltext_result['final_papers'], config, progress
+                fulltext_result['final_papers'], config, progress, checkpoint
             )
+            self._checkpoint_step('data_extraction', extraction_result, progress, checkpoint)
             
             # Step 6: Report Generation
             progress.current_step = 6
-            report_result = await self._generate_report(
-                search_strategy, screening_result, extraction_result, config, progress
-            )
+            if completed('report_generation'):
+                report_result = checkpoint.load_step('report_generation')
+            else:
+                report_result = await self._generate_report(
+                    search_strategy, screening_result, extraction_result, config, progress
+                )
+                if checkpoint:
+                    checkpoint.complete_step('report_generation', report_result['time_taken'], report_result)
             
             # Compile final results
             final_results = {
@@ -182,18 +296,45 @@ class SystematicReviewWorkflow:
                 },
                 'workflow_metrics': self._calculate_workflow_metrics(progress)
             }
+            if checkpoint:
+                final_results['run_dir'] = str(checkpoint.run_dir)
             
             logger.info(f"Systematic review completed: {review_id}")
             return final_results
             
         except Exception as e:
             logger.error(f"Systematic review failed: {e}")
-            return {
+            failure = {
                 'review_id': review_id,
                 'success': False,
                 'error': str(e),
                 'progress': progress
             }
+            if checkpoint:
+                failure['run_dir'] = str(checkpoint.run_dir)
+            return failure
+    
+    @staticmethod
+    def _checkpoint_step(step: str, result: Dict[str, Any], progress: ReviewProgress,
+                         checkpoint: Optional[ReviewCheckpoint]):
+        """Mark a paper-level checkpointed step done, or keep its original timing if it already was."""
+        if checkpoint is None:
+            return
+        if checkpoint.is_complete(step):
+            result['time_taken'] = progress.step_timings[step] = checkpoint.step_timings[step]
+        else:
+            checkpoint.complete_step(step, result['time_taken'])
+    
+    @staticmethod
+    def _restore_records(checkpoint: ReviewCheckpoint, name: str, paper_ids: List[str]) -> List[Dict[str, Any]]:
+        """Saved per-paper records of ``name``, if they belong to a prefix of ``paper_ids``."""
+        records = checkpoint.read_records(name)
+        if len(records) > len(paper_ids) or any(r['paper_id'] != i for r, i in zip(records, paper_ids)):
+            logger.warning(f"Saved {name} records do not match the papers; starting the step again")
+            records = []
+        # Also drops a line cut short by an interrupted run
+        checkpoint.truncate_records(name, len(records))
+        return records
     
     async def _develop_search_strategy(self, 
                                      config: SystematicReviewConfig,
@@ -240,35 +381,40 @@ class SystematicReviewWorkflow:
         step_start = datetime.now()
         logger.info("Retrieving papers...")
         
-        # Placeholder implementation - would integrate with actual academic databases
-        # For now, return empty list as STORM-Academic integration is not fully available
-        papers = []
-        
-        # In production, this would:
-        # 1. Query multiple academic databases using search_strategy.search_queries
-        # 2. Deduplicate results
-        # 3. Apply basic filtering
-        # 4. Format as Paper objects
+        # Queries run concurrently against OpenAlex and Crossref, filtered to the
+        # strategy's date range; near-duplicates are removed before screening
+        failed_sources: List[Dict[str, Any]] = []
+        papers = await self.prisma_assistant._retrieve_papers_via_storm(
+            search_strategy, max_papers=config.max_papers, failed_sources=failed_sources
+        )
         
         step_time = (datetime.now() - step_start).total_seconds()
         progress.step_timings['paper_retrieval'] = step_time
         
-        logger.info(f"Retrieved {len(papers)} papers")
+        if failed_sources:
+            # The review continues, but on an incomplete set of records
+            logger.warning(
+                f"Retrieved {len(papers)} papers; {len(failed_sources)} source searches failed: "
+                + ", ".join(f"{f['source']} ({f['query']})" for f in failed_sources)
+            )
+        else:
+            logger.info(f"Retrieved {len(papers)} papers")
         
         return {
             'success': True,
             'papers': papers,
             'papers_count': len(papers),
-            'sources': list(search_strategy.search_queries.keys()),
-            'time_taken': step_time,
-            'note': 'Paper retrieval requires integration with academic databases'
+            'sources': list(self.prisma_assistant.paper_retriever.sources),
+            'failed_sources': failed_sources,
+            'time_taken': step_time
         }
     
     async def _screen_papers(self, 
-                           papers: List[Paper],
+                           papers: Sequence[Paper],
                            search_strategy: SearchStrategy,
                            config: SystematicReviewConfig,
-                           progress: ReviewProgress) -> Dict[str, Any]:
+                           progress: ReviewProgress,
+                           checkpoint: Optional[ReviewCheckpoint] = None) -> Dict[str, Any]:
         """Step 3: Screen papers using PRISMA 80/20 methodology."""
         step_start = datetime.now()
         logger.info(f"Screening {len(papers)} papers using PRISMA 80/20 methodology...")
@@ -278,34 +424,77 @@ class SystematicReviewWorkflow:
             papers = self._create_demo_papers()
             logger.info(f"Using {len(papers)} demo papers for workflow testing")
         
-        # Use PRISMA agent for screening
-        screening_results = await self.agent_coordinator.screen_papers_batch(
-            papers=papers,
-            inclusion_patterns=search_strategy.inclusion_criteria,
-            exclusion_patterns=search_strategy.exclusion_criteria
+        if not isinstance(papers, PaperView):
+            papers = PaperStore.from_papers(papers).view()
+        
+        # Remove records retrieved from several databases before screening;
+        # duplicates are found on the store's columns, and the unique rows
+        # are copied into the store this step screens
+        deduplication = self.deduplicator.deduplicate(papers)
+        unique = deduplication.papers
+        store = unique.store.take(unique.rows)
+        
+        # Decisions saved by an interrupted run are reused; the remaining
+        # papers are screened a chunk at a time, each chunk saved when decided
+        screened = 0
+        if checkpoint:
+            records = self._restore_records(checkpoint, SCREENING_FILE, store.column('id'))
+            for row, record in enumerate(records):
+                store.set_screening(row, record['decision'], record['reason'], record['confidence'])
+            screened = len(records)
+        chunk_size = CHECKPOINT_INTERVAL if checkpoint else STEP_CHUNK_SIZE
+        
+        for start in range(screened, len(store), chunk_size):
+            rows = range(start, min(start + chunk_size, len(store)))
+            chunk = list(store.view(rows))
+            # Use PRISMA agent for screening
+            screening_results = await self.agent_coordinator.screen_papers_batch(
+                papers=chunk,
+                inclusion_patterns=search_strategy.inclusion_criteria,
+                exclusion_patterns=search_strategy.exclusion_criteria
+            )
+            if not screening_results['success']:
+                raise Exception(f"Paper screening failed: {screening_results.get('error')}")
+            for row, paper in zip(rows, chunk):
+                store.set_screening(row, paper.screening_decision, paper.exclusion_reason, paper.confidence_score)
+            if checkpoint:
+                checkpoint.append_records(SCREENING_FILE, (
+                    {
+                        'paper_id': paper.id,
+                        'decision': paper.screening_decision,
+                        'reason': paper.exclusion_reason,
+                        'confidence': paper.confidence_score
+                    }
+                    for paper in chunk
+                ))
+        
+        # 80/20 buckets and metrics over all decisions, screened now or earlier
+        stats = ScreeningStats()
+        buckets = {'definitely_include': [], 'definitely_exclude': [], 'needs_human_review': []}
+        decisions = zip(
+            store.column('screening_decision'), store.column('exclusion_reason'), store.column('confidence_score')
         )
+        for row, (decision, reason, confidence) in enumerate(decisions):
+            buckets[stats.record(decision, reason, confidence)].append(row)
         
-        if screening_results['success']:
-            screening_data = screening_results['screening_results']
-            
-            step_time = (datetime.now() - step_start).total_seconds()
-            progress.step_timings['initial_screening'] = step_time
-            
-            return {
-                'success': True,
-                'included_papers': screening_data['definitely_include'],
-                'excluded_papers': screening_data['definitely_exclude'],
-                'needs_review': screening_data['needs_human_review'],
-                'performance_metrics': screening_data['performance_metrics'],
-                'exclusion_stats': screening_data['exclusion_stats'],
-                'time_taken': step_time,
-                'automation_achieved': screening_data['performance_metrics']['automation_rate']
-            }
-        else:
-            raise Exception(f"Paper screening failed: {screening_results.get('error')}")
+        step_time = (datetime.now() - step_start).total_seconds()
+        progress.step_timings['initial_screening'] = step_time
+        
+        return {
+            'success': True,
+            'included_papers': store.view(buckets['definitely_include']),
+            'excluded_papers': store.view(buckets['definitely_exclude']),
+            'needs_review': store.view(buckets['needs_human_review']),
+            'performance_metrics': stats.performance_metrics,
+            'exclusion_stats': dict(stats.exclusion_stats),
+            'confidence_distribution': dict(stats.confidence_distribution),
+            'deduplication': deduplication.prisma_counts,
+            'time_taken': step_time,
+            'automation_achieved': stats.performance_metrics['automation_rate']
+        }
     
     async def _fulltext_review(self, 
-                             included_papers: List[Paper],
+                             included_papers: Sequence[Paper],
                              config: SystematicReviewConfig,
                              progress: ReviewProgress) -> Dict[str, Any]:
         """Step 4: Full-text review of included papers."""
@@ -335,9 +524,10 @@ class SystematicReviewWorkflow:
         }
     
     async def _extract_data(self, 
-                          final_papers: List[Paper],
+                          final_papers: Sequence[Paper],
                           config: SystematicReviewConfig,
-                          progress: ReviewProgress) -> Dict[str, Any]:
+                          progress: ReviewProgress,
+                          checkpoint: Optional[ReviewCheckpoint] = None) -> Dict[str, Any]:
         """Step 5: Extract data from final included papers."""
         step_start = datetime.now()
         logger.info(f"Extracting data from {len(final_papers)} papers...")
@@ -345,18 +535,49 @@ class SystematicReviewWorkflow:
         # Use PRISMA data extraction helper
         extraction_helper = DataExtractionHelper()
         
+        if not isinstance(final_papers, PaperView):
+            final_papers = PaperStore.from_papers(final_papers).view()
+        store = final_papers.store
+        
         # Determine study type and get appropriate template
-        extracted_data = []
-        for paper in final_papers:
-            # Simple heuristic to determine study type
-            study_type = 'clinical_trial' if 'trial' in paper.title.lower() else 'observational'
-            template = extraction_helper.get_template(study_type)
-            
-            # Extract data using template
-            paper_data = extraction_helper.extract_data(paper, template)
-            paper_data['paper_id'] = paper.id
-            paper_data['study_type'] = study_type
-            extracted_data.append(paper_data)
+        # Simple heuristic to determine study type
+        study_types = [
+            'clinical_trial' if 'trial' in title.lower() else 'observational'
+            for title in store.column('title', final_papers.rows)
+        ]
+        templates = [extraction_helper.get_template(study_type) for study_type in study_types]
+        
+        # Rows saved by an interrupted run are reused
+        paper_ids = store.column('id', final_papers.rows)
+        extracted_data = self._restore_records(checkpoint, EXTRACTION_FILE, paper_ids) if checkpoint else []
+        chunk_size = CHECKPOINT_INTERVAL if checkpoint else STEP_CHUNK_SIZE
+        
+        def on_progress(done: int, total: int):
+            # Keep the step's elapsed time current for get_workflow_status
+            progress.step_timings['data_extraction'] = (datetime.now() - step_start).total_seconds()
+            logger.debug(f"Extracted data from {len(extracted_data) + done}/{len(final_papers)} papers")
+        
+        for start in range(len(extracted_data), len(final_papers), chunk_size):
+            end = start + chunk_size
+            # Papers are extracted concurrently, with DOI lookups for VERIFY batched
+            chunk_data = await extraction_helper.extract_data_batch(
+                list(final_papers[start:end]), templates[start:end],
+                concurrency=config.extraction_concurrency,
+                timeout=config.extraction_timeout,
+                on_progress=on_progress
+            )
+            for paper_id, study_type, paper_data in zip(paper_ids[start:end], study_types[start:end], chunk_data):
+                paper_data['paper_id'] = paper_id
+                paper_data['study_type'] = study_type
+            if checkpoint:
+                checkpoint.append_records(EXTRACTION_FILE, chunk_data)
+            extracted_data.extend(chunk_data)
+        
+        # Extracted characteristics go back into the store for report aggregates
+        for row, paper_data in zip(final_papers.rows, extracted_data):
+            store.set('study_type', row, paper_data['study_type'])
+            if isinstance(paper_data.get('sample_size'), int):
+                store.set('sample_size', row, paper_data['sample_size'])
         
         step_time = (datetime.now() - step_start).total_seconds()
         progress.step_timings['data_extraction'] = step_time
@@ -364,6 +585,7 @@ class SystematicReviewWorkflow:
         return {
             'success': True,
             'extracted_data': extracted_data,
+            'included_studies': final_papers,
             'papers_with_data': len(extracted_data),
             'extraction_fields': len(extraction_helper.standard_templates['clinical_trial'].fields),
             'time_taken': step_time
@@ -386,7 +608,14 @@ class SystematicReviewWorkflow:
         methods_section = await draft_generator.generate_methods_section(search_strategy)
         
         # Generate results section
-        results_section = await draft_generator.generate_results_section(screening_result)
+        results_section = await draft_generator.generate_results_section({
+            'definitely_include': screening_result['included_papers'],
+            'definitely_exclude': screening_result['excluded_papers'],
+            'needs_human_review': screening_result['needs_review'],
+            'performance_metrics': screening_result['performance_metrics'],
+            'exclusion_stats': screening_result['exclusion_stats'],
+            'confidence_distribution': screening_result['confidence_distribution']
+        })
         
         # Generate PRISMA flow diagram data
         flow_data = self._generate_prisma_flow_data(screening_result, extraction_result)
@@ -462,9 +691,11 @@ class SystematicReviewWorkflow:
                                  extraction_result: Dict[str, Any]) -> Dict[str, int]:
         """Generate PRISMA flow diagram data."""
         metrics = screening_result['performance_metrics']
+        deduplication = screening_result.get('deduplication', {})
         
         return {
-            'records_identified': metrics['total_papers'],
+            'records_identified': deduplication.get('records_identified', metrics['total_papers']),
+            'duplicates_removed': deduplication.get('duplicates_removed', 0),
             'records_screened': metrics['total_papers'],
             'records_excluded_screening': len(screening_result['excluded_papers']),
             'full_text_assessed': len(screening_result['included_papers']),
@@ -476,12 +707,17 @@ class SystematicReviewWorkflow:
                                    screening_result: Dict[str, Any],
                                    extraction_result: Dict[str, Any]) -> Dict[str, Any]:
         """Generate summary statistics for the review."""
+        # Aggregates over the included studies' columns; no Paper objects are built
+        studies = extraction_result['included_studies']
         return {
             'total_studies_screened': screening_result['performance_metrics']['total_papers'],
             'automation_rate_achieved': screening_result['performance_metrics']['automation_rate'],
             'final_studies_included': len(extraction_result['extracted_data']),
             'screening_efficiency': screening_result['automation_achieved'],
             'time_saved_estimated': screening_result['performance_metrics']['total_papers'] * 0.1,  # 6 min per paper
+            'studies_by_design': studies.store.value_counts('study_type', studies.rows),
+            'studies_by_year': studies.store.value_counts('year', studies.rows),
+            'total_participants': sum(filter(None, studies.store.column('sample_size', studies.rows))),
             'prisma_compliance': True
         }
     
@@ -9,6 +9,7 @@ from knowledge_storm.services.academic_source_service import (
     SourceQualityScorer,
     DEFAULT_LIMIT,
 )
+from knowledge_storm.services.utils import extract_dois
 
 class Agent(ABC):
     """Base class for all agents in the multi-agent system."""
@@ -110,7 +111,13 @@ class CitationVerifierAgent(Agent):
         self.service = service or AcademicSourceService()
 
     async def execute_task(self, task: str) -> str:
-        metadata = await self.service.get_publication_metadata(task)
+        dois = extract_dois(task)
+        if len(dois) > 1:
+            # One batched lookup instead of a request per DOI.
+            results = await self.service.resolve_dois(dois)
+            verified = sum(1 for metadata in results.values() if metadata)
+            return f"{verified}/{len(dois)} DOIs verified"
+        metadata = await self.service.get_publication_metadata(dois[0] if dois else task)
         if metadata:
             return "DOI verified"
         return "DOI not found"
@@ -0,0 +1,215 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from knowledge_storm.exceptions import ServiceUnavailableError
+from knowledge_storm.services import academic_source_service
+from knowledge_storm.services.academic_source_service import AcademicSourceService
+from knowledge_storm.services.cache_service import CacheService
+from knowledge_storm.services.utils import CircuitBreaker, ConnectionManager, run_sync, stream_cursor_pages
+
+
+def _service():
+    cache = CacheService()
+    cache.redis = None
+    return AcademicSourceService(cache=cache)
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+def test_iter_openalex_follows_cursor_with_projection():
+    service = _service()
+    pages = {
+        "*": {"results": [{"id": 1}, {"id": 2}], "meta": {"next_cursor": "c2"}},
+        "c2": {"results": [{"id": 3}], "meta": {"next_cursor": "c3"}},
+    }
+    calls = []
+
+    async def request(url, params=None):
+        calls.append(params)
+        return pages[params["cursor"]]
+
+    with patch.object(service, "_request_json", side_effect=request):
+        works = asyncio.run(
+            _collect(service.iter_openalex("q", filters={"from_publication_date": "2020-01-01"}, page_size=2))
+        )
+
+    assert [w["id"] for w in works] == [1, 2, 3]
+    # The short second page ends the walk without requesting "c3".
+    assert [c["cursor"] for c in calls] == ["*", "c2"]
+    assert calls[0]["filter"] == "from_publication_date:2020-01-01"
+    assert calls[0]["select"].startswith("id,doi,title")
+
+
+def test_iter_crossref_stops_at_max_results():
+    service = _service()
+    calls = []
+
+    async def request(url, params=None):
+        calls.append(params)
+        rows = params["rows"]
+        return {"message": {"items": [{"n": i} for i in range(rows)], "next-cursor": "next"}}
+
+    with patch.object(service, "_request_json", side_effect=request):
+        items = asyncio.run(_collect(service.iter_crossref("q", max_results=5, page_size=1000)))
+
+    assert len(items) == 5
+    assert calls[0]["rows"] == 5
+
+
+def _failing_second_page(failures):
+    calls = []
+
+    async def request(url, params=None):
+        calls.append(params["cursor"])
+        if params["cursor"] == "c2" and calls.count("c2") <= failures:
+            return None  # what _request_json returns for a 5xx or timeout
+        if params["cursor"] == "*":
+            return {"results": [{"id": 1}, {"id": 2}], "meta": {"next_cursor": "c2"}}
+        return {"results": [{"id": 3}], "meta": {"next_cursor": None}}
+
+    return request, calls
+
+
+def test_iter_openalex_retries_failed_page(monkeypatch):
+    monkeypatch.setattr(academic_source_service, "PAGE_RETRY_BACKOFF", 0)
+    service = _service()
+    request, calls = _failing_second_page(failures=1)
+
+    with patch.object(service, "_request_json", side_effect=request):
+        works = asyncio.run(_collect(service.iter_openalex("q", page_size=2)))
+
+    assert [w["id"] for w in works] == [1, 2, 3]
+    assert calls == ["*", "c2", "c2"]
+
+
+def test_iter_openalex_raises_when_page_keeps_failing(monkeypatch):
+    monkeypatch.setattr(academic_source_service, "PAGE_RETRY_BACKOFF", 0)
+    service = _service()
+    request, calls = _failing_second_page(failures=academic_source_service.PAGE_ATTEMPTS)
+
+    async def consume():
+        works = []
+        with pytest.raises(ServiceUnavailableError):
+            async for work in service.iter_openalex("q", page_size=2):
+                works.append(work)
+        return works
+
+    with patch.object(service, "_request_json", side_effect=request):
+        works = asyncio.run(consume())
+
+    assert [w["id"] for w in works] == [1, 2]
+    assert calls.count("c2") == academic_source_service.PAGE_ATTEMPTS
+
+
+def test_stream_cursor_pages_bounds_prefetch():
+    fetched = []
+
+    async def fetch_page(cursor):
+        n = 0 if cursor == "*" else int(cursor)
+        fetched.append(n)
+        return [n], str(n + 1) if n < 9 else None
+
+    async def run():
+        pages = stream_cursor_pages(fetch_page, prefetch=2)
+        first = await pages.__anext__()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        ahead = len(fetched)
+        rest = [page async for page in pages]
+        return first, ahead, rest
+
+    first, ahead, rest = asyncio.run(run())
+
+    assert first == [0]
+    # The page in hand, two buffered pages and one blocked on the full queue.
+    assert ahead == 4
+    assert [p[0] for p in rest] == list(range(1, 10))
+
+
+def test_stream_cursor_pages_propagates_errors():
+    async def fetch_page(cursor):
+        if cursor == "*":
+            return [1], "boom"
+        raise RuntimeError("Circuit breaker open")
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(_collect(stream_cursor_pages(fetch_page)))
+
+
+def test_circuit_breaker_half_opens_after_cooldown():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    with patch("knowledge_storm.services.utils.time.monotonic", return_value=100.0):
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.should_allow_request()
+
+    with patch("knowledge_storm.services.utils.time.monotonic", return_value=131.0):
+        assert breaker.state == "half_open"
+        assert breaker.should_allow_request()
+        # Only one probe at a time.
+        assert not breaker.should_allow_request()
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+
+def test_breakers_are_per_host():
+    service = _service()
+    crossref = service._breaker_for(service.CROSSREF_URL + "/10.1/x")
+    for _ in range(crossref.failure_threshold):
+        crossref.record_failure()
+
+    assert not crossref.should_allow_request()
+    assert service._breaker_for(service.OPENALEX_URL).should_allow_request()
+    assert service.breakers.states() == {"api.crossref.org": "open", "api.openalex.org": "closed"}
+
+
+class _FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def _fake_connection_manager():
+    manager = ConnectionManager()
+
+    async def create():
+        return _FakeSession()
+
+    manager._create_session = create
+    return manager
+
+
+def test_connection_manager_closes_session_of_finished_loop():
+    manager = _fake_connection_manager()
+
+    first = asyncio.run(manager.get_session())
+    second = asyncio.run(manager.get_session())
+
+    assert first is not second
+    assert first.closed and not second.closed
+
+
+def test_connection_manager_keeps_one_session_per_live_loop():
+    manager = _fake_connection_manager()
+    loop = asyncio.new_event_loop()
+    try:
+        background = run_sync(manager.get_session())
+        local = loop.run_until_complete(manager.get_session())
+        # Alternating between two live loops must not close either session.
+        assert run_sync(manager.get_session()) is background
+        assert loop.run_until_complete(manager.get_session()) is local
+        assert not background.closed and not local.closed
+    finally:
+        loop.run_until_complete(manager.close())
+        loop.close()
+    run_sync(asyncio.sleep(0))  # let the background loop run the scheduled close
+
+    assert background.closed and local.closed
+    assert manager._sessions == {}
@@ -0,0 +1,141 @@
+import asyncio
+import json
+from unittest.mock import patch
+
+from knowledge_storm.services.cache_service import _MISSING, CacheService, LocalLRUCache
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def set(self, key, value, ex=None):
+        self.commands.append((key, value, ex))
+
+    async def execute(self):
+        self.redis.pipeline_executions += 1
+        for key, value, ex in self.commands:
+            self.redis.store[key] = value
+            self.redis.ttls[key] = ex
+
+
+class FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.get_calls = 0
+        self.mget_calls = 0
+        self.pipeline_executions = 0
+
+    async def get(self, key):
+        self.get_calls += 1
+        return self.store.get(key)
+
+    async def mget(self, keys):
+        self.mget_calls += 1
+        return [self.store.get(k) for k in keys]
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        self.ttls[key] = ex
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _cache_with_fake_redis(**kwargs):
+    cache = CacheService(**kwargs)
+    cache.redis = FakeRedis()
+    return cache
+
+
+def test_local_lru_evicts_least_recently_used():
+    lru = LocalLRUCache(max_entries=2)
+    lru.set("a", 1, ttl=60)
+    lru.set("b", 2, ttl=60)
+    lru.get("a")
+    lru.set("c", 3, ttl=60)
+
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert len(lru) == 2
+    assert lru.get("b") is _MISSING
+
+
+def test_local_lru_expires_entries():
+    lru = LocalLRUCache()
+    with patch("knowledge_storm.services.cache_service.time.monotonic", return_value=100.0):
+        lru.set("a", 1, ttl=10)
+    with patch("knowledge_storm.services.cache_service.time.monotonic", return_value=111.0):
+        assert lru.get("a") is _MISSING
+        assert len(lru) == 0
+
+
+def test_hot_keys_served_from_l1_without_redis_round_trip():
+    cache = _cache_with_fake_redis()
+    cache.redis.store["k"] = json.dumps({"v": 1})
+
+    assert asyncio.run(cache.get("k")) == {"v": 1}
+    assert asyncio.run(cache.get("k")) == {"v": 1}
+
+    assert cache.redis.get_calls == 1
+    stats = cache.stats()
+    assert stats["l1"]["hits"] == 1 and stats["l1"]["misses"] == 1
+    assert stats["l2"]["hits"] == 1 and stats["l2"]["hit_ratio"] == 1.0
+
+
+def test_get_many_uses_single_mget_for_l1_misses():
+    cache = _cache_with_fake_redis()
+    asyncio.run(cache.set("a", 1))
+    cache.redis.store["b"] = json.dumps(2)
+
+    found = asyncio.run(cache.get_many(["a", "b", "c"]))
+
+    assert found == {"a": 1, "b": 2}
+    assert cache.redis.mget_calls == 1
+
+
+def test_set_many_pipelines_writes():
+    cache = _cache_with_fake_redis()
+
+    asyncio.run(cache.set_many({"a": {"x": 1}, "b": {"y": 2}}))
+
+    assert cache.redis.pipeline_executions == 1
+    assert json.loads(cache.redis.store["b"]) == {"y": 2}
+    assert asyncio.run(cache.get("a")) == {"x": 1}
+
+
+def test_empty_responses_use_negative_ttl():
+    cache = _cache_with_fake_redis(ttl=3600, negative_ttl=60)
+
+    asyncio.run(cache.set("missing", {}))
+    asyncio.run(cache.set("found", {"v": 1}))
+
+    assert cache.redis.ttls == {"missing": 60, "found": 3600}
+    assert asyncio.run(cache.get("missing")) == {}
+    assert cache.stats()["negative_hits"] == 1
+
+
+def test_works_without_redis():
+    cache = CacheService()
+    cache.redis = None
+
+    asyncio.run(cache.set("k", [1, 2]))
+
+    assert asyncio.run(cache.get("k")) == [1, 2]
+    assert asyncio.run(cache.get("other")) is None
+    assert cache.stats()["l2"]["enabled"] is False
+
+
+def test_mutating_returned_values_does_not_change_the_cache():
+    cache = _cache_with_fake_redis()
+    value = {"authors": ["A"]}
+    asyncio.run(cache.set("k", value))
+    value["authors"].append("B")
+
+    first = asyncio.run(cache.get("k"))
+    first["authors"].append("C")
+    asyncio.run(cache.get_many(["k"]))["k"]["authors"].append("D")
+
+    assert asyncio.run(cache.get("k")) == {"authors": ["A"]}
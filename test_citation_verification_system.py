@@ -79,3 +79,41 @@ def test_extract_invalid_citation_indices(caplog):
 
 def test_threshold_from_config():
     assert VerificationConfig.VERIFICATION_THRESHOLD == 0.7
+
+
+def test_verify_section_async_gathers_citations_concurrently():
+    verifier = SectionCitationVerifier(CitationVerifier(cache=CacheService()))
+    in_flight = {"now": 0, "max": 0}
+
+    async def fake_verify(claim, source):
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return {"claim": claim}
+
+    verifier.verifier.verify_citation_async = fake_verify
+    info = [StormInformation(str(i), "d", [f"snippet {i}"], "t") for i in range(1, 4)]
+    results = asyncio.run(verifier.verify_section_async("A [1] B [3] C [1] D [9]", info))
+
+    assert [r["claim"] for r in results] == ["snippet 1", "snippet 3", "snippet 1"]
+    assert in_flight["max"] == 2
+
+
+def test_sync_facade_reuses_background_loop():
+    system = CitationVerifier(cache=CacheService())
+    loops = []
+
+    async def fake_verify(claim, source):
+        loops.append(asyncio.get_running_loop())
+        return {"verified": True}
+
+    system.verify_citation_async = fake_verify
+
+    async def caller():
+        # Usable even while another event loop is running in this thread.
+        return system.verify_citation("claim", {"text": "claim"})
+
+    assert system.verify_citation("claim", {"text": "claim"}) == {"verified": True}
+    assert asyncio.run(caller()) == {"verified": True}
+    assert loops[0] is loops[1]
@@ -6,7 +6,8 @@ import pytest
 
 from knowledge_storm.services.cache_service import CacheService
 
-from knowledge_storm.services.crossref_service import CrossrefService, CrossrefConfig
+from knowledge_storm.services.crossref_service import CrossrefService, CrossrefConfig, RateLimiter
+from knowledge_storm.services.utils import SingleFlight
 
 
 async def _run(coro):
@@ -71,18 +72,8 @@ def test_crossref_service_rate_limit_called():
     service = CrossrefService()
     wait_mock = AsyncMock()
 
-    class DummyResp(str):
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            pass
-
     with patch.object(service.limiter, "wait", wait_mock), patch.object(
         service.conn_manager, "get_session", AsyncMock(side_effect=RuntimeError())
-    ), patch(
-        "knowledge_storm.services.crossref_service.request.urlopen",
-        lambda *args, **kwargs: DummyResp("{}"),
     ):
         asyncio.run(service.search_works("q"))
         assert wait_mock.await_count == 1
@@ -94,3 +85,105 @@ def test_crossref_service_circuit_breaker():
         with pytest.raises(RuntimeError):
             asyncio.run(service.search_works("q"))
 
+
+
+def test_concurrent_identical_lookups_share_one_request():
+    service = CrossrefService(CrossrefConfig(single_flight=SingleFlight()))
+    calls = []
+
+    async def slow_fetch(url, params, breaker):
+        calls.append(url)
+        await asyncio.sleep(0.01)
+        return {"message": {"DOI": "10.1/x"}}
+
+    async def run():
+        return await asyncio.gather(
+            *[service.get_metadata_by_doi("10.1/x") for _ in range(5)]
+        )
+
+    with patch.object(service.limiter, "wait", AsyncMock()), patch.object(
+        service.fetcher, "fetch_with_retry", side_effect=slow_fetch
+    ):
+        results = asyncio.run(run())
+
+    assert calls == [f"{service.BASE_URL}/10.1/x"]
+    assert results == [{"DOI": "10.1/x"}] * 5
+    assert service.single_flight.shared_calls == 4
+    assert service.single_flight.in_flight() == 0
+
+
+def test_single_flight_survives_leader_cancellation():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    async def run():
+        leader = asyncio.ensure_future(flight.do("k", work))
+        follower = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_get_metadata_by_dois_batches_and_caches_per_doi():
+    cache = CacheService()
+    cache.redis = None
+    service = CrossrefService(CrossrefConfig(cache=cache, single_flight=SingleFlight()))
+    calls = []
+
+    async def fetch(url, params, breaker):
+        calls.append(params)
+        return {"message": {"items": [{"DOI": "10.1/A"}, {"DOI": "10.1/b"}]}}
+
+    with patch.object(service.limiter, "wait", AsyncMock()) as wait, patch.object(
+        service.fetcher, "fetch_with_retry", side_effect=fetch
+    ):
+        result = asyncio.run(
+            service.get_metadata_by_dois(["https://doi.org/10.1/a", "10.1/b", "10.1/c"])
+        )
+        again = asyncio.run(service.get_metadata_by_doi("10.1/c"))
+
+    assert calls == [{"filter": "doi:10.1/a,doi:10.1/b,doi:10.1/c", "rows": 3}]
+    assert wait.await_count == 1
+    assert result == {
+        "https://doi.org/10.1/a": {"DOI": "10.1/A"},
+        "10.1/b": {"DOI": "10.1/b"},
+        "10.1/c": {},
+    }
+    assert again == {}
+
+
+def test_rate_limiter_allows_bursts_then_spaces_requests():
+    limiter = RateLimiter(interval=10, burst=3)
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        limiter._updated -= delay
+
+    async def run():
+        for _ in range(4):
+            await limiter.wait()
+
+    with patch("knowledge_storm.services.crossref_service.asyncio.sleep", side_effect=fake_sleep):
+        asyncio.run(run())
+
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(10, rel=0.01)
+
+
+def test_rate_limiter_adapts_to_headers_and_pauses():
+    limiter = RateLimiter(interval=3.6)
+
+    limiter.update_from_headers({"X-Rate-Limit-Limit": "50", "X-Rate-Limit-Interval": "1s"})
+    assert limiter.rate == 50 and limiter.capacity == 50
+
+    limiter.update_from_headers({"X-Rate-Limit-Limit": "bogus"})
+    assert limiter.rate == 50
+
+    limiter.pause(5)
+    assert 4 < limiter.paused_for() <= 5
@@ -0,0 +1,59 @@
+import pytest
+
+from knowledge_storm.services.citation_verifier import CitationVerifier
+from knowledge_storm.services.similarity import (
+    BM25Scorer,
+    EmbeddingScorer,
+    MinHashScorer,
+    create_scorer,
+    sentence_windows,
+)
+
+FILLER = "Unrelated sentence number {} talks about weather patterns in spring. "
+SOURCE = (
+    "".join(FILLER.format(i) for i in range(50))
+    + "Transformer models improve retrieval accuracy on long documents. "
+    + "".join(FILLER.format(i) for i in range(50, 100))
+)
+CLAIM = "Transformer models improve retrieval accuracy"
+
+
+def test_sentence_windows_overlap():
+    windows = sentence_windows("A. B. C. D.", window=2)
+    assert windows == ["A. B.", "B. C.", "C. D."]
+
+
+@pytest.mark.parametrize("scorer", [MinHashScorer(), BM25Scorer()])
+def test_scorers_find_supporting_passage(scorer):
+    assert scorer.score(CLAIM, SOURCE) > 0.7
+    assert scorer.score("Quantum chromodynamics of gluons", SOURCE) < 0.3
+    assert scorer.score("", SOURCE) == 0.0
+
+
+def test_minhash_is_deterministic():
+    assert MinHashScorer().score(CLAIM, SOURCE) == MinHashScorer().score(CLAIM, SOURCE)
+
+
+def test_prefilter_keeps_top_k_windows():
+    scorer = MinHashScorer(top_k=2)
+    passages = scorer.candidate_passages(CLAIM.lower().split(), SOURCE)
+    assert len(passages) == 2
+    assert "transformer" in passages[0]
+
+
+def test_create_scorer_and_pluggable_verifier():
+    assert isinstance(create_scorer("bm25"), BM25Scorer)
+    with pytest.raises(ValueError):
+        create_scorer("levenshtein")
+
+    class Always:
+        def score(self, claim, source_text):
+            return 0.9
+
+    verifier = CitationVerifier(similarity=Always())
+    assert verifier._calculate_verification_score("a", "b") == 0.9
+
+
+def test_embedding_scorer_loads_model_lazily():
+    scorer = EmbeddingScorer()
+    assert scorer._model is None
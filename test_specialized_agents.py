@@ -101,3 +101,38 @@ def test_academic_source_service_caching():
         asyncio.run(service.search_openalex("q"))
         asyncio.run(service.search_openalex("q"))
         assert mock_session.get_call_count == 1
+
+
+def test_resolve_dois_falls_back_to_openalex_and_single_lookups():
+    cache = CacheService()
+    cache.redis = None
+    service = AcademicSourceService(cache=cache)
+    urls = []
+
+    async def fetch(url, params=None):
+        urls.append((url, params))
+        if url == service.CROSSREF_URL:
+            return {"message": {"items": [{"DOI": "10.1/a"}]}}
+        if url == service.OPENALEX_URL:
+            return {"results": [{"doi": "https://doi.org/10.5281/zenodo.1"}]}
+        return {"message": {"DOI": "10.1/x,y"}}
+
+    with patch.object(service, "_fetch_json", side_effect=fetch):
+        result = asyncio.run(service.resolve_dois(["10.1/a", "10.5281/zenodo.1", "10.1/x,y"]))
+
+    assert result["10.1/a"] == {"DOI": "10.1/a"}
+    assert result["10.5281/zenodo.1"] == {"doi": "https://doi.org/10.5281/zenodo.1"}
+    assert result["10.1/x,y"] == {"DOI": "10.1/x,y"}
+    assert len(urls) == 3
+    # Per-DOI cache entries are shared with single lookups.
+    assert asyncio.run(service.resolve_doi("10.1/a")) == {"DOI": "10.1/a"}
+
+
+def test_citation_verifier_agent_batches_multiple_dois():
+    service = AcademicSourceService()
+    agent = CitationVerifierAgent("v", "Verifier", service=service)
+    resolved = {"10.1000/a": {"title": "A"}, "10.1000/b": {}}
+    with patch.object(service, "resolve_dois", new=AsyncMock(return_value=resolved)) as batch:
+        result = asyncio.run(agent.execute_task("See 10.1000/a and 10.1000/b."))
+    batch.assert_awaited_once_with(["10.1000/a", "10.1000/b"])
+    assert result == "1/2 DOIs verified"
@@ -0,0 +1,16 @@
+"""
+Performance benchmarks.
+
+Correctness and relative checks always run. Absolute wall-clock limits and
+full-size runs depend on the machine, so they only run with
+``STORM_BENCHMARKS=1``.
+"""
+
+import os
+
+import pytest
+
+RUN_BENCHMARKS = os.environ.get("STORM_BENCHMARKS") == "1"
+
+# For tests that assert absolute timings or take minutes to run
+timed_benchmark = pytest.mark.skipif(not RUN_BENCHMARKS, reason="set STORM_BENCHMARKS=1 to run")
@@ -0,0 +1,90 @@
+"""
+Benchmark: duplicate detection over synthetic bibliographic records.
+
+A fifth of the records are injected duplicates of earlier ones: DOI variants
+with reformatted titles, title-only copies without DOI, and near-duplicates
+whose title and abstract were lightly edited. All of them must be found,
+without merging any distinct records. Every run checks this on 20k records;
+the 1M-record run with its time limit takes minutes and several GB, so it is
+opt-in.
+"""
+
+import random
+import time
+
+from knowledge_storm.modules.prisma.core import Paper
+from knowledge_storm.modules.prisma.deduplication import PaperDeduplicator
+
+from . import timed_benchmark
+
+RECORDS = 1_000_000
+SMALL_RECORDS = 20_000
+DUPLICATE_SHARE = 0.2
+MIN_RECALL = 0.99
+MAX_US_PER_RECORD = 150
+
+VOCABULARY_SIZE = 20_000
+TITLE_WORDS = 8
+ABSTRACT_WORDS = 120
+
+
+def _records(rng, count):
+    vocabulary = ["".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=rng.randint(3, 10)))
+                  for _ in range(VOCABULARY_SIZE)]
+    papers, expected = [], {}
+    originals = int(count * (1 - DUPLICATE_SHARE))
+    for i in range(originals):
+        papers.append(Paper(
+            id=f"W{i}",
+            title=" ".join(rng.choices(vocabulary, k=TITLE_WORDS)).capitalize(),
+            abstract=" ".join(rng.choices(vocabulary, k=ABSTRACT_WORDS)),
+            authors=[],
+            year=2020,
+            journal="",
+            doi=f"10.{1000 + i % 9000}/{i}" if i % 2 else None,
+        ))
+    for i in range(count - originals):
+        original = papers[rng.randrange(originals)]
+        paper_id = f"D{i}"
+        kind = i % 3
+        if kind == 0 and original.doi:
+            duplicate = Paper(paper_id, original.title.upper(), "", [], 2020, "",
+                              doi=f"https://doi.org/{original.doi.upper()}")
+        elif kind == 1 or not original.doi and kind == 0:
+            duplicate = Paper(paper_id, original.title + ".", "", [], 2020, "")
+        else:
+            words = original.abstract.split()
+            words[rng.randrange(len(words))] = rng.choice(vocabulary)
+            duplicate = Paper(paper_id, original.title + ": a study", "Abstract " + " ".join(words), [], 2020, "")
+        papers.append(duplicate)
+        expected[paper_id] = original.id
+    return papers, expected
+
+
+def _deduplicate(count):
+    papers, expected = _records(random.Random(0), count)
+
+    start = time.perf_counter()
+    result = PaperDeduplicator().deduplicate(papers)
+    elapsed = time.perf_counter() - start
+
+    found = sum(result.duplicates.get(paper_id) == original for paper_id, original in expected.items())
+    print(
+        f"{count} records: {elapsed:.1f} s ({elapsed / count * 1e6:.0f} us/record), "
+        f"{result.duplicates_removed} duplicates removed {result.removed_by}, "
+        f"recall {found / len(expected):.4f}"
+    )
+    assert set(result.duplicates) <= set(expected)
+    assert found / len(expected) >= MIN_RECALL
+    return elapsed
+
+
+def test_deduplicates_20k_records():
+    _deduplicate(SMALL_RECORDS)
+
+
+@timed_benchmark
+def test_deduplicates_1m_records_in_linear_time():
+    elapsed = _deduplicate(RECORDS)
+
+    assert elapsed / RECORDS * 1e6 <= MAX_US_PER_RECORD
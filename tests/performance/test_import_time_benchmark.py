@@ -0,0 +1,69 @@
+"""
+Benchmark: cold-start cost of ``import knowledge_storm``.
+
+Each measurement runs in a fresh interpreter so that nothing is cached in
+``sys.modules``. What the lazy loading guarantees is that the heavy client
+modules stay unimported; the wall-clock limit is opt-in.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from . import timed_benchmark
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+HEAVY_MODULES = [
+    "dspy",
+    "openai",
+    "transformers",
+    "langchain_huggingface",
+    "langchain_qdrant",
+    "qdrant_client",
+    "sentence_transformers",
+    "knowledge_storm.lm",
+    "knowledge_storm.rm",
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import knowledge_storm
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def _cold_import():
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_import_does_not_load_heavy_dependencies():
+    loaded = set(_cold_import()["modules"])
+
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+@timed_benchmark
+def test_cold_import_time():
+    seconds = min(_cold_import()["seconds"] for _ in range(3))
+
+    print(f"import knowledge_storm: {seconds * 1000:.1f} ms")
+    assert seconds < 0.5
+
+
+def test_lazy_attributes_are_exported():
+    import knowledge_storm
+
+    lazy = set(knowledge_storm._LAZY_ATTRS)
+    assert lazy <= set(knowledge_storm.__all__)
+    assert lazy <= set(dir(knowledge_storm))
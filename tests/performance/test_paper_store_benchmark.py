@@ -0,0 +1,86 @@
+"""
+Benchmark: memory per paper of PaperStore against a list of Paper objects.
+
+Both hold the same string objects, so the measurement compares the
+per-record structure only: a Paper instance with its attribute dict and
+lists, against column entries, typed arrays and dictionary codes. Memory is
+counted with tracemalloc and checked on every run; the aggregate timing is
+opt-in.
+"""
+
+import gc
+import time
+import tracemalloc
+
+from knowledge_storm.modules.prisma.core import Paper
+from knowledge_storm.modules.prisma.paper_store import PaperStore
+
+from . import timed_benchmark
+
+PAPERS = 200_000
+AUTHORS_PER_PAPER = 4
+MIN_MEMORY_RATIO = 2.5
+MAX_COUNT_MS = 50
+
+
+def _pool():
+    return {
+        'ids': [f"W{i}" for i in range(PAPERS)],
+        'titles': [f"Study {i} of exercise therapy" for i in range(PAPERS)],
+        'dois': [f"10.1000/{i}" for i in range(PAPERS)],
+        'authors': [f"Author {i}" for i in range(PAPERS // 10)],
+        'journals': [f"Journal {i}" for i in range(1000)],
+    }
+
+
+def _paper(pool, i):
+    authors = pool['authors']
+    return Paper(
+        id=pool['ids'][i],
+        title=pool['titles'][i],
+        abstract=pool['titles'][i],
+        authors=[authors[(i * 7 + k) % len(authors)] for k in range(AUTHORS_PER_PAPER)],
+        year=2000 + i % 25,
+        journal=pool['journals'][i % 1000],
+        doi=pool['dois'][i],
+        keywords=["exercise", "pain"],
+        screening_decision="include" if i % 3 else "exclude",
+        confidence_score=0.8,
+    )
+
+
+def _traced(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        value = build()
+        return value, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def test_store_uses_less_memory_per_paper():
+    pool = _pool()
+    papers, list_bytes = _traced(lambda: [_paper(pool, i) for i in range(PAPERS)])
+    del papers
+    store, store_bytes = _traced(lambda: PaperStore.from_papers(_paper(pool, i) for i in range(PAPERS)))
+
+    print(
+        f"{PAPERS} papers: list {list_bytes / PAPERS:.0f} B/paper, store {store_bytes / PAPERS:.0f} B/paper "
+        f"({list_bytes / store_bytes:.1f}x)"
+    )
+    assert list_bytes / store_bytes >= MIN_MEMORY_RATIO
+
+
+@timed_benchmark
+def test_decision_counts_are_fast():
+    pool = _pool()
+    store = PaperStore.from_papers(_paper(pool, i) for i in range(PAPERS))
+
+    start = time.perf_counter()
+    counts = store.value_counts('screening_decision')
+    count_ms = (time.perf_counter() - start) * 1e3
+
+    print(f"{PAPERS} papers: decision counts in {count_ms:.1f} ms")
+    assert counts == {'include': PAPERS - PAPERS // 3 - 1, 'exclude': PAPERS // 3 + 1}
+    assert count_ms <= MAX_COUNT_MS
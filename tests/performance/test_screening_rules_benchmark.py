@@ -0,0 +1,85 @@
+"""
+Benchmark: PRISMA rule screening of 100k synthetic abstracts.
+
+Runs the exclusion and inclusion rule checks of ``ScreeningAssistant`` through
+the compiled rule engine and compares a sample against the previous
+per-pattern ``re.search`` loop, which must agree on every decision.
+"""
+
+import random
+import re
+import time
+
+from knowledge_storm.modules.prisma.screening import ScreeningAssistant
+
+ABSTRACTS = 100_000
+BASELINE_SAMPLE = 5_000
+MIN_SPEEDUP = 3.0
+
+WORDS = (
+    "the of and we study results data analysis treatment outcome effect baseline "
+    "significant participants trial group compared improved increased reduced "
+    "patients years clinical intervention follow-up symptoms assessed"
+).split()
+PHRASES = [
+    "randomized controlled trial", "in laboratory mice", "participants were enrolled",
+    "n = 240", "p < 0.01", "double-blind", "primary outcome", "systematic review",
+    "conference abstract", "ethics approval", "cell line", "previously published",
+]
+
+
+def _abstract(rng):
+    words = [rng.choice(WORDS) for _ in range(rng.randint(120, 250))]
+    for _ in range(rng.randint(0, 3)):
+        words.insert(rng.randrange(len(words)), rng.choice(PHRASES))
+    return " ".join(words)
+
+
+def _naive_screen(assistant, text):
+    for category, patterns in assistant.exclusion_patterns.items():
+        for pattern in patterns:
+            if re.search(pattern, text, re.IGNORECASE):
+                return 'exclude', category
+    reasons = [
+        category
+        for category, patterns in assistant.inclusion_indicators.items()
+        for pattern in patterns
+        if re.search(pattern, text, re.IGNORECASE)
+    ]
+    return len(reasons), reasons
+
+
+def _engine_screen(assistant, text):
+    excluded = assistant._check_exclusion_patterns(text)
+    if excluded:
+        return 'exclude', excluded[1]
+    return assistant._check_inclusion_indicators(text)
+
+
+def test_rule_engine_screens_100k_abstracts():
+    rng = random.Random(0)
+    abstracts = [_abstract(rng) for _ in range(ABSTRACTS)]
+    assistant = ScreeningAssistant()
+
+    start = time.perf_counter()
+    for text in abstracts:
+        _engine_screen(assistant, text)
+    engine = (time.perf_counter() - start) / ABSTRACTS
+
+    sample = abstracts[:BASELINE_SAMPLE]
+    start = time.perf_counter()
+    naive_results = [_naive_screen(assistant, text) for text in sample]
+    naive = (time.perf_counter() - start) / BASELINE_SAMPLE
+
+    print(
+        f"{ABSTRACTS} abstracts: rule engine {engine * 1e6:.0f} us/abstract "
+        f"({engine * ABSTRACTS:.1f} s total), re.search loop {naive * 1e6:.0f} us/abstract "
+        f"({naive / engine:.1f}x)"
+    )
+    for text, (score_or_decision, reasons) in zip(sample, naive_results):
+        got = _engine_screen(assistant, text)
+        if score_or_decision == 'exclude':
+            assert got == ('exclude', f"Excluded: {reasons.replace('_', ' ')}")
+        else:
+            assert got == (score_or_decision, [r.replace('_', ' ') for r in reasons])
+    assert naive / engine >= MIN_SPEEDUP
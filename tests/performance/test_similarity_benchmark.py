@@ -0,0 +1,98 @@
+"""
+Benchmark: claim scoring on long documents versus difflib.SequenceMatcher.
+
+The code the scorers replaced was ``SequenceMatcher(None, claim, source)``
+with its default ``autojunk`` heuristic. On texts over 200 characters that
+heuristic drops every character making up more than 1% of the text, i.e.
+nearly all of them, which keeps it fast but makes its ratio meaningless. On
+~20k-word documents the passage scorers cost about the same as that call
+(0.8-1.2x its time across runs), so they add no speedup over it; they are
+well over 10x faster than a real character alignment (``autojunk=False``).
+The absolute per-document budget is opt-in.
+"""
+
+import random
+import time
+from difflib import SequenceMatcher
+
+from knowledge_storm.services.similarity import BM25Scorer, MinHashScorer
+
+from . import timed_benchmark
+
+WORDS = (
+    "the of and model retrieval language study results data analysis patients "
+    "treatment outcome trial effect cohort baseline significant randomized"
+).split()
+DOCUMENTS = 5
+SENTENCES_PER_DOC = 1500  # ~20k words, a long full text
+# Allowed cost relative to the replaced SequenceMatcher call, with headroom for timing noise
+MAX_RATIO_TO_PREVIOUS = 1.5
+MIN_SPEEDUP_OVER_ALIGNMENT = 10
+MAX_MS_PER_DOC = 50
+
+
+def _document(rng):
+    sentences = [" ".join(rng.choice(WORDS) for _ in range(14)).capitalize() + "." for _ in range(SENTENCES_PER_DOC)]
+    return " ".join(sentences)
+
+
+def _inputs():
+    rng = random.Random(0)
+    docs = [_document(rng) for _ in range(DOCUMENTS)]
+    claims = [" ".join(rng.choice(WORDS) for _ in range(20)) for _ in range(DOCUMENTS)]
+    return claims, docs
+
+
+def _time(fn, claims, docs):
+    start = time.perf_counter()
+    for claim, doc in zip(claims, docs):
+        fn(claim, doc)
+    return (time.perf_counter() - start) / len(docs)
+
+
+def _previous_score(claim, doc):
+    # CitationVerifier._calculate_verification_score before the scorers
+    return SequenceMatcher(None, claim.lower(), doc.lower()).ratio()
+
+
+def _scorer_times(claims, docs):
+    return _time(MinHashScorer().score, claims, docs), _time(BM25Scorer().score, claims, docs)
+
+
+def test_passage_scorers_cost_no_more_than_previous_sequence_matcher():
+    claims, docs = _inputs()
+    previous = _time(_previous_score, claims, docs)
+    minhash, bm25 = _scorer_times(claims, docs)
+
+    print(
+        f"SequenceMatcher (default): {previous * 1000:.1f} ms/doc, "
+        f"MinHash: {minhash * 1000:.1f} ms/doc ({previous / minhash:.1f}x), "
+        f"BM25: {bm25 * 1000:.1f} ms/doc ({previous / bm25:.1f}x)"
+    )
+    assert minhash <= previous * MAX_RATIO_TO_PREVIOUS
+    assert bm25 <= previous * MAX_RATIO_TO_PREVIOUS
+
+
+def test_passage_scorers_are_faster_than_full_alignment():
+    claims, docs = _inputs()
+    alignment = _time(
+        lambda c, d: SequenceMatcher(None, c.lower(), d.lower(), autojunk=False).ratio(), claims, docs
+    )
+    minhash, bm25 = _scorer_times(claims, docs)
+
+    print(
+        f"SequenceMatcher (autojunk=False): {alignment * 1000:.1f} ms/doc, "
+        f"MinHash {alignment / minhash:.0f}x, BM25 {alignment / bm25:.0f}x faster"
+    )
+    assert minhash * MIN_SPEEDUP_OVER_ALIGNMENT < alignment
+    assert bm25 * MIN_SPEEDUP_OVER_ALIGNMENT < alignment
+
+
+@timed_benchmark
+def test_passage_scorers_stay_within_budget():
+    claims, docs = _inputs()
+    minhash, bm25 = _scorer_times(claims, docs)
+
+    print(f"MinHash: {minhash * 1000:.1f} ms/doc, BM25: {bm25 * 1000:.1f} ms/doc")
+    assert minhash * 1000 < MAX_MS_PER_DOC
+    assert bm25 * 1000 < MAX_MS_PER_DOC
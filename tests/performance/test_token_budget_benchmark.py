@@ -0,0 +1,36 @@
+"""
+Benchmark: token budgeting must add well under a millisecond per prompt.
+"""
+
+import random
+import time
+
+from knowledge_storm.token_budget import fit_to_budget, get_token_counter
+
+from . import timed_benchmark
+
+WORDS = "the of and model retrieval language study results data analysis".split()
+PROMPTS = 200
+
+
+def _prompt(rng, n_words):
+    lines = []
+    for _ in range(n_words // 12):
+        lines.append(" ".join(rng.choice(WORDS) for _ in range(12)))
+    return "\n".join(lines)
+
+
+@timed_benchmark
+def test_fit_to_budget_overhead_is_sub_millisecond():
+    rng = random.Random(0)
+    # Typical STORM contexts: mostly within budget, some needing truncation.
+    prompts = [_prompt(rng, rng.choice([300, 800, 1500])) for _ in range(PROMPTS)]
+    get_token_counter(None)  # warm the encoder cache
+
+    start = time.perf_counter()
+    for prompt in prompts:
+        fit_to_budget(prompt, None, max_tokens=1300)
+    per_prompt_ms = (time.perf_counter() - start) / PROMPTS * 1000
+
+    print(f"fit_to_budget: {per_prompt_ms:.3f} ms/prompt")
+    assert per_prompt_ms < 1.0
@@ -0,0 +1,122 @@
+"""
+Unit tests for PRISMA duplicate detection.
+"""
+
+import pytest
+
+from knowledge_storm.modules.prisma.core import Paper
+from knowledge_storm.modules.prisma.deduplication import PaperDeduplicator, normalize_title
+from knowledge_storm.modules.prisma.paper_store import PaperStore, PaperView
+
+ABSTRACT = (
+    "We conducted a randomized controlled trial of exercise therapy in 240 adults "
+    "with chronic low back pain. The primary outcome was pain intensity at 12 weeks; "
+    "secondary outcomes included disability, quality of life and adverse events. "
+    "Participants were allocated to supervised exercise sessions twice weekly or to "
+    "usual care delivered by their general practitioner. Exercise therapy reduced pain "
+    "intensity compared with usual care, and the benefit was maintained at six months."
+)
+
+
+def _paper(paper_id, title="Exercise therapy for chronic low back pain", abstract=ABSTRACT, doi=None,
+           year=2023, authors=("Test Author",)):
+    return Paper(
+        id=paper_id,
+        title=title,
+        abstract=abstract,
+        authors=list(authors),
+        year=year,
+        journal="Test Journal",
+        doi=doi,
+    )
+
+
+class TestPaperDeduplicator:
+    """Test suite for PaperDeduplicator."""
+
+    def test_doi_variants_are_duplicates(self):
+        papers = [
+            _paper("openalex:1", doi="10.1000/ABC"),
+            _paper("crossref:1", title="Unrelated title of the same record", abstract="", doi="https://doi.org/10.1000/abc"),
+        ]
+        result = PaperDeduplicator().deduplicate(papers)
+        assert [p.id for p in result.papers] == ["openalex:1"]
+        assert result.duplicates == {"crossref:1": "openalex:1"}
+        assert result.removed_by['doi'] == 1
+
+    def test_normalized_titles_are_duplicates(self):
+        papers = [
+            _paper("a", title="Exercise Therapy for Chronic Low-Back Pain.", abstract=""),
+            _paper("b", title="exercise therapy for chronic low back pain", abstract=""),
+        ]
+        result = PaperDeduplicator().deduplicate(papers)
+        assert result.prisma_counts == {'records_identified': 2, 'duplicates_removed': 1, 'records_screened': 1}
+        assert result.removed_by['title'] == 1
+
+    def test_title_match_needs_year_or_first_author(self):
+        papers = [
+            _paper("original", abstract="", year=2012, authors=["Smith J"]),
+            _paper("update", abstract="", year=2019, authors=["Lee K"]),
+            _paper("erratum", abstract="", year=2013, authors=["Other P"]),
+            _paper("preprint", abstract="", year=2017, authors=["Lee, Kim"]),
+        ]
+        result = PaperDeduplicator().deduplicate(papers)
+        assert [p.id for p in result.papers] == ["original", "update"]
+        assert result.duplicates == {"erratum": "original", "preprint": "update"}
+
+    def test_near_duplicate_abstracts_are_merged(self):
+        papers = [
+            _paper("a"),
+            _paper("b", title="Exercise therapy for chronic lower back pain",
+                   abstract=f"Background: {ABSTRACT} (c) 2023 The Authors."),
+        ]
+        result = PaperDeduplicator().deduplicate(papers)
+        assert result.duplicates == {"b": "a"}
+        assert result.removed_by['near_duplicate'] == 1
+
+    def test_different_dois_are_never_merged(self):
+        papers = [_paper("preprint", doi="10.1101/1"), _paper("journal", doi="10.1000/1")]
+        result = PaperDeduplicator().deduplicate(papers)
+        assert result.duplicates_removed == 0
+
+    def test_distinct_papers_are_kept(self):
+        papers = [
+            _paper("a"),
+            _paper("b", title="Mindfulness for anxiety in adolescents",
+                   abstract="A cohort study of 1,200 adolescents followed for two years reporting anxiety "
+                            "scores, school attendance and sleep quality after a mindfulness programme."),
+            _paper("c", title="Editorial", abstract=""),
+            _paper("d", title="Editorial", abstract=""),
+        ]
+        result = PaperDeduplicator().deduplicate(papers)
+        assert [p.id for p in result.papers] == ["a", "b", "c", "d"]
+
+    def test_paper_view_is_deduplicated_on_columns(self, monkeypatch):
+        store = PaperStore.from_papers([
+            _paper("a", doi="10.1000/abc"),
+            _paper("b", title="Mindfulness for anxiety in adolescents", abstract=""),
+            _paper("c", title="Exercise therapy for chronic low back pain.", abstract=""),
+        ])
+
+        def no_papers(row):
+            raise AssertionError("Paper built during deduplication")
+
+        monkeypatch.setattr(store, 'paper', no_papers)
+        result = PaperDeduplicator().deduplicate(store.view([2, 1, 0]))
+
+        assert isinstance(result.papers, PaperView)
+        assert list(result.papers.rows) == [2, 1]
+        assert result.duplicates == {"a": "c"}
+
+    def test_signature_similarity(self):
+        deduplicator = PaperDeduplicator()
+        sig = deduplicator.signature(ABSTRACT)
+        assert deduplicator.similarity(sig, sig) == 1.0
+        assert deduplicator.signature("too short") is None
+
+    def test_invalid_band_layout(self):
+        with pytest.raises(ValueError):
+            PaperDeduplicator(num_bins=30, bands=8)
+
+    def test_normalize_title(self):
+        assert normalize_title("  Deep Learning: A Review. ") == "deep learning a review"
@@ -2,6 +2,8 @@
 Unit tests for PRISMA data extraction functionality.
 """
 
+import asyncio
+
 import pytest
 from knowledge_storm.modules.prisma.extraction import DataExtractionHelper
 from knowledge_storm.modules.prisma.core import Paper, ExtractionTemplate
@@ -288,5 +290,112 @@ class TestDataExtractionHelper:
         assert extracted_data["paper_id"] == paper.id
 
 
+class FakeVerifier:
+    """Records VERIFY sources and the peak number of concurrent lookups."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.sources = []
+        self.active = self.peak = 0
+
+    async def verify_citation_async(self, claim, source):
+        self.sources.append(source)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return {'verified': True, 'confidence': 0.9}
+
+
+class FakeSourceService:
+    """Resolves DOIs from a dict and records each batched lookup."""
+
+    def __init__(self, records):
+        self.records = records
+        self.calls = []
+
+    async def resolve_dois(self, dois):
+        self.calls.append(list(dois))
+        return {doi: self.records.get(doi, {}) for doi in dois}
+
+
+def _papers(count, abstract="A cohort of n = 40 adults", doi=None):
+    return [
+        Paper(id=f"p{i}", title=f"Study {i}", abstract=abstract, authors=[], year=2023, journal="J",
+              doi=doi and f"{doi}{i}")
+        for i in range(count)
+    ]
+
+
+class TestBatchExtraction:
+    """Test suite for DataExtractionHelper.extract_data_batch."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_and_order_kept(self):
+        verifier = FakeVerifier(delay=0.01)
+        helper = DataExtractionHelper(citation_verifier=verifier)
+        papers = _papers(10)
+        progress = []
+
+        results = await helper.extract_data_batch(
+            papers, [helper.get_template('observational')] * len(papers),
+            concurrency=3, on_progress=lambda done, total: progress.append((done, total))
+        )
+
+        assert [r['outcome'] for r in results] == [f"Extract outcome from: Study {i}..." for i in range(10)]
+        assert all(r['outcome_confidence'] == 0.9 for r in results)
+        assert verifier.peak == 3
+        assert progress == [(i, 10) for i in range(1, 11)]
+
+    @pytest.mark.asyncio
+    async def test_slow_verification_times_out(self):
+        helper = DataExtractionHelper(citation_verifier=FakeVerifier(delay=10))
+        results = await helper.extract_data_batch(
+            _papers(2), [helper.get_template('observational')] * 2, timeout=0.01
+        )
+        assert [r['outcome_confidence'] for r in results] == [0.7, 0.7]
+
+    @pytest.mark.asyncio
+    async def test_dois_are_resolved_in_one_batch(self):
+        verifier = FakeVerifier()
+        service = FakeSourceService({'10.1/a0': {'abstract': 'Resolved abstract', 'doi': '10.1/a0'}})
+        helper = DataExtractionHelper(citation_verifier=verifier, academic_source_service=service)
+        papers = _papers(2, abstract="", doi="10.1/a") + _papers(1)
+
+        await helper.extract_data_batch(papers, [helper.get_template('observational')] * 3)
+
+        assert service.calls == [['10.1/a0', '10.1/a1']]
+        assert verifier.sources[0]['text'] == 'Resolved abstract'
+        assert 'doi' not in verifier.sources[0]
+        assert verifier.sources[1] == {'text': '', 'doi': '10.1/a1'}
+
+    @pytest.mark.asyncio
+    async def test_abstracts_are_analyzed_as_one_batch(self, monkeypatch):
+        helper = DataExtractionHelper(citation_verifier=FakeVerifier())
+        batches = []
+        analyze_batch = helper.abstract_analyzer.analyze_batch
+
+        def spy(papers):
+            batches.append(len(papers))
+            return analyze_batch(papers)
+
+        def per_paper(paper):
+            raise AssertionError("abstract analyzed per paper")
+
+        monkeypatch.setattr(helper.abstract_analyzer, 'analyze_batch', spy)
+        monkeypatch.setattr(helper.abstract_analyzer, 'analyze_abstract', per_paper)
+        papers = _papers(3, abstract="A randomized controlled trial of 120 participants with pain")
+
+        results = await helper.extract_data_batch(papers, [helper.get_template('clinical_trial')] * 3)
+
+        assert batches == [3]
+        assert [r['sample_size'] for r in results] == [120] * 3
+        assert [r['study_design'] for r in results] == ['randomized_controlled_trial'] * 3
+        assert results[0]['outcome_measures'] == ['pain']
+        assert results[0]['analysis_confidence'] > 0
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -0,0 +1,63 @@
+"""
+Unit tests for the columnar PRISMA paper store.
+"""
+
+from dataclasses import fields
+
+import pytest
+
+from knowledge_storm.modules.prisma.core import Paper
+from knowledge_storm.modules.prisma.paper_store import PaperStore, PaperView
+
+
+def _papers():
+    return [
+        Paper(id="a", title="Exercise for pain", abstract="Trial", authors=["Ann Lee", "Bo Chen"], year=2020,
+              journal="Spine", doi="10.1/a", keywords=["pain"], study_type="rct", sample_size=120),
+        Paper(id="b", title="Yoga for pain", abstract="Cohort", authors=["Bo Chen"], year=2021, journal="Spine"),
+        Paper(id="c", title="Editorial", abstract="", authors=[], year=0, journal="Pain", confidence_score=0.9,
+              screening_decision="exclude", exclusion_reason="wrong_study_type"),
+    ]
+
+
+class TestPaperStore:
+    """Test suite for PaperStore."""
+
+    def test_rows_materialize_as_equal_papers(self):
+        papers = _papers()
+        store = PaperStore.from_papers(papers)
+        assert len(store) == 3
+        assert [store.paper(row) for row in range(3)] == papers
+
+    def test_every_paper_field_is_stored(self):
+        paper = Paper(**{f.name: getattr(_papers()[0], f.name) for f in fields(Paper)})
+        assert PaperStore.from_papers([paper]).paper(0) == paper
+
+    def test_views_are_lazy_sequences(self):
+        store = PaperStore.from_papers(_papers())
+        view = store.view([2, 0])
+        assert isinstance(view[1:], PaperView)
+        assert [p.id for p in view] == ["c", "a"]
+        assert view[-1].authors == ["Ann Lee", "Bo Chen"]
+        assert len(store.view()) == 3
+
+    def test_columns_are_written_by_row(self):
+        store = PaperStore.from_papers(_papers())
+        store.set_screening(1, "include", None, 0.85)
+        store.set('sample_size', 1, 40)
+        paper = store.paper(1)
+        assert (paper.screening_decision, paper.confidence_score, paper.sample_size) == ("include", 0.85, 40)
+        assert store.column('screening_decision') == [None, "include", "exclude"]
+        with pytest.raises(KeyError):
+            store.set('authors', 0, [])
+
+    def test_value_counts(self):
+        store = PaperStore.from_papers(_papers())
+        assert store.value_counts('journal') == {"Spine": 2, "Pain": 1}
+        assert store.value_counts('journal', [1, 2]) == {"Spine": 1, "Pain": 1}
+        assert store.value_counts('authors') == {"Bo Chen": 2, "Ann Lee": 1}
+        assert store.value_counts('year', [0, 1]) == {2020: 1, 2021: 1}
+
+    def test_take_keeps_selected_rows(self):
+        subset = PaperStore.from_papers(_papers()).take([2, 1])
+        assert [p.id for p in subset.view()] == ["c", "b"]
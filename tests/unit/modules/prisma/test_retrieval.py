@@ -0,0 +1,163 @@
+"""
+Unit tests for PRISMA paper retrieval.
+"""
+
+import asyncio
+
+import pytest
+
+from knowledge_storm.modules.prisma.core import SearchStrategy
+from knowledge_storm.modules.prisma.retrieval import (
+    PaperRetriever, paper_from_crossref, paper_from_openalex
+)
+
+OPENALEX_WORK = {
+    "id": "https://openalex.org/W1",
+    "doi": "https://doi.org/10.1000/ABC",
+    "title": "Exercise therapy for chronic low back pain",
+    "publication_year": 2021,
+    "authorships": [{"author": {"display_name": "A. Author"}}],
+    "primary_location": {"source": {"display_name": "Spine"}},
+    "abstract_inverted_index": {"Exercise": [0], "reduced": [1], "pain": [2]},
+    "type": "article",
+}
+CROSSREF_ITEM = {
+    "DOI": "10.1000/abc",
+    "title": ["Exercise therapy for chronic low back pain"],
+    "author": [{"given": "Ann", "family": "Author"}],
+    "issued": {"date-parts": [[2021, 3]]},
+    "container-title": ["Spine"],
+    "abstract": "<jats:p>Exercise reduced pain.</jats:p>",
+    "URL": "https://doi.org/10.1000/abc",
+}
+
+
+class FakeSourceService:
+    """Serves canned pages and records the arguments of every search."""
+
+    def __init__(self, openalex=(), crossref=(), fail=(), fail_after=0, delay=None):
+        self.results = {'openalex': list(openalex), 'crossref': list(crossref)}
+        self.fail = fail
+        self.fail_after = fail_after
+        self.delay = delay or {}
+        self.calls = []
+
+    async def _stream(self, source, query, max_results, filters):
+        self.calls.append((source, query, filters))
+        for n, record in enumerate(self.results[source][:max_results]):
+            if source in self.fail and n == self.fail_after:
+                raise ConnectionError(f"{source} unavailable")
+            await asyncio.sleep(self.delay.get(source, 0))
+            yield record
+        if source in self.fail and not self.results[source]:
+            raise ConnectionError(f"{source} unavailable")
+
+    def iter_openalex(self, query=None, max_results=None, filters=None):
+        return self._stream('openalex', query, max_results, filters)
+
+    def iter_crossref(self, query=None, max_results=None, filters=None):
+        return self._stream('crossref', query, max_results, filters)
+
+
+def _strategy(queries, date_range=(2019, 2024)):
+    return SearchStrategy(
+        research_question="Q",
+        pico_elements={},
+        search_queries=queries,
+        inclusion_criteria=[],
+        exclusion_criteria=[],
+        date_range=date_range,
+    )
+
+
+class TestRecordMapping:
+    """Test suite for OpenAlex and Crossref record mapping."""
+
+    def test_openalex_work(self):
+        paper = paper_from_openalex(OPENALEX_WORK)
+        assert paper.id == "W1"
+        assert paper.doi == "10.1000/abc"
+        assert paper.abstract == "Exercise reduced pain"
+        assert (paper.authors, paper.year, paper.journal) == (["A. Author"], 2021, "Spine")
+
+    def test_crossref_item(self):
+        paper = paper_from_crossref(CROSSREF_ITEM)
+        assert paper.id == "10.1000/abc"
+        assert paper.abstract == "Exercise reduced pain."
+        assert (paper.authors, paper.year, paper.journal) == (["Ann Author"], 2021, "Spine")
+
+
+class TestPaperRetriever:
+    """Test suite for PaperRetriever."""
+
+    @pytest.mark.asyncio
+    async def test_queries_run_once_per_source_with_date_filters(self):
+        service = FakeSourceService()
+        strategy = _strategy({'pubmed': '("adults") AND ("therapy")', 'scopus': '("adults") AND ("therapy")'})
+        await PaperRetriever(service).retrieve(strategy)
+
+        assert sorted(service.calls) == [
+            ('crossref', 'adults therapy', {'from-pub-date': '2019', 'until-pub-date': '2024'}),
+            ('openalex', '("adults") AND ("therapy")',
+             {'from_publication_date': '2019-01-01', 'to_publication_date': '2024-12-31'}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_duplicates_across_sources_are_merged(self):
+        crossref_only = dict(CROSSREF_ITEM, DOI="10.1000/other", title=["A different trial of yoga"])
+        service = FakeSourceService(
+            openalex=[dict(OPENALEX_WORK, abstract_inverted_index=None)],
+            crossref=[CROSSREF_ITEM, crossref_only],
+        )
+        papers = await PaperRetriever(service).retrieve(_strategy({'pubmed': 'q'}))
+
+        assert sorted(p.doi for p in papers) == ["10.1000/abc", "10.1000/other"]
+        merged = next(p for p in papers if p.doi == "10.1000/abc")
+        assert merged.abstract == "Exercise reduced pain."
+
+    @pytest.mark.asyncio
+    async def test_same_title_from_different_studies_is_kept(self):
+        update = dict(OPENALEX_WORK, id="W2", doi=None, publication_year=2016,
+                      authorships=[{"author": {"display_name": "B. Other"}}])
+        service = FakeSourceService(openalex=[dict(OPENALEX_WORK, doi=None), update])
+        papers = await PaperRetriever(service, sources=('openalex',)).retrieve(_strategy({'pubmed': 'q'}))
+
+        assert [p.id for p in papers] == ["W1", "W2"]
+
+    @pytest.mark.asyncio
+    async def test_failed_source_is_skipped(self):
+        service = FakeSourceService(openalex=[OPENALEX_WORK], fail=('crossref',))
+        papers = await PaperRetriever(service).retrieve(_strategy({'pubmed': 'q'}, date_range=None))
+
+        assert [p.id for p in papers] == ["W1"]
+        assert all(filters is None for _, _, filters in service.calls)
+
+    @pytest.mark.asyncio
+    async def test_source_failing_mid_stream_is_reported(self):
+        works = [dict(OPENALEX_WORK, id=f"W{i}", doi=None, title=f"Distinct paper number {i}") for i in range(5)]
+        service = FakeSourceService(openalex=works, fail=('openalex',), fail_after=2)
+        failed = []
+        papers = await PaperRetriever(service, sources=('openalex',)).retrieve(
+            _strategy({'pubmed': 'q'}), failed_sources=failed
+        )
+
+        assert [p.id for p in papers] == ["W0", "W1"]
+        assert failed == [{'source': 'openalex', 'query': 'q', 'records': 2, 'error': 'openalex unavailable'}]
+
+    @pytest.mark.asyncio
+    async def test_max_papers_keeps_papers_in_source_order(self):
+        works = [dict(OPENALEX_WORK, id=f"W{i}", doi=None, title=f"OpenAlex paper number {i}") for i in range(3)]
+        items = [dict(CROSSREF_ITEM, DOI=f"10.1000/{i}", title=[f"Crossref paper number {i}"]) for i in range(3)]
+        # Crossref answers first, but OpenAlex comes first in source order
+        service = FakeSourceService(openalex=works, crossref=items, delay={'openalex': 0.01})
+        papers = await PaperRetriever(service).retrieve(_strategy({'pubmed': 'q'}), 4)
+
+        assert [p.id for p in papers] == ["W0", "W1", "W2", "10.1000/0"]
+
+    @pytest.mark.asyncio
+    async def test_max_papers_stops_streaming(self):
+        works = [dict(OPENALEX_WORK, id=f"W{i}", doi=None, title=f"Distinct paper number {i}") for i in range(50)]
+        service = FakeSourceService(openalex=works)
+        papers = await PaperRetriever(service, sources=('openalex',)).retrieve(_strategy({'pubmed': 'q'}), 5)
+
+        assert [p.id for p in papers] == ["W0", "W1", "W2", "W3", "W4"]
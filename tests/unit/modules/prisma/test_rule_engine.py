@@ -0,0 +1,205 @@
+"""
+Unit tests for the compiled PRISMA rule engine.
+"""
+
+import random
+import re
+
+from knowledge_storm.modules.prisma import rule_engine
+from knowledge_storm.modules.prisma.abstract_analyzer import AbstractAnalyzer
+from knowledge_storm.modules.prisma.core import Paper, SearchStrategy
+from knowledge_storm.modules.prisma.rule_engine import (
+    CriteriaIndex, RuleSet, compile_criteria, compile_rules, text_tokens
+)
+from knowledge_storm.modules.prisma.screening import ScreeningAssistant
+
+
+TEXTS = [
+    "randomized controlled trial of 120 participants were enrolled; p < 0.05",
+    "editorial: comment on a cohort study in mice",
+    "in vitro cell line study of human tissue",
+    "in vitro cell line study",
+    "a total of 45 patients, n=45, with pain and quality of life outcomes",
+    "Not available in English. Spanish language article.",
+    "survey of rats and RCT methodology, CI 95% reported",
+    "nothing relevant here",
+    "Kelvin sign K text with non-ascii characters and rct",
+]
+
+
+def _naive_matches(table, text):
+    return [
+        (category, pattern)
+        for category, patterns in table.items()
+        for pattern in patterns
+        if re.search(pattern, text, re.IGNORECASE)
+    ]
+
+
+class TestRuleSet:
+    """Test suite for RuleSet."""
+
+    def test_matches_agree_with_sequential_search(self):
+        """Matches must equal a plain re.search loop over the same tables."""
+        assistant = ScreeningAssistant()
+        analyzer = AbstractAnalyzer()
+        tables = [
+            assistant.exclusion_patterns,
+            assistant.inclusion_indicators,
+            analyzer.study_design_patterns,
+            analyzer.outcome_measure_patterns,
+        ]
+        for table in tables:
+            rules = RuleSet(table)
+            for text in TEXTS + [text.lower() for text in TEXTS]:
+                got = [(m.category, m.pattern) for m in rules.matches(text)]
+                assert got == _naive_matches(table, text)
+
+    def test_shipped_tables_agree_with_re_search_on_generated_texts(self):
+        """Pin trigger filtering and lowercase regexes to plain re.search on the shipped tables."""
+        assistant = ScreeningAssistant()
+        analyzer = AbstractAnalyzer()
+        tables = [
+            assistant.exclusion_patterns,
+            assistant.inclusion_indicators,
+            analyzer.study_design_patterns,
+            analyzer.outcome_measure_patterns,
+            {'sample_size': analyzer.sample_size_patterns},
+        ]
+        patterns = [pattern for table in tables for patterns in table.values() for pattern in patterns]
+        # Words and symbols of the patterns themselves, so generated texts hit most rules
+        vocabulary = sorted({w for p in patterns for w in re.findall(r"[A-Za-z]{2,}", p)})
+        vocabulary += ["=", "n=", "42", "1,200", "95%", ":", "-", "(", ")", "human", "Kelvin \u212a"]
+        rng = random.Random(0)
+        texts = list(TEXTS)
+        for _ in range(1500):
+            words = rng.choices(vocabulary, k=rng.randint(1, 12))
+            text = rng.choice([" ", "  ", "-", ""]).join(words)
+            texts.append(rng.choice([text, text.lower(), text.upper(), text.title()]))
+
+        for table in tables:
+            rules = RuleSet(table)
+            for text in texts:
+                got = [(m.category, m.pattern) for m in rules.matches(text)]
+                assert got == _naive_matches(table, text), text
+
+    def test_unknown_opcodes_disable_triggers_and_lowercase_regex(self, monkeypatch):
+        """A pattern whose parse tree has opcodes the engine does not know runs unfiltered."""
+        monkeypatch.setattr(rule_engine, "_known_ops", lambda items: False)
+        rules = RuleSet({'animal': [r'\b(animal|mice)\b']})
+        (rule,) = rules._rules
+        assert rule.triggers is None and rule.lowercase_regex is None
+        assert rules.first("Mice study").category == 'animal'
+
+    def test_failed_self_check_disables_analysis(self, monkeypatch):
+        """If the parser no longer analyzes the reference patterns, no triggers are derived."""
+        monkeypatch.setattr(rule_engine, "_SELF_CHECK", ((r'\b(animal|mice)\b', ('other',), True),))
+        assert rule_engine._self_check() is False
+        monkeypatch.setattr(rule_engine, "_ANALYSIS_ENABLED", False)
+        (rule,) = RuleSet({'animal': [r'\b(animal|mice)\b']})._rules
+        assert rule.triggers is None and rule.lowercase_regex is None
+
+    def test_self_check_passes_on_this_interpreter(self):
+        assert rule_engine._self_check() is True
+
+    def test_first_respects_table_order(self):
+        """The first rule in table order wins, not the leftmost match."""
+        rules = RuleSet({'late': [r'alpha'], 'early': [r'omega']})
+        match = rules.first("omega before alpha")
+        assert match.category == 'late'
+
+    def test_matched_categories_are_distinct(self):
+        """Each category is reported once."""
+        rules = RuleSet({'pain': [r'\bpain\b', r'pain\s+score'], 'mortality': [r'mortality']})
+        assert rules.matched_categories("pain score and mortality") == ['pain', 'mortality']
+
+    def test_pattern_without_literals_always_runs(self):
+        """Patterns without a derivable trigger are never skipped."""
+        rules = RuleSet({'digits': [r'\d+']})
+        assert rules.first("42").match.group() == "42"
+
+    def test_cased_patterns_still_fold_lowercase_text(self):
+        """Patterns spelling uppercase letters keep matching lowercased text."""
+        rules = RuleSet({'ci': [r'CI\s+95'], 'id': [r'[A-Z]{3}-\d+'], 'rct': [r'rct']})
+        assert rules.matched_categories("ci 95 for abc-12 in an rct") == ['ci', 'id', 'rct']
+
+    def test_compile_rules_is_cached_by_content(self):
+        """Equal tables share one compiled RuleSet; edits recompile."""
+        table = {'a': [r'alpha']}
+        assert compile_rules(table) is compile_rules({'a': [r'alpha']})
+        table['a'].append(r'beta')
+        assert compile_rules(table).first("beta").category == 'a'
+
+
+class TestCriteriaIndex:
+    """Test suite for CriteriaIndex."""
+
+    def test_keywords_match_whole_words_only(self):
+        """Keyword 'only' must not match inside 'commonly'."""
+        index = CriteriaIndex(['Adults only'])
+        assert index.count_matches(text_tokens("commonly reported in children")) == 0
+        assert index.count_matches(text_tokens("adults aged 18-65")) == 1
+
+    def test_plurals_are_folded(self):
+        index = CriteriaIndex(['Animal studies', 'Case reports'])
+        assert index.matching(text_tokens("a study in animals")) == [0]
+        assert index.matching(text_tokens("single case report")) == [1]
+
+    def test_compound_keywords_need_all_tokens(self):
+        index = CriteriaIndex(['Long follow-up'])
+        assert index.count_matches(text_tokens("follow-up at 12 months")) == 1
+        assert index.count_matches(text_tokens("follow the protocol")) == 0
+
+    def test_each_criterion_counts_once(self):
+        index = compile_criteria(['randomized controlled trials', 'adults'])
+        assert index.count_matches(text_tokens("randomized controlled trial in adults")) == 2
+        assert compile_criteria(['randomized controlled trials', 'adults']) is index
+
+
+class TestSharedRules:
+    """Screening and abstract analysis results through the rule engine."""
+
+    def test_exclusion_pattern_category(self):
+        assistant = ScreeningAssistant()
+        decision, reason, confidence = assistant._check_exclusion_patterns("study of drug y in laboratory mice")
+        assert decision == 'exclude'
+        assert reason == "Excluded: wrong population"
+        assert confidence == 0.9
+
+    def test_inclusion_indicator_score(self):
+        assistant = ScreeningAssistant()
+        score, reasons = assistant._check_inclusion_indicators(
+            "double-blind randomized controlled trial with primary outcome"
+        )
+        assert score == 3
+        assert reasons == ['study type', 'methodology', 'quality indicators']
+
+    def test_criteria_checks_use_the_index(self):
+        assistant = ScreeningAssistant()
+        strategy = SearchStrategy(
+            research_question="Q",
+            pico_elements={},
+            search_queries={},
+            inclusion_criteria=['Adults only', 'Randomized controlled trials'],
+            exclusion_criteria=['Animal studies'],
+        )
+        text = "randomized trial of adults and animals"
+        assert assistant._check_inclusion_criteria(text, strategy) == 2
+        assert assistant._check_exclusion_criteria(text, strategy) == 1
+
+    def test_abstract_analyzer_sample_size_and_design(self):
+        analyzer = AbstractAnalyzer()
+        text = "a cohort study of 250 patients reporting mortality and adverse events"
+        assert analyzer._extract_sample_size(text) == 250
+        assert analyzer._identify_study_design(text) == 'cohort_study'
+        assert analyzer._extract_outcome_measures(text) == ['mortality', 'adverse_events']
+
+    def test_abstract_analyzer_batch_matches_per_paper(self):
+        analyzer = AbstractAnalyzer()
+        papers = [
+            Paper(str(i), "Title", text, [], 2023, "") for i, text in enumerate(TEXTS + [""])
+        ]
+        table = analyzer.analyze_batch(papers)
+        assert table.paper_ids == [p.id for p in papers]
+        assert [table.row(i) for i in range(len(table))] == [analyzer.analyze_abstract(p) for p in papers]
+        assert table.columns()['sample_size'][0] == 120
@@ -2,9 +2,16 @@
 Unit tests for PRISMA screening functionality.
 """
 
+import asyncio
+import json
+
 import pytest
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import AsyncMock, MagicMock, patch
-from knowledge_storm.modules.prisma.screening import ScreeningAssistant
+from knowledge_storm.modules.prisma import screening
+from knowledge_storm.modules.prisma.screening import (
+    PRISMAScreener, ScreeningAssistant, ScreeningStats, iter_papers_jsonl
+)
 from knowledge_storm.modules.prisma.core import Paper, SearchStrategy, ScreeningResult
 
 
@@ -283,6 +290,160 @@ class TestScreeningAssistant:
         assert not result.reason.startswith("Unknown")
 
 
+def _batch_papers(count):
+    abstracts = [
+        "Randomized controlled trial; participants were enrolled, primary outcome assessed, double-blind",
+        "Study of drug Y in laboratory mice",
+        "Cohort study of adults with regression analysis",
+        "Methodology not clearly described",
+    ]
+    return [
+        Paper(id=f"p{i}", title=f"Paper {i}", abstract=abstracts[i % len(abstracts)],
+              authors=["A"], year=2023, journal="J")
+        for i in range(count)
+    ]
+
+
+def _batch_strategy():
+    return SearchStrategy(
+        research_question="Q",
+        pico_elements={'population': ['adults']},
+        search_queries={},
+        inclusion_criteria=['Adults only', 'Randomized controlled trials'],
+        exclusion_criteria=['Animal studies'],
+    )
+
+
+class TestBatchScreening:
+    """Test suite for chunked, concurrent batch screening."""
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_sequential_screening_in_order(self):
+        """Process-pool chunks give the same decisions, in input order, as one-by-one screening."""
+        papers = _batch_papers(40)
+        strategy = _batch_strategy()
+        assistant = ScreeningAssistant(max_workers=2, chunk_size=7, process_pool_min_papers=1)
+        
+        expected = [await assistant._screen_single_paper(p, strategy) for p in _batch_papers(40)]
+        results = await assistant.screen_papers(papers, strategy)
+        
+        assert [(p.screening_decision, p.exclusion_reason, p.confidence_score) for p in papers] == expected
+        assert [p.id for p in results['definitely_exclude']] == [f"p{i}" for i in range(1, 40, 4)]
+        assert results['performance_metrics']['total_papers'] == 40
+        assert sum(results['confidence_distribution'].values()) == 40
+    
+    @pytest.mark.asyncio
+    async def test_verify_lookups_are_concurrent_and_bounded(self):
+        """VERIFY calls overlap but never exceed verify_concurrency."""
+        in_flight = 0
+        peak = 0
+        
+        async def verify(claim, source):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {'verified': True}
+        
+        verifier = MagicMock()
+        verifier.verify_citation_async = verify
+        assistant = ScreeningAssistant(citation_verifier=verifier, verify_concurrency=3)
+        
+        results = await assistant.screen_papers(_batch_papers(24), _batch_strategy())
+        
+        assert results['verify_system_checks'] == 12
+        assert peak == 3
+
+
+class TestStreamingScreening:
+    """Test suite for the streaming screening API."""
+    
+    @pytest.mark.asyncio
+    async def test_stream_matches_batch_results(self):
+        """Streamed decisions and running stats agree with screen_papers."""
+        strategy = _batch_strategy()
+        assistant = ScreeningAssistant(max_workers=1, chunk_size=5)
+        batch = await assistant.screen_papers(_batch_papers(23), strategy)
+        
+        async def paper_source():
+            for paper in _batch_papers(23):
+                yield paper
+        
+        stats = ScreeningStats()
+        decisions = [d async for d in assistant.screen_stream(paper_source(), strategy, stats)]
+        
+        assert [d.paper.id for d in decisions] == [f"p{i}" for i in range(23)]
+        assert [d.paper.id for d in decisions if d.bucket == 'definitely_exclude'] == \
+            [p.id for p in batch['definitely_exclude']]
+        assert stats.exclusion_stats == batch['exclusion_stats']
+        assert stats.confidence_distribution == batch['confidence_distribution']
+        assert stats.performance_metrics == batch['performance_metrics']
+    
+    @pytest.mark.asyncio
+    async def test_stream_reads_input_lazily(self):
+        """Only one chunk is read ahead of the first decision."""
+        produced = 0
+        
+        def paper_source():
+            nonlocal produced
+            for paper in _batch_papers(1000):
+                produced += 1
+                yield paper
+        
+        assistant = ScreeningAssistant(max_workers=1, chunk_size=10)
+        stream = assistant.screen_stream(paper_source(), _batch_strategy())
+        await stream.__anext__()
+        await stream.aclose()
+        
+        assert produced == 10
+
+    @pytest.mark.asyncio
+    async def test_stream_drops_broken_pool_without_waiting(self, monkeypatch):
+        """A broken pool is shut down without waiting and not handed to later windows."""
+        pools = []
+
+        class BrokenPool:
+            def __init__(self, max_workers=None):
+                self.submits = 0
+                self.shutdowns = []
+                pools.append(self)
+
+            def submit(self, *args, **kwargs):
+                self.submits += 1
+                raise BrokenProcessPool("worker died")
+
+            def shutdown(self, wait=True, cancel_futures=False):
+                self.shutdowns.append(wait)
+
+        monkeypatch.setattr(screening, 'ProcessPoolExecutor', BrokenPool)
+        strategy = _batch_strategy()
+        assistant = ScreeningAssistant(max_workers=2, chunk_size=5, process_pool_min_papers=10)
+        expected = [await assistant._screen_single_paper(p, strategy) for p in _batch_papers(30)]
+
+        decisions = [d async for d in assistant.screen_stream(_batch_papers(30), strategy)]
+
+        assert [(d.decision, d.reason, d.confidence) for d in decisions] == expected
+        assert len(pools) == 1
+        assert pools[0].submits == 1
+        assert pools[0].shutdowns == [False]
+
+    @pytest.mark.asyncio
+    async def test_prisma_screener_streams_jsonl(self, tmp_path):
+        """PRISMAScreener streams papers read from a JSONL file."""
+        path = tmp_path / "papers.jsonl"
+        with open(path, "w") as f:
+            for paper in _batch_papers(4):
+                f.write(json.dumps({**paper.__dict__, 'source': 'openalex'}) + "\n")
+        
+        screener = PRISMAScreener(include_patterns=['adults'], exclude_patterns=['animal'])
+        stats = ScreeningStats()
+        decisions = [d async for d in screener.screen_stream(iter_papers_jsonl(str(path)), stats)]
+        
+        assert [d.paper.id for d in decisions] == ["p0", "p1", "p2", "p3"]
+        assert stats.total_papers == 4
+
+
 class TestScreeningFallback:
     """Test suite for screening fallback functionality."""
     
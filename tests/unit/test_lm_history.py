@@ -0,0 +1,127 @@
+"""
+Unit tests for bounded LM call history.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from knowledge_storm.interface import LMConfigs
+from knowledge_storm.lm_history import JsonlHistoryWriter, LMCallHistory
+
+
+class _FakeLM:
+    def __init__(self):
+        self.history = LMCallHistory(maxlen=3)
+
+
+class _FakeLMConfigs(LMConfigs):
+    def __init__(self):
+        self.writer_lm = _FakeLM()
+        self.reader_lm = _FakeLM()
+
+
+class TestLMCallHistory:
+    def test_keeps_only_most_recent_entries(self):
+        history = LMCallHistory(maxlen=3)
+        for i in range(10):
+            history.append({"prompt": str(i)})
+
+        assert len(history) == 3
+        assert [e["prompt"] for e in history] == ["7", "8", "9"]
+        assert history[-1]["prompt"] == "9"
+
+    def test_drain_empties_buffer(self):
+        history = LMCallHistory()
+        history.extend([{"prompt": "a"}, {"prompt": "b"}])
+
+        assert history.drain() == [{"prompt": "a"}, {"prompt": "b"}]
+        assert len(history) == 0
+
+    def test_concurrent_appends_are_not_lost(self):
+        history = LMCallHistory(maxlen=None)
+
+        def worker(n):
+            for i in range(500):
+                history.append({"prompt": f"{n}-{i}"})
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(history) == 4000
+
+    def test_pop_matches_list(self):
+        history = LMCallHistory()
+        history.extend([{"prompt": p} for p in "abcd"])
+
+        assert history.pop(0) == {"prompt": "a"}
+        assert history.pop() == {"prompt": "d"}
+        assert history.pop(1) == {"prompt": "c"}
+        assert [e["prompt"] for e in history] == ["b"]
+
+    def test_small_max_history_size_trims_with_pop(self):
+        # dspy trims LM.history with pop(0) before appending once it holds max_history_size entries
+        history, max_history_size = LMCallHistory(maxlen=10), 2
+        for i in range(5):
+            if len(history) >= max_history_size:
+                history.pop(0)
+            history.append({"prompt": str(i)})
+
+        assert [e["prompt"] for e in history] == ["3", "4"]
+
+    def test_dspy_record_history_with_small_max_history_size(self):
+        base_lm = pytest.importorskip("dspy.clients.base_lm")
+        if not hasattr(base_lm, "record_history"):
+            pytest.skip("dspy version without record_history")
+        import dspy
+
+        lm = SimpleNamespace(history=LMCallHistory(maxlen=10))
+        with dspy.settings.context(max_history_size=2):
+            for i in range(5):
+                base_lm.record_history(lm, {"prompt": str(i)})
+
+        assert [e["prompt"] for e in lm.history] == ["3", "4"]
+
+    def test_writer_receives_evicted_entries(self, tmp_path):
+        path = tmp_path / "calls.jsonl"
+        writer = JsonlHistoryWriter(str(path), exclude_keys=("kwargs",))
+        history = LMCallHistory(maxlen=2, writer=writer)
+        for i in range(5):
+            history.append({"prompt": str(i), "kwargs": {"temperature": 0}})
+        writer.close()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [line["prompt"] for line in lines] == ["0", "1", "2", "3", "4"]
+        assert all("kwargs" not in line for line in lines)
+        assert len(history) == 2
+
+
+class TestLMConfigsHistory:
+    def test_collect_and_reset_drains_bounded_history(self):
+        configs = _FakeLMConfigs()
+        configs.writer_lm.history.append({"prompt": "w"})
+        configs.reader_lm.history.append({"prompt": "r"})
+
+        history = configs.collect_and_reset_lm_history()
+
+        assert sorted(h["prompt"] for h in history) == ["r", "w"]
+        assert len(configs.writer_lm.history) == 0
+
+    def test_stream_lm_history_to_shares_one_file(self, tmp_path):
+        configs = _FakeLMConfigs()
+        path = tmp_path / "llm_call_history.jsonl"
+        configs.stream_lm_history_to(str(path))
+
+        configs.writer_lm.history.append({"prompt": "w", "kwargs": {}})
+        configs.reader_lm.history.append({"prompt": "r"})
+        writer = configs.stop_streaming_lm_history()
+
+        assert writer.path == str(path)
+        assert configs.writer_lm.history.writer is None
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        assert lines == [{"prompt": "w"}, {"prompt": "r"}]
@@ -0,0 +1,152 @@
+"""
+Unit tests for the self-hosted LM endpoint pool.
+"""
+
+import threading
+
+import pytest
+
+from knowledge_storm.lm_pool import Endpoint, EndpointPool, NoHealthyEndpointError, is_endpoint_failure
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class _Client:
+    def __init__(self, name, fail=False, error=None):
+        self.name = name
+        self.fail = fail
+        self.error = error
+        self.calls = 0
+
+    def __call__(self, prompt):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        if self.fail:
+            raise ConnectionError(f"{self.name} down")
+        return [f"{self.name}:{prompt}"]
+
+
+def _pool(*clients, **kwargs):
+    return EndpointPool([Endpoint(c.name, c) for c in clients], **kwargs)
+
+
+class TestEndpointSelection:
+    def test_least_outstanding_prefers_idle_endpoint(self):
+        a, b = _Client("a"), _Client("b")
+        pool = _pool(a, b)
+
+        first = pool.acquire()
+        second = pool.acquire()
+
+        assert {first.url, second.url} == {"a", "b"}
+
+    def test_ewma_prefers_faster_endpoint(self):
+        a, b = _Client("a"), _Client("b")
+        pool = _pool(a, b, strategy="ewma")
+        ep_a, ep_b = pool.endpoints
+        pool.release(pool.acquire(exclude={ep_b}), latency=2.0)
+        pool.release(pool.acquire(exclude={ep_a}), latency=0.1)
+
+        assert pool.acquire().url == "b"
+        assert ep_a.ewma_latency == 2.0
+
+    def test_concurrent_calls_spread_across_endpoints(self):
+        clients = [_Client(str(i)) for i in range(4)]
+        pool = _pool(*clients)
+        barrier = threading.Barrier(4)
+
+        def slow_call(client):
+            barrier.wait(timeout=5)
+            return client("p")
+
+        threads = [threading.Thread(target=pool.call, args=(slow_call,)) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert [c.calls for c in clients] == [1, 1, 1, 1]
+
+    def test_rejects_unknown_strategy(self):
+        with pytest.raises(ValueError):
+            _pool(_Client("a"), strategy="round_robin")
+
+
+class TestFailover:
+    def test_call_fails_over_to_healthy_endpoint(self):
+        bad, good = _Client("bad", fail=True), _Client("good")
+        pool = _pool(bad, good)
+
+        for _ in range(5):
+            assert pool.call(lambda c: c("q"))[0].startswith("good:")
+
+    def test_endpoint_ejected_after_max_failures(self):
+        bad, good = _Client("bad", fail=True), _Client("good")
+        pool = _pool(bad, good, max_failures=2, ejection_seconds=60)
+
+        for _ in range(50):
+            pool.call(lambda c: c("q"))
+
+        assert bad.calls == 2
+        assert pool.endpoints[0].stats()["ejected"] is True
+
+    def test_all_endpoints_failing_raises(self):
+        pool = _pool(_Client("a", fail=True), _Client("b", fail=True))
+
+        with pytest.raises(NoHealthyEndpointError):
+            pool.call(lambda c: c("q"))
+
+    def test_bad_request_is_raised_without_failover_or_ejection(self):
+        error = _StatusError(400)
+        first, second = _Client("a", error=error), _Client("b", error=error)
+        pool = _pool(first, second, max_failures=1)
+
+        for _ in range(3):
+            with pytest.raises(_StatusError) as raised:
+                pool.call(lambda c: c("oversized prompt"))
+            assert raised.value is error
+
+        assert first.calls + second.calls == 3
+        assert not any(e["ejected"] or e["total_failures"] for e in pool.stats())
+
+    def test_server_errors_and_timeouts_are_endpoint_failures(self):
+        assert is_endpoint_failure(_StatusError(503))
+        assert is_endpoint_failure(_StatusError(429))
+        assert is_endpoint_failure(TimeoutError())
+        assert not is_endpoint_failure(_StatusError(400))
+        assert not is_endpoint_failure(ValueError("malformed prompt"))
+
+    def test_failover_with_duplicate_urls(self):
+        bad, good = _Client("bad", fail=True), _Client("good")
+        pool = EndpointPool([Endpoint("default", bad), Endpoint("default", good)], strategy="ewma")
+        pool.endpoints[1].ewma_latency = 1.0  # Unmeasured "bad" is tried first
+
+        for _ in range(5):
+            assert pool.call(lambda c: c("q")) == ["good:q"]
+
+    def test_health_check_readmits_endpoint(self):
+        flaky = _Client("flaky", fail=True)
+        pool = _pool(flaky, max_failures=1, ejection_seconds=60, health_check=lambda e: True)
+        with pytest.raises(NoHealthyEndpointError):
+            pool.call(lambda c: c("q"))
+        assert pool.acquire() is None
+
+        flaky.fail = False
+        pool.check_health()
+
+        assert pool.call(lambda c: c("q")) == ["flaky:q"]
+
+    def test_expired_ejection_allows_trial_request(self):
+        flaky = _Client("flaky", fail=True)
+        pool = _pool(flaky, max_failures=1, ejection_seconds=0)
+        with pytest.raises(NoHealthyEndpointError):
+            pool.call(lambda c: c("q"))
+
+        flaky.fail = False
+        assert pool.call(lambda c: c("q")) == ["flaky:q"]
+        assert pool.endpoints[0].consecutive_failures == 0
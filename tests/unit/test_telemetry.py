@@ -0,0 +1,208 @@
+"""
+Unit tests for per-call LM/RM telemetry.
+"""
+
+import asyncio
+import contextvars
+import json
+import threading
+
+import pytest
+
+from knowledge_storm.interface import Engine, LMConfigs
+from knowledge_storm.telemetry import (
+    TelemetryRecorder,
+    current_span,
+    recording,
+    start_span,
+    trace_lm_call,
+    trace_rm_call,
+)
+
+
+@pytest.fixture
+def recorder(monkeypatch):
+    rec = TelemetryRecorder()
+    monkeypatch.setattr("knowledge_storm.telemetry._recorder", rec)
+    return rec
+
+
+class _LM:
+    kwargs = {"model": "test-model"}
+
+    @trace_lm_call
+    def basic_request(self, prompt, **kwargs):
+        return {"usage": {"prompt_tokens": 7, "completion_tokens": 3}}
+
+
+class _SubLM(_LM):
+    @trace_lm_call
+    def basic_request(self, prompt, **kwargs):
+        return super().basic_request(prompt, **kwargs)
+
+
+class _RM:
+    @trace_rm_call
+    def forward(self, query_or_queries, exclude_urls=None):
+        current_span().cache_hits += 1
+        return []
+
+
+class TestSpans:
+    def test_lm_call_records_tokens_and_stage(self, recorder):
+        with recording(recorder, "run_outline_generation_module"):
+            _LM().basic_request("hello")
+
+        (span,) = recorder.spans()
+        assert span.kind == "lm"
+        assert span.name == "test-model"
+        assert span.stage == "run_outline_generation_module"
+        assert (span.prompt_tokens, span.completion_tokens) == (7, 3)
+        assert span.duration >= 0
+
+    def test_nested_lm_requests_record_one_span(self, recorder):
+        _SubLM().basic_request("hello")
+
+        assert len(recorder.spans()) == 1
+
+    def test_rm_call_counts_queries_and_cache_hits(self, recorder):
+        _RM().forward(query_or_queries=["a", "b"], exclude_urls=[])
+
+        (span,) = recorder.spans()
+        assert (span.kind, span.name, span.num_queries) == ("rm", "_RM", 2)
+        assert span.cache_hit is True
+
+    def test_failed_call_records_error(self, recorder):
+        with pytest.raises(ValueError):
+            with start_span("lm", "m", recorder):
+                raise ValueError("boom")
+
+        assert recorder.spans()[0].error == "ValueError: boom"
+
+    def test_span_visible_in_async_tasks(self, recorder):
+        async def mark():
+            current_span().queue_wait += 0.5
+
+        async def run():
+            await asyncio.gather(mark(), mark())
+
+        with start_span("rm", "CrossrefRM", recorder) as span:
+            asyncio.run(run())
+
+        assert span.queue_wait == 1.0
+
+
+class TestRecordingScope:
+    def test_concurrent_recorders_keep_their_own_stages(self, recorder):
+        engines = {"a": TelemetryRecorder(), "b": TelemetryRecorder()}
+        both_recording = threading.Barrier(2)
+
+        def run(name):
+            with recording(engines[name], f"run_{name}"):
+                both_recording.wait(timeout=5)
+                _LM().basic_request("hello")
+                # Worker threads see the stage when run in a copy of the context
+                context = contextvars.copy_context()
+                worker = threading.Thread(target=context.run, args=(_LM().basic_request, "x"))
+                worker.start()
+                worker.join()
+
+        threads = [threading.Thread(target=run, args=(name,)) for name in engines]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        for name, engine_recorder in engines.items():
+            assert [s.stage for s in engine_recorder.spans()] == [f"run_{name}"] * 2
+        assert recorder.spans() == []
+
+    def test_reset_only_clears_its_own_recorder(self, recorder):
+        first, second = TelemetryRecorder(), TelemetryRecorder()
+        for rec in (first, second):
+            with recording(rec, "run_a"):
+                _LM().basic_request("hello")
+
+        first.reset()
+
+        assert first.spans() == []
+        assert len(second.spans()) == 1
+
+    def test_calls_outside_recording_go_to_default_recorder(self, recorder):
+        _LM().basic_request("hello")
+
+        (span,) = recorder.spans()
+        assert span.stage is None
+
+
+class _Engine(Engine):
+    async def run_knowledge_curation_module(self, **kwargs):
+        _LM().basic_request("hello")
+
+    async def run_outline_generation_module(self, **kwargs):
+        pass
+
+    async def run_article_generation_module(self, **kwargs):
+        pass
+
+    async def run_article_polishing_module(self, **kwargs):
+        pass
+
+    async def run(self, **kwargs):
+        pass
+
+
+class TestEngineTelemetry:
+    def test_engines_keep_separate_spans(self, recorder):
+        first, second = _Engine(LMConfigs()), _Engine(LMConfigs())
+        for engine in (first, second):
+            engine.apply_decorators()
+
+        async def run_both():
+            await asyncio.gather(first.run_knowledge_curation_module(), second.run_knowledge_curation_module())
+
+        asyncio.run(run_both())
+        first.reset()
+
+        assert first.telemetry.spans() == []
+        (span,) = second.telemetry.spans()
+        assert span.stage == "run_knowledge_curation_module"
+        assert second.call_stats["run_knowledge_curation_module"]["lm:test-model"]["count"] == 1
+        assert recorder.spans() == []
+
+
+class TestAggregation:
+    def test_percentiles_per_stage(self, recorder):
+        with recording(recorder, "run_a"):
+            for i in range(1, 101):
+                with start_span("lm", "m") as span:
+                    pass
+                span.duration = i / 100
+
+        stats = recorder.summarize("run_a")["lm:m"]
+        assert stats["count"] == 100
+        assert stats["p50"] == pytest.approx(0.50)
+        assert stats["p95"] == pytest.approx(0.95)
+        assert stats["p99"] == pytest.approx(0.99)
+
+    def test_otlp_export_shape(self, recorder):
+        with recording(recorder, "run_a"):
+            _LM().basic_request("hello")
+
+        otlp = recorder.to_otlp()
+        (span,) = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        attributes = {a["key"]: a["value"] for a in span["attributes"]}
+        assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+        assert attributes["storm.prompt_tokens"] == {"intValue": "7"}
+        assert attributes["storm.stage"] == {"stringValue": "run_a"}
+        assert int(span["endTimeUnixNano"]) >= int(span["startTimeUnixNano"])
+
+    def test_json_export_includes_summary(self, recorder, tmp_path):
+        with recording(recorder, "run_a"):
+            _LM().basic_request("hello")
+        path = tmp_path / "telemetry.json"
+        recorder.dump(str(path))
+
+        data = json.loads(path.read_text())
+        assert data["summary"]["run_a"]["lm:test-model"]["count"] == 1
+        assert data["spans"][0]["cache_hit"] is False
@@ -0,0 +1,127 @@
+"""
+Unit tests for token-based prompt budgeting.
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from knowledge_storm import token_budget
+from knowledge_storm.token_budget import (
+    count_tokens,
+    fit_to_budget,
+    get_token_counter,
+    register_tokenizer,
+    resolve_model_name,
+)
+
+
+class _CharTokenizer:
+    """One token per character, to make budgets easy to reason about."""
+
+    def encode(self, text, add_special_tokens=False):
+        return list(text)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry(monkeypatch):
+    monkeypatch.setattr(token_budget, "_registered_tokenizers", {})
+    monkeypatch.setattr(token_budget, "tiktoken", None)
+    get_token_counter.cache_clear()
+    yield
+    get_token_counter.cache_clear()
+
+
+class TestFitToBudget:
+    def test_text_within_budget_is_unchanged(self):
+        text = "line one\n\nline two  "
+        assert fit_to_budget(text, "m", max_tokens=100) == text
+
+    def test_keeps_complete_lines_then_cuts_at_word(self):
+        register_tokenizer("char-model", _CharTokenizer())
+        text = "aaaa\nbbbb\ncc dd ee"
+
+        # 4 + (1 + 4) + (1 + "cc dd" = 5) = 15
+        assert fit_to_budget(text, "char-model", max_tokens=15) == "aaaa\nbbbb\ncc dd"
+
+    def test_result_never_exceeds_budget(self):
+        text = "\n".join(f"sentence number {i} with several words" for i in range(200))
+        trimmed = fit_to_budget(text, None, max_tokens=150)
+
+        assert count_tokens(trimmed) <= 150
+        assert trimmed.startswith("sentence number 0")
+
+    def test_accepts_lm_instance(self):
+        register_tokenizer("char-model", _CharTokenizer())
+        lm = SimpleNamespace(kwargs={"model": "char-model"})
+
+        assert resolve_model_name(lm) == "char-model"
+        assert fit_to_budget("abcdef", lm, max_tokens=3) == ""
+
+
+class TestTokenCounter:
+    def test_counter_is_cached_per_model(self):
+        assert get_token_counter("x") is get_token_counter("x")
+
+    def test_registered_tokenizer_takes_precedence(self):
+        assert get_token_counter("char-model").name == "estimate"
+        register_tokenizer("char-model", _CharTokenizer())
+        assert get_token_counter("char-model").name == "hf:char-model"
+
+    def test_estimate_counts_long_words_as_several_tokens(self):
+        assert count_tokens("a b c") == 3
+        assert count_tokens("internationalization") == 5
+
+
+class _FakeTiktoken:
+    """Stands in for tiktoken; get_encoding can fail or wait for ``ready``."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.ready = threading.Event()
+        self.ready.set()
+        self.model = SimpleNamespace(encoding_name_for_model=self._encoding_name_for_model)
+
+    @staticmethod
+    def _encoding_name_for_model(model):
+        if model.startswith("gpt-4"):
+            return "cl100k_base"
+        raise KeyError(model)
+
+    def get_encoding(self, name):
+        self.ready.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return SimpleNamespace(name=name, encode=lambda text, disallowed_special=(): text.split())
+
+
+class TestTiktokenCounter:
+    @pytest.fixture(autouse=True)
+    def _fresh_loads(self, monkeypatch):
+        monkeypatch.setattr(token_budget, "_tiktoken_loads", {})
+
+    def test_loaded_encoding_is_used(self, monkeypatch):
+        monkeypatch.setattr(token_budget, "tiktoken", _FakeTiktoken())
+
+        assert get_token_counter("gpt-4o").name == "tiktoken:cl100k_base"
+        assert get_token_counter("unknown-model").name == "tiktoken:cl100k_base"
+        assert count_tokens("three short words", "gpt-4o") == 3
+
+    def test_failed_load_falls_back_to_estimate(self, monkeypatch):
+        monkeypatch.setattr(token_budget, "tiktoken", _FakeTiktoken(error=OSError("offline")))
+
+        assert get_token_counter("gpt-4o").name == "estimate"
+
+    def test_slow_load_estimates_until_the_encoding_is_ready(self, monkeypatch):
+        fake = _FakeTiktoken()
+        fake.ready.clear()
+        monkeypatch.setattr(token_budget, "tiktoken", fake)
+        monkeypatch.setattr(token_budget, "TIKTOKEN_LOAD_TIMEOUT", 0.01)
+
+        counter = get_token_counter("gpt-4o")
+        assert counter.count("internationalization") == 5  # Estimate
+
+        fake.ready.set()
+        token_budget._tiktoken_loads["cl100k_base"].result(timeout=5)
+        assert counter.count("internationalization") == 1
@@ -0,0 +1,166 @@
+"""
+Unit tests for checkpointed systematic review runs.
+"""
+
+import pytest
+
+from knowledge_storm.modules.prisma.core import Paper, SearchStrategy
+from knowledge_storm.modules.prisma.paper_store import PaperStore
+from knowledge_storm.workflows import systematic_review
+from knowledge_storm.workflows.review_checkpoint import (
+    SCREENING_FILE, ReviewCheckpoint, strategy_from_dict, strategy_to_dict
+)
+from knowledge_storm.workflows.systematic_review import (
+    ReviewProgress, SystematicReviewConfig, SystematicReviewWorkflow
+)
+
+
+def _strategy():
+    return SearchStrategy(
+        research_question="Does exercise reduce pain?",
+        pico_elements={'population': ['adults']},
+        search_queries={'pubmed': 'exercise AND pain'},
+        inclusion_criteria=['Adults'],
+        exclusion_criteria=['Animal studies'],
+        date_range=(2010, 2020),
+    )
+
+
+def _papers(count):
+    return [
+        Paper(id=f"p{i}", title=f"Randomized trial number {i} of exercise for pain",
+              abstract="A randomized controlled trial of 120 participants with pain.",
+              authors=[], year=2020, journal="J", doi=f"10.1/{i}")
+        for i in range(count)
+    ]
+
+
+class TestReviewCheckpoint:
+    """Test suite for ReviewCheckpoint."""
+
+    def test_manifest_roundtrip(self, tmp_path):
+        checkpoint = ReviewCheckpoint.create(tmp_path, "review_1", {'research_question': "Q"})
+        checkpoint.complete_step('strategy_development', 1.5, {'criteria_count': 3})
+
+        reopened = ReviewCheckpoint.open(tmp_path, "review_1")
+        assert reopened.is_complete('strategy_development')
+        assert not reopened.is_complete('paper_retrieval')
+        assert reopened.step_timings == {'strategy_development': 1.5}
+        assert reopened.load_step('strategy_development') == {'criteria_count': 3}
+        assert reopened.config == {'research_question': "Q"}
+
+    def test_existing_run_is_not_overwritten(self, tmp_path):
+        ReviewCheckpoint.create(tmp_path, "review_1", {})
+        with pytest.raises(FileExistsError):
+            ReviewCheckpoint.create(tmp_path, "review_1", {})
+
+    def test_partial_last_record_is_ignored(self, tmp_path):
+        checkpoint = ReviewCheckpoint.create(tmp_path, "review_1", {})
+        checkpoint.append_records(SCREENING_FILE, [{'paper_id': 'a'}, {'paper_id': 'b'}])
+        with open(checkpoint.run_dir / SCREENING_FILE, 'a') as f:
+            f.write('{"paper_id": "c", "deci')
+
+        assert checkpoint.read_records(SCREENING_FILE) == [{'paper_id': 'a'}, {'paper_id': 'b'}]
+        checkpoint.truncate_records(SCREENING_FILE, 2)
+        checkpoint.append_records(SCREENING_FILE, [{'paper_id': 'c'}])
+        assert [r['paper_id'] for r in checkpoint.read_records(SCREENING_FILE)] == ['a', 'b', 'c']
+
+    def test_papers_and_strategy_roundtrip(self, tmp_path):
+        checkpoint = ReviewCheckpoint.create(tmp_path, "review_1", {})
+        papers = _papers(3)
+        checkpoint.write_papers(papers)
+        assert checkpoint.read_papers() == papers
+        assert strategy_from_dict(strategy_to_dict(_strategy())) == _strategy()
+
+
+class TestResumableReview:
+    """Test suite for SystematicReviewWorkflow checkpointing and resume."""
+
+    @staticmethod
+    def _spy_screening(workflow):
+        chunks = []
+        screen = workflow.agent_coordinator.screen_papers_batch
+
+        async def spy(**kwargs):
+            chunks.append([p.id for p in kwargs['papers']])
+            return await screen(**kwargs)
+
+        workflow.agent_coordinator.screen_papers_batch = spy
+        return chunks
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_steps(self, tmp_path):
+        workflow = SystematicReviewWorkflow(runs_dir=str(tmp_path))
+        chunks = self._spy_screening(workflow)
+        generate_report = workflow._generate_report
+
+        async def fail(*args, **kwargs):
+            raise RuntimeError("report failed")
+
+        workflow._generate_report = fail
+        config = SystematicReviewConfig("Does exercise reduce pain in adults?", date_range=(2010, 2020))
+        failed = await workflow.conduct_systematic_review(config, _papers(5))
+        assert failed['success'] is False
+        assert ReviewCheckpoint.open(tmp_path, failed['review_id']).is_complete('data_extraction')
+
+        workflow._generate_report = generate_report
+        result = await workflow.resume(failed['review_id'])
+
+        assert len(chunks) == 1  # Screening was not repeated
+        assert result['config'] == config
+        assert result['screening']['performance_metrics']['total_papers'] == 5
+        assert set(result['workflow_metrics']['step_timings']) == {
+            'strategy_development', 'paper_retrieval', 'initial_screening',
+            'fulltext_review', 'data_extraction', 'report_generation'
+        }
+
+    @pytest.mark.asyncio
+    async def test_back_to_back_reviews_get_distinct_run_dirs(self, tmp_path):
+        workflow = SystematicReviewWorkflow(runs_dir=str(tmp_path))
+        config = SystematicReviewConfig("Does exercise reduce pain in adults?", date_range=(2010, 2020))
+
+        first = await workflow.conduct_systematic_review(config, _papers(2))
+        second = await workflow.conduct_systematic_review(config, _papers(2))
+
+        assert first['review_id'] != second['review_id']
+        assert first['report']['success'] and second['report']['success']
+        assert ReviewCheckpoint.open(tmp_path, second['review_id']).is_complete('report_generation')
+
+    @pytest.mark.asyncio
+    async def test_screening_resumes_after_saved_decisions(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(systematic_review, 'CHECKPOINT_INTERVAL', 2)
+        workflow = SystematicReviewWorkflow(runs_dir=str(tmp_path))
+        chunks = self._spy_screening(workflow)
+        checkpoint = ReviewCheckpoint.create(tmp_path, "review_1", {})
+        checkpoint.append_records(SCREENING_FILE, [
+            {'paper_id': 'p0', 'decision': 'exclude', 'reason': 'Saved', 'confidence': 0.9},
+            {'paper_id': 'p1', 'decision': 'maybe', 'reason': 'Saved', 'confidence': 0.4},
+        ])
+
+        result = await workflow._screen_papers(
+            _papers(5), _strategy(), SystematicReviewConfig("Q"), ReviewProgress(), checkpoint
+        )
+
+        assert chunks == [['p2', 'p3'], ['p4']]
+        assert [r['paper_id'] for r in checkpoint.read_records(SCREENING_FILE)] == ['p0', 'p1', 'p2', 'p3', 'p4']
+        assert result['exclusion_stats']['Saved'] == 1
+        assert result['performance_metrics']['total_papers'] == 5
+
+
+class TestScreeningStep:
+    """Test suite for the screening step without checkpoints."""
+
+    @pytest.mark.asyncio
+    async def test_unique_papers_are_screened_in_bounded_chunks(self, monkeypatch):
+        monkeypatch.setattr(systematic_review, 'STEP_CHUNK_SIZE', 2)
+        workflow = SystematicReviewWorkflow()
+        chunks = TestResumableReview._spy_screening(workflow)
+        papers = _papers(3)
+        papers.append(Paper(**dict(vars(papers[0]), id="p0-copy")))
+        view = PaperStore.from_papers(papers).view()
+
+        result = await workflow._screen_papers(view, _strategy(), SystematicReviewConfig("Q"), ReviewProgress())
+
+        assert chunks == [['p0', 'p1'], ['p2']]
+        assert result['deduplication']['duplicates_removed'] == 1
+        assert result['performance_metrics']['total_papers'] == 3